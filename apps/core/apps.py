@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.db.models.signals import pre_migrate
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.core'
+
+
+    def ready(self):
+        """
+        Conecta las señales de la aplicación.
+
+        La señal `pre_migrate` se envía por cada aplicación con modelos, por lo
+        que la creación de las extensiones debe ser idempotente.
+        """
+        from .signals import create_database_extensions
+        pre_migrate.connect(create_database_extensions, dispatch_uid='create_database_extensions')
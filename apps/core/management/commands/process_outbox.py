@@ -0,0 +1,87 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from apps.core.models import OutboxEvent
+from apps.core.utils.outbox import get_event_handlers
+
+
+class Command(BaseCommand):
+    help = 'Dispatch the pending outbox events to their handlers'
+    def add_arguments(self, parser):
+        """
+        Agrega los argumentos del comando.
+
+        Args:
+            parser (ArgumentParser): Analizador de argumentos del comando.
+        """
+        parser.add_argument('--batch-size', type=int, default=100, help='Events locked and dispatched per transaction')
+        parser.add_argument('--max-attempts', type=int, default=settings.OUTBOX_MAX_ATTEMPTS, help='Failed attempts before an event is skipped')
+
+
+    def handle(self, *args, **options):
+        """
+        Comando para despachar los eventos pendientes de la tabla outbox.
+
+        Los eventos se recorren por lotes ordenados por ID. Cada lote se
+        bloquea con `SELECT ... FOR UPDATE SKIP LOCKED`, por lo que varios
+        procesos pueden ejecutar el comando a la vez sin despachar dos veces
+        el mismo evento. Un evento cuyo manejador falla conserva el error y
+        se reintenta en la siguiente ejecución hasta agotar los intentos.
+
+        Args:
+            *args (list): Lista de argumentos.
+            **options (dict): Diccionario de opciones.
+
+        Returns:
+            None
+        """
+        last_id = 0
+        processed_count = 0
+        failed_count = 0
+        while True:
+            with transaction.atomic():
+                events = list(
+                    OutboxEvent.objects.select_for_update(skip_locked=True).filter(
+                        processed_at__isnull=True,
+                        attempts__lt=options['max_attempts'],
+                        id__gt=last_id
+                    ).order_by('id')[:options['batch_size']]
+                )
+                if not events:
+                    break
+
+                for event in events:
+                    if self._dispatch(event):
+                        processed_count += 1
+                    else:
+                        failed_count += 1
+
+                OutboxEvent.objects.bulk_update(events, ['processed_at', 'attempts', 'last_error'])
+            last_id = events[-1].id
+
+        self.stdout.write(self.style.SUCCESS(f'{processed_count} events processed, {failed_count} failed.'))
+
+
+    def _dispatch(self, event):
+        """
+        Ejecuta los manejadores de un evento dentro de un punto de guardado,
+        de modo que un manejador que falla no revierte el resto del lote.
+
+        Args:
+            event (OutboxEvent): Evento a despachar.
+
+        Returns:
+            bool: True si todos los manejadores se ejecutaron correctamente.
+        """
+        event.attempts += 1
+        try:
+            with transaction.atomic():
+                for handler in get_event_handlers(event.event_type):
+                    handler(event)
+        except Exception as error:
+            event.last_error = repr(error)
+            return False
+        event.processed_at = timezone.now()
+        event.last_error = ''
+        return True
@@ -0,0 +1,19 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+# Define el modelo de evento de dominio pendiente de publicar
+class OutboxEvent(models.Model):
+    event_type = models.CharField(max_length=100)
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+
+
+    class Meta:
+        indexes = [
+            # Solo indexa los eventos pendientes, que son los que recorre el comando process_outbox
+            models.Index(fields=['id'], condition=models.Q(processed_at__isnull=True), name='outbox_event_pending_idx'),
+        ]
@@ -0,0 +1,40 @@
+from django.db import connections
+
+
+# Sentencias que crean las extensiones y funciones requeridas por los índices
+DATABASE_EXTENSIONS_SQL = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE EXTENSION IF NOT EXISTS unaccent',
+    """
+    CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+    """,
+]
+
+
+def create_database_extensions(sender, using, **kwargs):
+    """
+    Crea las extensiones de PostgreSQL antes de aplicar las migraciones.
+
+    Los índices de trigramas de las ofertas de trabajo y compañias dependen
+    de `pg_trgm` y `unaccent`, que deben existir antes de crear los índices.
+    Todas las sentencias son idempotentes.
+
+    Args:
+        sender (AppConfig): Configuración de la aplicación que envía la señal.
+        using (str): Alias de la base de datos a migrar.
+        **kwargs (dict): Argumentos adicionales de la señal.
+
+    Returns:
+        None
+    """
+    connection = connections[using]
+
+    # Solo aplica para bases de datos PostgreSQL
+    if connection.vendor != 'postgresql':
+        return
+
+    with connection.cursor() as cursor:
+        for sql in DATABASE_EXTENSIONS_SQL:
+            cursor.execute(sql)
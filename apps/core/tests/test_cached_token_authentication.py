@@ -0,0 +1,125 @@
+from datetime import timedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from apps.core.utils.cached_token_authentication import local_token_cache
+from apps.users.models import CustomUser, Company
+
+
+class CachedTokenAuthenticationTestCase(TestCase):
+    """
+    Test case para la autenticación por token con caché y expiración.
+    """
+    def setUp(self):
+        """
+        Configuración inicial de los casos de prueba.
+        """
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(
+            username='TestCompany',
+            first_name='TestFirstName',
+            last_name='TestLastName',
+            user_type='company',
+            email='testcompany@email.com',
+            password='TestPassword'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        Company.objects.create(
+            name='Test Company',
+            industry='Tech',
+            location='Test Location',
+            description='Test Description',
+            user=self.user
+        )
+        self.url = reverse('get_company_data')
+
+
+    def get_token_queries(self):
+        """
+        Realiza una petición autenticada y obtiene las consultas a la tabla de tokens.
+
+        Returns:
+            list: Consultas a la tabla de tokens.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [query for query in queries.captured_queries if Token._meta.db_table in query['sql']]
+
+
+    def test_authentication_uses_cache(self):
+        """
+        Prueba de la caché de los tokens.
+
+        Verifica que solo la primera petición consulte el token en la base
+        de datos, tanto con la caché del proceso como con la caché compartida.
+        """
+        self.assertEqual(len(self.get_token_queries()), 1)
+        self.assertEqual(len(self.get_token_queries()), 0)
+        local_token_cache.clear()
+        self.assertEqual(len(self.get_token_queries()), 0)
+
+
+    def test_authentication_expired_token(self):
+        """
+        Prueba de autenticación con un token expirado.
+
+        Verifica que el endpoint responda con un código de estado 401
+        y que el token expirado se elimine.
+        """
+        Token.objects.filter(key=self.token.key).update(created=self.token.created - timedelta(days=4))
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertFalse(Token.objects.filter(key=self.token.key).exists())
+
+
+    def test_authentication_after_logout(self):
+        """
+        Prueba de autenticación con un token en caché tras cerrar sesión.
+
+        Verifica que el token eliminado al cerrar sesión deje de ser
+        aceptado aunque estuviera en la caché.
+        """
+        self.client.get(self.url, format='json')
+        self.client.post(reverse('logout'), format='json')
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+    def test_authentication_after_update_user(self):
+        """
+        Prueba de autenticación tras actualizar los datos del usuario.
+
+        Verifica que el token anterior deje de ser aceptado y que el
+        nuevo token tenga la expiración configurada.
+        """
+        self.client.get(self.url, format='json')
+        response = self.client.put(reverse('update_user'), {'first_name': 'UpdatedFirstName'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        new_key = response.data['data']['token']['token_key']
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + new_key)
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+    def test_login_replaces_expired_token(self):
+        """
+        Prueba de inicio de sesión con un token expirado.
+
+        Verifica que el inicio de sesión reemplace el token expirado y
+        retorne la expiración del nuevo token.
+        """
+        Token.objects.filter(key=self.token.key).update(created=self.token.created - timedelta(days=4))
+        response = self.client.post(reverse('login'), {'email': 'testcompany@email.com', 'password': 'TestPassword'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        token = Token.objects.get(user=self.user)
+        self.assertNotEqual(token.key, self.token.key)
+        self.assertEqual(response.data['data']['token']['token_key'], token.key)
+        self.assertEqual(response.data['data']['token']['token_expiration'], (token.created + timedelta(days=3)).isoformat())
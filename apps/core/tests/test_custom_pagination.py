@@ -0,0 +1,65 @@
+from django.core.paginator import EmptyPage
+from django.test import TestCase
+from apps.core.utils.custom_pagination import CappedCountPaginator
+from apps.users.models import CustomUser
+
+
+class UnderestimatedCountPaginator(CappedCountPaginator):
+    """
+    Paginador cuya estimación del total es menor que el total real.
+    """
+    def _get_estimated_count(self):
+        """
+        Obtiene una estimación menor que el total real.
+
+        Returns:
+            int: Cantidad de registros estimada.
+        """
+        return 1
+
+
+class CappedCountPaginatorTestCase(TestCase):
+    """
+    Test case para el paginador con el total limitado.
+    """
+    def setUp(self):
+        """
+        Configuración inicial de los casos de prueba.
+        """
+        CustomUser.objects.bulk_create([
+            CustomUser(username=f'TestUser{index}', email=f'testuser{index}@email.com', user_type='student')
+            for index in range(5)
+        ])
+        self.users = CustomUser.objects.order_by('id')
+
+
+    def test_pages_beyond_estimated_count(self):
+        """
+        Prueba de las páginas posteriores a la estimación del total.
+
+        Verifica que las páginas que existen se obtengan aunque superen la
+        estimación y que la página siguiente se determine por los registros.
+        """
+        paginator = UnderestimatedCountPaginator(self.users, 2, count_cap=1)
+        self.assertEqual(paginator.count, 2)
+        self.assertTrue(paginator.count_is_approximate)
+
+        page = paginator.page(2)
+        self.assertEqual(len(page), 2)
+        self.assertTrue(page.has_next())
+        self.assertEqual(page.next_page_number(), 3)
+
+        page = paginator.page(3)
+        self.assertEqual(len(page), 1)
+        self.assertFalse(page.has_next())
+
+
+    def test_page_without_records(self):
+        """
+        Prueba de una página sin registros con el total estimado.
+
+        Verifica que la página posterior a los registros no sea válida.
+        """
+        paginator = UnderestimatedCountPaginator(self.users, 2, count_cap=1)
+        with self.assertRaises(EmptyPage):
+            paginator.page(4)
@@ -0,0 +1,50 @@
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from apps.core.utils.get_principal import get_principal, get_principal_profile
+from apps.users.models import CustomUser, Student
+
+
+class GetPrincipalTestCase(TestCase):
+    """
+    Test case para la carga del usuario autenticado con su perfil.
+    """
+    def setUp(self):
+        """
+        Configuración inicial de los casos de prueba.
+        """
+        self.user = CustomUser.objects.create_user(
+            username='TestStudent',
+            first_name='TestFirstName',
+            last_name='TestLastName',
+            user_type='student',
+            email='teststudent@email.com',
+            password='TestPassword'
+        )
+        self.student = Student.objects.create(
+            university='Test University',
+            degree='Test Degree',
+            major='Test Major',
+            graduation_year=2025,
+            professional_experience='Test Experience',
+            about_me='Test About Me',
+            user=self.user
+        )
+        self.request = Request(APIRequestFactory().get('/'))
+        self.request.user = CustomUser.objects.get(id=self.user.id)
+
+
+    def test_get_principal_single_query(self):
+        """
+        Prueba de la carga del usuario autenticado.
+
+        Verifica que el usuario y su perfil se carguen con una sola consulta
+        por petición y que reemplace al usuario de la petición.
+        """
+        with self.assertNumQueries(1):
+            principal = get_principal(self.request)
+            self.assertIs(get_principal(self.request), principal)
+            self.assertIs(self.request.user, principal)
+            self.assertEqual(self.request.user.student, self.student)
+            self.assertEqual(get_principal_profile(self.request, 'student'), self.student)
+            self.assertIsNone(get_principal_profile(self.request, 'company'))
@@ -0,0 +1,98 @@
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from apps.core.models import OutboxEvent
+from apps.core.utils.outbox import publish_event
+
+
+# Llave de la caché con los eventos recibidos por el manejador de prueba
+HANDLED_EVENTS_KEY = 'test:outbox:handled_events'
+
+
+def record_event(event):
+    """
+    Manejador de prueba que registra los eventos recibidos en la caché,
+    ya que el comando importa el manejador por su ruta.
+
+    Args:
+        event (OutboxEvent): Evento despachado.
+    """
+    cache.set(HANDLED_EVENTS_KEY, cache.get(HANDLED_EVENTS_KEY, []) + [event.payload])
+
+
+def fail_event(event):
+    """
+    Manejador de prueba que siempre falla.
+
+    Args:
+        event (OutboxEvent): Evento despachado.
+
+    Raises:
+        RuntimeError: Siempre.
+    """
+    raise RuntimeError('Handler failed')
+
+
+@override_settings(OUTBOX_EVENT_HANDLERS={
+    'test.recorded': ['apps.core.tests.test_process_outbox.record_event'],
+    'test.failed': ['apps.core.tests.test_process_outbox.fail_event'],
+})
+class ProcessOutboxTestCase(TestCase):
+    """
+    Test case para el comando que despacha los eventos de la tabla outbox.
+    """
+    def setUp(self):
+        """
+        Configuración inicial de los casos de prueba.
+        """
+        cache.delete(HANDLED_EVENTS_KEY)
+
+
+    def test_process_outbox_dispatches_events(self):
+        """
+        Prueba del despacho de los eventos pendientes.
+
+        Verifica que cada evento se entregue a su manejador en orden,
+        quede marcado como procesado y no se despache de nuevo.
+        """
+        for index in range(3):
+            publish_event('test.recorded', {'index': index})
+        out = StringIO()
+        call_command('process_outbox', '--batch-size', '2', stdout=out)
+        self.assertEqual(cache.get(HANDLED_EVENTS_KEY), [{'index': 0}, {'index': 1}, {'index': 2}])
+        self.assertFalse(OutboxEvent.objects.filter(processed_at__isnull=True).exists())
+        self.assertIn('3 events processed', out.getvalue())
+
+        call_command('process_outbox', stdout=StringIO())
+        self.assertEqual(len(cache.get(HANDLED_EVENTS_KEY)), 3)
+
+
+    def test_process_outbox_without_handlers(self):
+        """
+        Prueba del despacho de un evento sin manejadores configurados.
+
+        Verifica que el evento quede marcado como procesado.
+        """
+        publish_event('test.unhandled', {})
+        call_command('process_outbox', stdout=StringIO())
+        self.assertIsNotNone(OutboxEvent.objects.get().processed_at)
+
+
+    def test_process_outbox_failed_handler(self):
+        """
+        Prueba del despacho de un evento cuyo manejador falla.
+
+        Verifica que el error no impida despachar el resto del lote,
+        que el evento conserve el error y que deje de reintentarse
+        al agotar los intentos.
+        """
+        failed = publish_event('test.failed', {})
+        publish_event('test.recorded', {'index': 0})
+        for _ in range(3):
+            call_command('process_outbox', '--max-attempts', '2', stdout=StringIO())
+        failed.refresh_from_db()
+        self.assertIsNone(failed.processed_at)
+        self.assertEqual(failed.attempts, 2)
+        self.assertIn('Handler failed', failed.last_error)
+        self.assertEqual(cache.get(HANDLED_EVENTS_KEY), [{'index': 0}])
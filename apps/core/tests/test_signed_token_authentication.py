@@ -0,0 +1,185 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient, APIRequestFactory
+from apps.core.utils.signed_token_authentication import SignedTokenAuthentication
+from apps.users.models import CustomUser, Company
+
+
+@override_settings(AUTH_TOKEN_MODE='signed')
+class SignedTokenAuthenticationTestCase(TestCase):
+    """
+    Test case para la autenticación con tokens firmados.
+    """
+    def setUp(self):
+        """
+        Configuración inicial de los casos de prueba.
+        """
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(
+            username='TestCompany',
+            first_name='TestFirstName',
+            last_name='TestLastName',
+            user_type='company',
+            email='testcompany@email.com',
+            password='TestPassword'
+        )
+        Company.objects.create(
+            name='Test Company',
+            industry='Tech',
+            location='Test Location',
+            description='Test Description',
+            user=self.user
+        )
+        self.url = reverse('get_company_data')
+
+
+    def login(self):
+        """
+        Inicia sesión y usa el token firmado emitido en las peticiones.
+
+        Returns:
+            str: Token firmado emitido.
+        """
+        response = self.client.post(reverse('login'), {
+            'email': 'testcompany@email.com',
+            'password': 'TestPassword'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        token_key = response.data['data']['token']['token_key']
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token_key)
+        return token_key
+
+
+    def test_login_issues_signed_token(self):
+        """
+        Prueba del inicio de sesión con tokens firmados.
+
+        Verifica que el token emitido esté firmado y que no se guarde en la base de datos.
+        """
+        token_key = self.login()
+        self.assertIn('.', token_key)
+        self.assertFalse(Token.objects.filter(user=self.user).exists())
+
+
+    def test_authentication_without_queries(self):
+        """
+        Prueba de la verificación en memoria de los tokens firmados.
+
+        Verifica que la autenticación no realice consultas una vez que la
+        versión de revocación está en caché y que el usuario tenga su ID y su tipo.
+        """
+        token_key = self.login()
+        request = APIRequestFactory().get(self.url, HTTP_AUTHORIZATION='Token ' + token_key)
+        with self.assertNumQueries(0):
+            user, payload = SignedTokenAuthentication().authenticate(request)
+            self.assertEqual(user.id, self.user.id)
+            self.assertEqual(user.user_type, 'company')
+
+
+    def test_logout_revokes_signed_token(self):
+        """
+        Prueba del cierre de sesión con tokens firmados.
+
+        Verifica que el token firmado sea rechazado con un código de estado
+        401 después de cerrar la sesión.
+        """
+        self.login()
+        response = self.client.post(reverse('logout'), format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data['detail'], 'Token has been revoked.')
+
+
+    def test_update_user_rotates_signed_token(self):
+        """
+        Prueba de la actualización del usuario con tokens firmados.
+
+        Verifica que los datos se actualicen, que el token anterior sea
+        rechazado y que el nuevo token sea válido.
+        """
+        old_token_key = self.login()
+        response = self.client.put(reverse('update_user'), {'first_name': 'NewFirstName'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['user']['first_name'], 'NewFirstName')
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, 'testcompany@email.com')
+        new_token_key = response.data['data']['token']['token_key']
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + old_token_key)
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + new_token_key)
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+    def test_authentication_tampered_token(self):
+        """
+        Prueba de autenticación con un token firmado alterado.
+
+        Verifica que el endpoint responda con un código de estado 401.
+        """
+        token_key = self.login()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token_key[:-1] + ('A' if token_key[-1] != 'A' else 'B'))
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data['detail'], 'Invalid token.')
+
+
+    def test_authentication_expired_token(self):
+        """
+        Prueba de autenticación con un token firmado expirado.
+
+        Verifica que el endpoint responda con un código de estado 401.
+        """
+        self.login()
+        with self.settings(TOKEN_EXPIRATION=-1):
+            response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data['detail'], 'Token has expired.')
+
+
+    def test_authentication_inactive_user(self):
+        """
+        Prueba de autenticación con el token firmado de un usuario desactivado.
+
+        Verifica que el endpoint responda con un código de estado 401
+        aunque el estado del usuario ya estuviera en la caché.
+        """
+        self.login()
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data['detail'], 'User inactive or deleted.')
+
+
+    def test_authentication_deleted_user(self):
+        """
+        Prueba de autenticación con el token firmado de un usuario eliminado.
+
+        Verifica que el endpoint responda con un código de estado 401.
+        """
+        self.login()
+        self.client.get(self.url, format='json')
+        self.user.delete()
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data['detail'], 'User inactive or deleted.')
+
+
+    def test_database_tokens_still_accepted(self):
+        """
+        Prueba de compatibilidad con los tokens de la base de datos.
+
+        Verifica que los tokens guardados en la base de datos sigan siendo válidos.
+        """
+        token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
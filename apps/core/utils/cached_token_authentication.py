@@ -0,0 +1,199 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+
+def get_token_expiration(token):
+    """
+    Obtiene la fecha de expiración de un token a partir de su fecha de creación.
+
+    Args:
+        token (Token): Token del usuario.
+
+    Returns:
+        datetime: Fecha de expiración del token.
+    """
+    return token.created + timedelta(seconds=settings.TOKEN_EXPIRATION)
+
+
+def get_token_cache_key(key):
+    """
+    Obtiene la llave de la caché compartida de un token.
+
+    Args:
+        key (str): Llave del token.
+
+    Returns:
+        str: Llave de la caché.
+    """
+    return f'auth:token:{key}'
+
+
+class LocalTokenCache:
+    """
+    Caché LRU de tokens en la memoria del proceso.
+
+    Las entradas expiran tras `TOKEN_LOCAL_CACHE_TIMEOUT` segundos, que es
+    el tiempo máximo que otro proceso puede seguir aceptando un token
+    invalidado. Los tokens se guardan serializados para que cada petición
+    reciba su propia instancia del usuario.
+    """
+    def __init__(self):
+        """
+        Inicializa la caché vacía.
+        """
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+
+    def get(self, key):
+        """
+        Obtiene un token de la caché si no ha expirado.
+
+        Args:
+            key (str): Llave del token.
+
+        Returns:
+            Token: Token con su usuario, o None si no se encuentra.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+        return pickle.loads(data)
+
+
+    def set(self, key, token):
+        """
+        Guarda un token en la caché, descartando el menos usado si está llena.
+
+        Args:
+            key (str): Llave del token.
+            token (Token): Token con su usuario.
+        """
+        data = pickle.dumps(token)
+        with self.lock:
+            self.entries[key] = (time.monotonic() + settings.TOKEN_LOCAL_CACHE_TIMEOUT, data)
+            self.entries.move_to_end(key)
+            while len(self.entries) > settings.TOKEN_LOCAL_CACHE_SIZE:
+                self.entries.popitem(last=False)
+
+
+    def delete(self, key):
+        """
+        Elimina un token de la caché.
+
+        Args:
+            key (str): Llave del token.
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+
+
+    def clear(self):
+        """
+        Elimina todos los tokens de la caché.
+        """
+        with self.lock:
+            self.entries.clear()
+
+
+# Caché de tokens del proceso
+local_token_cache = LocalTokenCache()
+
+
+def invalidate_cached_token(key):
+    """
+    Elimina un token de la caché del proceso y de la caché compartida.
+
+    Debe llamarse al eliminar o reemplazar el token de un usuario y al
+    modificar o eliminar el usuario.
+
+    Args:
+        key (str): Llave del token.
+
+    Returns:
+        None
+    """
+    local_token_cache.delete(key)
+    cache.delete(get_token_cache_key(key))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Autenticación por token que resuelve la llave con una caché de dos
+    niveles (LRU del proceso y caché compartida) antes de consultar la base
+    de datos, y que rechaza los tokens con más de `TOKEN_EXPIRATION` segundos.
+    """
+    def authenticate_credentials(self, key):
+        """
+        Obtiene el usuario y el token que corresponden a la llave.
+
+        Args:
+            key (str): Llave del token enviada en la petición.
+
+        Returns:
+            tuple: Usuario y token autenticados.
+
+        Raises:
+            AuthenticationFailed: Si el token no existe, expiró o el usuario está inactivo.
+        """
+        # Busca el token en la caché del proceso y luego en la caché compartida
+        token = local_token_cache.get(key)
+        if token is None:
+            token = cache.get(get_token_cache_key(key))
+            if token is None:
+                token = self._get_token(key)
+            local_token_cache.set(key, token)
+
+        # Rechaza el token si ya expiró, aunque siga en la caché
+        if timezone.now() >= get_token_expiration(token):
+            invalidate_cached_token(key)
+            raise exceptions.AuthenticationFailed('Token has expired.')
+
+        return (token.user, token)
+
+
+    def _get_token(self, key):
+        """
+        Obtiene el token y su usuario de la base de datos y los guarda en la
+        caché compartida hasta la expiración del token.
+
+        Args:
+            key (str): Llave del token.
+
+        Returns:
+            Token: Token con su usuario.
+
+        Raises:
+            AuthenticationFailed: Si el token no existe, expiró o el usuario está inactivo.
+        """
+        model = self.get_model()
+        try:
+            token = model.objects.select_related('user').get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed('Invalid token.')
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+
+        # Elimina el token expirado para que el usuario deba iniciar sesión de nuevo
+        remaining = (get_token_expiration(token) - timezone.now()).total_seconds()
+        if remaining <= 0:
+            token.delete()
+            raise exceptions.AuthenticationFailed('Token has expired.')
+
+        cache.set(get_token_cache_key(key), token, min(int(remaining), settings.TOKEN_CACHE_TIMEOUT))
+        return token
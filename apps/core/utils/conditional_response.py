@@ -0,0 +1,60 @@
+import hashlib
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+def build_etag(*values):
+    """
+    Construye un ETag fuerte a partir de los valores que identifican la versión de un recurso.
+
+    Args:
+        *values (list): Valores que cambian cuando el recurso se modifica.
+
+    Returns:
+        str: ETag entre comillas.
+    """
+    fingerprint = '|'.join('' if value is None else str(value) for value in values)
+    return quote_etag(hashlib.md5(fingerprint.encode('utf-8')).hexdigest())
+
+
+def set_conditional_headers(response, etag, last_modified=None):
+    """
+    Agrega a la respuesta los encabezados `ETag` y `Last-Modified` y obliga
+    al cliente a revalidar su copia antes de reutilizarla.
+
+    Args:
+        response (HttpResponse): Respuesta a la que se agregan los encabezados.
+        etag (str): ETag del recurso.
+        last_modified (datetime): Fecha de la última modificación del recurso, opcional.
+
+    Returns:
+        HttpResponse: Respuesta con los encabezados agregados.
+    """
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def conditional_response(request, etag, last_modified=None):
+    """
+    Valida los encabezados `If-None-Match` e `If-Modified-Since` de la petición.
+
+    Debe llamarse antes de serializar el recurso para que una copia vigente
+    del cliente no requiera construir la respuesta completa.
+
+    Args:
+        request (Request): Petición del cliente.
+        etag (str): ETag actual del recurso.
+        last_modified (datetime): Fecha de la última modificación del recurso, opcional.
+
+    Returns:
+        HttpResponse: Respuesta 304 si la copia del cliente está vigente (o 412 si no se cumple
+        `If-Match`), None en caso contrario.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified is not None else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_conditional_headers(response, etag, last_modified)
+    return response
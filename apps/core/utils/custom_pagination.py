@@ -1,19 +1,203 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from functools import cached_property, partial
+from uuid import UUID
+from django.conf import settings
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CappedCountPage(Page):
+    """
+    Página de `CappedCountPaginator` que, cuando el total es estimado,
+    determina si hay una página siguiente a partir de los registros obtenidos.
+    """
+    has_more = None
+
+
+    def has_next(self):
+        """
+        Indica si existe una página siguiente.
+
+        Returns:
+            bool: True si existe una página siguiente.
+        """
+        if self.has_more is not None:
+            return self.has_more
+        return super().has_next()
+
+
+class CappedCountPaginator(Paginator):
+    """
+    Paginador que cuenta con exactitud solo hasta un límite de registros.
+
+    Por encima del límite el total se estima con las estadísticas del
+    planificador de PostgreSQL en lugar de ejecutar un `COUNT(*)` sobre
+    todos los registros filtrados. La estimación solo se muestra como
+    total: los números de página no se validan contra ella y la existencia
+    de la página siguiente se determina obteniendo un registro adicional.
+    """
+    def __init__(self, object_list, per_page, count_cap=None, exact_count=False, **kwargs):
+        """
+        Inicializa el paginador.
+
+        Args:
+            object_list (QuerySet): Queryset a paginar.
+            per_page (int): Cantidad de registros por página.
+            count_cap (int): Cantidad máxima de registros a contar, opcional.
+            exact_count (bool): Indica si el total se debe contar con exactitud, opcional.
+        """
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_cap = settings.PAGINATION_COUNT_CAP if count_cap is None else count_cap
+        self.exact_count = exact_count
+        self.count_is_approximate = False
+
+
+    @cached_property
+    def count(self):
+        """
+        Obtiene el total de registros, exacto hasta el límite y estimado por encima de él.
+
+        Returns:
+            int: Total de registros.
+        """
+        if self.exact_count or not hasattr(self.object_list, 'query'):
+            return super().count
+
+        # Cuenta como máximo un registro más que el límite
+        capped_count = self.object_list[:self.count_cap + 1].count()
+        if capped_count <= self.count_cap:
+            return capped_count
+
+        # Estima el total sin recorrer todos los registros
+        self.count_is_approximate = True
+        return max(self._get_estimated_count(), capped_count)
+
+
+    def validate_number(self, number):
+        """
+        Valida el número de página, sin límite superior si el total es estimado.
+
+        Args:
+            number (int | str): Número de página solicitado.
+
+        Returns:
+            int: Número de página validado.
+
+        Raises:
+            PageNotAnInteger: Si el número de página no es un entero.
+            EmptyPage: Si el número de página es menor que 1 o mayor que el total de páginas exacto.
+        """
+        # Calcula el total para saber si es estimado
+        self.count
+        if not self.count_is_approximate:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+        return number
+
+
+    def page(self, number):
+        """
+        Obtiene una página de registros.
+
+        Si el total es estimado se obtiene un registro más que el tamaño de
+        la página para saber si existe la página siguiente.
+
+        Args:
+            number (int | str): Número de página solicitado.
+
+        Returns:
+            CappedCountPage: Página de registros.
+
+        Raises:
+            EmptyPage: Si la página solicitada no tiene registros.
+        """
+        number = self.validate_number(number)
+        if not self.count_is_approximate:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not object_list and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+        page = self._get_page(object_list[:self.per_page], number, self)
+        page.has_more = len(object_list) > self.per_page
+        return page
+
+
+    def _get_page(self, *args, **kwargs):
+        """
+        Crea las páginas del paginador.
+
+        Returns:
+            CappedCountPage: Página de registros.
+        """
+        return CappedCountPage(*args, **kwargs)
+
+
+    def _get_estimated_count(self):
+        """
+        Obtiene la cantidad de registros estimada por el planificador de la base de datos.
+
+        Returns:
+            int: Cantidad de registros estimada.
+        """
+        sql, params = self.object_list.query.sql_with_params()
+        with connections[self.object_list.db].cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
 
 
 class CustomPageNumberPagination(PageNumberPagination):
     """
     Paginación personalizada que permite al cliente especificar el tamaño de la página
     mediante el parámetro de consulta `page_size`. El tamaño máximo de la página es 100.
+
+    El total de registros es exacto hasta `PAGINATION_COUNT_CAP` y estimado por
+    encima de ese límite, salvo que el cliente envíe `exact_count=true`.
     """
     page_size_query_param = 'page_size'
     max_page_size = 100
+    exact_count_query_param = 'exact_count'
+
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Pagina el queryset indicando al paginador si el total debe ser exacto.
+
+        Args:
+            queryset (QuerySet): Queryset a paginar.
+            request (Request): Petición del cliente.
+            view (View): Vista que realiza la paginación, opcional.
+
+        Returns:
+            list: Registros de la página solicitada.
+        """
+        exact_count = request.query_params.get(self.exact_count_query_param, '').lower() in ('true', '1')
+        self.django_paginator_class = partial(CappedCountPaginator, exact_count=exact_count)
+        return super().paginate_queryset(queryset, request, view)
 
 
     def get_paginated_response(self, data):
         """
         Retorna una respuesta paginada con los enlaces de la siguiente y anterior página,
-        el número total de elementos, el tamaño de la página y los resultados.
+        el número total de elementos, si ese número es aproximado, el tamaño de la
+        página y los resultados.
 
         Args:
             data (list): Lista de datos paginados.
@@ -27,6 +211,286 @@ class CustomPageNumberPagination(PageNumberPagination):
                 'previous': self.get_previous_link()
             },
             'count': self.page.paginator.count,
+            'count_is_approximate': self.page.paginator.count_is_approximate,
             'page_size': self.page_size,
             'results': data
         }
+
+
+class CustomCursorPagination(CursorPagination):
+    """
+    Paginación por cursor (keyset) sobre una tupla de campos indexados.
+
+    A diferencia de la paginación por número de página no ejecuta un `COUNT(*)`
+    ni un `OFFSET`: cada página filtra a partir de los valores del último
+    registro de la página anterior, por lo que la página N cuesta lo mismo que
+    la primera y no se desplaza cuando se insertan registros nuevos.
+
+    El último campo de `ordering` debe ser único (por ejemplo, la llave primaria)
+    para que la tupla identifique a un único registro.
+    """
+    ordering = ('-created_at', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+    def __init__(self, ordering=None):
+        """
+        Inicializa la paginación con un ordenamiento opcional.
+
+        Args:
+            ordering (tuple): Campos del ordenamiento, opcional.
+        """
+        if ordering is not None:
+            self.ordering = tuple(ordering)
+
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Pagina el queryset a partir del cursor enviado en la petición.
+
+        Args:
+            queryset (QuerySet): Queryset a paginar.
+            request (Request): Petición del cliente.
+            view (View): Vista que realiza la paginación, opcional.
+
+        Returns:
+            list: Registros de la página solicitada.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.model = queryset.model
+        self.cursor = self.decode_cursor(request)
+
+        # Obtiene la posición y la dirección del cursor
+        if self.cursor is None:
+            position, reverse = None, False
+        else:
+            position, reverse = self.cursor
+
+        # Los cursores hacia atrás recorren el ordenamiento invertido
+        ordering = self._reverse_ordering() if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+
+        # Filtra los registros posteriores a la posición del cursor
+        if position is not None:
+            queryset = queryset.filter(self._get_keyset_filter(ordering, position))
+
+        # Obtiene un registro adicional para saber si hay más páginas
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        return self.page
+
+
+    def get_paginated_response(self, data):
+        """
+        Retorna una respuesta paginada con los enlaces y cursores opacos de la
+        siguiente y anterior página, el tamaño de la página y los resultados.
+
+        La paginación por cursor no calcula el total de registros, por lo que
+        `count` siempre es None.
+
+        Args:
+            data (list): Lista de datos paginados.
+
+        Returns:
+            dict: Diccionario con la respuesta paginada.
+        """
+        return {
+            'links': {
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link()
+            },
+            'cursors': {
+                'next': self.get_next_cursor(),
+                'previous': self.get_previous_cursor()
+            },
+            'count': None,
+            'page_size': self.page_size,
+            'results': data
+        }
+
+
+    def get_next_cursor(self):
+        """
+        Retorna el cursor opaco de la siguiente página.
+
+        Returns:
+            str: Cursor de la siguiente página o None si no existe.
+        """
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_position(self._get_position(self.page[-1]), reverse=False)
+
+
+    def get_previous_cursor(self):
+        """
+        Retorna el cursor opaco de la página anterior.
+
+        Returns:
+            str: Cursor de la página anterior o None si no existe.
+        """
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_position(self._get_position(self.page[0]), reverse=True)
+
+
+    def get_next_link(self):
+        """
+        Retorna el enlace de la siguiente página.
+
+        Returns:
+            str: URL de la siguiente página o None si no existe.
+        """
+        cursor = self.get_next_cursor()
+        if cursor is None:
+            return None
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+
+    def get_previous_link(self):
+        """
+        Retorna el enlace de la página anterior.
+
+        Returns:
+            str: URL de la página anterior o None si no existe.
+        """
+        if not self.has_previous:
+            return None
+        cursor = self.get_previous_cursor()
+        if cursor is None:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+
+    def encode_position(self, position, reverse):
+        """
+        Codifica la posición de un registro en un cursor opaco.
+
+        Args:
+            position (tuple): Valores de los campos del ordenamiento.
+            reverse (bool): Indica si el cursor recorre la página anterior.
+
+        Returns:
+            str: Cursor codificado en base64.
+        """
+        values = [value.isoformat() if isinstance(value, datetime) else str(value) for value in position]
+        payload = json.dumps({'p': values, 'r': int(reverse)}, separators=(',', ':'))
+        return urlsafe_b64encode(payload.encode('ascii')).decode('ascii').rstrip('=')
+
+
+    def decode_cursor(self, request):
+        """
+        Decodifica el cursor enviado en la petición.
+
+        Args:
+            request (Request): Petición del cliente.
+
+        Returns:
+            tuple: Posición y dirección del cursor o None si es la primera página.
+
+        Raises:
+            NotFound: Si el cursor no es válido.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            padding = '=' * (-len(encoded) % 4)
+            payload = json.loads(urlsafe_b64decode(encoded + padding).decode('ascii'))
+            values = payload['p']
+            if len(values) != len(self.ordering):
+                raise ValueError
+            position = tuple(
+                self._parse_value(field.lstrip('-'), value)
+                for field, value in zip(self.ordering, values)
+            )
+            return position, bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError, AttributeError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+    def _parse_value(self, field_name, value):
+        """
+        Convierte el valor de un campo del cursor a su tipo en el modelo.
+
+        Args:
+            field_name (str): Nombre del campo del ordenamiento.
+            value (str): Valor serializado del campo.
+
+        Returns:
+            object: Valor convertido.
+        """
+        field = self.model._meta.get_field(field_name)
+        internal_type = field.get_internal_type()
+        if internal_type == 'DateTimeField':
+            return datetime.fromisoformat(value)
+        if internal_type == 'UUIDField':
+            return UUID(value)
+        return field.to_python(value)
+
+
+    def _get_position(self, instance):
+        """
+        Obtiene los valores de los campos del ordenamiento de un registro.
+
+        Args:
+            instance (Model | dict): Registro de la página.
+
+        Returns:
+            tuple: Valores de los campos del ordenamiento.
+        """
+        fields = [field.lstrip('-') for field in self.ordering]
+        if isinstance(instance, dict):
+            return tuple(instance[field] for field in fields)
+        return tuple(getattr(instance, field) for field in fields)
+
+
+    def _reverse_ordering(self):
+        """
+        Invierte la dirección de cada campo del ordenamiento.
+
+        Returns:
+            tuple: Ordenamiento invertido.
+        """
+        return tuple(field[1:] if field.startswith('-') else '-' + field for field in self.ordering)
+
+
+    def _get_keyset_filter(self, ordering, position):
+        """
+        Construye el filtro que selecciona los registros posteriores a la
+        posición del cursor según el ordenamiento.
+
+        El primer campo se acota con una comparación inclusiva para que la
+        base de datos pueda recorrer el índice como un rango.
+
+        Args:
+            ordering (tuple): Ordenamiento aplicado al queryset.
+            position (tuple): Valores de los campos del ordenamiento.
+
+        Returns:
+            Q: Filtro de la paginación por cursor.
+        """
+        conditions = Q()
+        equal = {}
+        for field, value in zip(ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            conditions |= Q(**equal, **{f'{name}__{lookup}': value})
+            equal[name] = value
+
+        first = ordering[0]
+        range_lookup = 'lte' if first.startswith('-') else 'gte'
+        return Q(**{f'{first.lstrip("-")}__{range_lookup}': position[0]}) & conditions
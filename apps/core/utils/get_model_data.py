@@ -1,3 +1,4 @@
+from django.db.models import QuerySet
 from rest_framework.response import Response
 from rest_framework import status
 
@@ -6,7 +7,7 @@ def get_model_data(model, field_name, field_value):
     Obtiene los datos de un modelo basado en un campo y su valor.
 
     Args:
-        model (Model): Modelo a consultar.
+        model (Model | QuerySet): Modelo o queryset a consultar.
         field_name (str): Nombre del campo del modelo.
         field_value (str): Valor de búsqueda para el campo.
     
@@ -14,11 +15,14 @@ def get_model_data(model, field_name, field_value):
         data (Model): Datos del modelo si se encuentra.
         Response: Respuesta de error si no se encuentra el registro.
     """
+    # Obtiene el queryset base si se recibió el modelo
+    queryset = model if isinstance(model, QuerySet) else model.objects.all()
+
     try:
         # Busca en el modelo el registro que coincide con el campo y valor proporcionados
-        data = model.objects.get(**{field_name: field_value})
+        data = queryset.get(**{field_name: field_value})
         return data
-    except model.DoesNotExist:
+    except queryset.model.DoesNotExist:
         # Retorna una respuesta de error si no se encuentra el registro
         return Response({
             'status': 'error',
@@ -0,0 +1,38 @@
+from django.contrib.auth import get_user_model
+
+
+def get_principal(request):
+    """
+    Obtiene el usuario autenticado junto con su perfil de estudiante o de
+    compañia en una sola consulta, que se realiza una vez por petición.
+
+    El usuario cargado reemplaza a `request.user`, por lo que los accesos
+    posteriores a `request.user.student` o `request.user.company` en las
+    vistas y serializadores no realizan consultas adicionales.
+
+    Args:
+        request (Request): Petición autenticada.
+
+    Returns:
+        CustomUser: Usuario autenticado con su perfil cargado.
+    """
+    principal = getattr(request, '_principal', None)
+    if principal is None:
+        principal = get_user_model().objects.select_related('student', 'company').get(id=request.user.id)
+        request._principal = principal
+        request.user = principal
+    return principal
+
+
+def get_principal_profile(request, type_user):
+    """
+    Obtiene el perfil del usuario autenticado.
+
+    Args:
+        request (Request): Petición autenticada.
+        type_user (str): Tipo de perfil ('student' o 'company').
+
+    Returns:
+        Model: Perfil del usuario, o None si no tiene un perfil creado.
+    """
+    return getattr(get_principal(request), type_user, None)
@@ -0,0 +1,29 @@
+from django.db.models import Func, TextField
+from django.db.models.functions import Lower
+
+
+class ImmutableUnaccent(Func):
+    """
+    Expresión que elimina los acentos de un texto con la función
+    `immutable_unaccent` de la base de datos.
+
+    La función `unaccent` de PostgreSQL no es inmutable, por lo que no se
+    puede usar en índices; `immutable_unaccent` la envuelve con un diccionario
+    fijo para que los índices de expresiones puedan usarla.
+    """
+    function = 'immutable_unaccent'
+    output_field = TextField()
+
+
+def normalize_text(expression):
+    """
+    Normaliza un texto en minúsculas y sin acentos para las búsquedas
+    insensibles a mayúsculas y acentos.
+
+    Args:
+        expression (Expression | str): Expresión o nombre del campo a normalizar.
+
+    Returns:
+        Lower: Expresión con el texto normalizado.
+    """
+    return Lower(ImmutableUnaccent(expression))
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.utils.module_loading import import_string
+from apps.core.models import OutboxEvent
+
+
+def publish_event(event_type, payload):
+    """
+    Registra un evento de dominio en la tabla outbox.
+
+    Debe llamarse dentro de la misma transacción que la modificación que
+    origina el evento, de modo que el evento solo se publica si la
+    modificación se confirma.
+
+    Args:
+        event_type (str): Tipo del evento, por ejemplo 'postulation.created'.
+        payload (dict): Datos del evento.
+
+    Returns:
+        OutboxEvent: Evento registrado.
+    """
+    return OutboxEvent.objects.create(event_type=event_type, payload=payload)
+
+
+def publish_events(event_type, payloads):
+    """
+    Registra varios eventos de dominio del mismo tipo con una sola sentencia.
+
+    Args:
+        event_type (str): Tipo de los eventos.
+        payloads (list): Datos de cada evento.
+
+    Returns:
+        list: Eventos registrados.
+    """
+    return OutboxEvent.objects.bulk_create([
+        OutboxEvent(event_type=event_type, payload=payload)
+        for payload in payloads
+    ])
+
+
+def get_event_handlers(event_type):
+    """
+    Obtiene los manejadores configurados en `OUTBOX_EVENT_HANDLERS` para un
+    tipo de evento.
+
+    Args:
+        event_type (str): Tipo del evento.
+
+    Returns:
+        list: Funciones que reciben el evento.
+    """
+    return [import_string(path) for path in settings.OUTBOX_EVENT_HANDLERS.get(event_type, [])]
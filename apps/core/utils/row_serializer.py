@@ -0,0 +1,168 @@
+from functools import cached_property
+from rest_framework import serializers
+
+
+# Campos cuyo valor en la base de datos ya es su representación
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.ChoiceField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+# Campos cuya representación se obtiene con el método del campo
+CONVERTED_FIELDS = (
+    serializers.DecimalField,
+    serializers.DateTimeField,
+    serializers.DateField,
+    serializers.FloatField,
+)
+
+
+class RowSerializer:
+    """
+    Serializador de solo lectura que construye la misma representación que
+    un `ModelSerializer` a partir de las filas de `QuerySet.values()`.
+
+    Los convertidores de cada campo se compilan una sola vez a partir de los
+    campos del serializador, por lo que serializar una página no instancia
+    modelos ni serializadores por cada registro.
+    """
+    def __init__(self, serializer_class):
+        """
+        Inicializa el serializador de filas.
+
+        Args:
+            serializer_class (ModelSerializer): Serializador con la representación a replicar.
+        """
+        self.serializer_class = serializer_class
+
+
+    @cached_property
+    def fields(self):
+        """
+        Compila los campos del serializador.
+
+        Returns:
+            list: Tuplas con el nombre, la columna, el convertidor y los campos anidados.
+        """
+        return self._compile_fields(self.serializer_class(), prefix='')
+
+
+    @cached_property
+    def columns(self):
+        """
+        Obtiene las columnas que se deben consultar en la base de datos.
+
+        Returns:
+            list: Columnas en el formato de `QuerySet.values()`.
+        """
+        return self._get_columns(self.fields)
+
+
+    def get_values(self, queryset):
+        """
+        Obtiene las filas del queryset con las columnas requeridas.
+
+        Args:
+            queryset (QuerySet): Queryset a consultar.
+
+        Returns:
+            QuerySet: Queryset de diccionarios con las columnas requeridas.
+        """
+        return queryset.values(*self.columns)
+
+
+    def to_representation(self, rows):
+        """
+        Serializa las filas obtenidas con `get_values`.
+
+        Args:
+            rows (list): Filas a serializar.
+
+        Returns:
+            list: Datos serializados de las filas.
+        """
+        fields = self.fields
+        return [self._build(row, fields) for row in rows]
+
+
+    def _build(self, row, fields):
+        """
+        Construye la representación de una fila.
+
+        Args:
+            row (dict): Fila obtenida de la base de datos.
+            fields (list): Campos compilados.
+
+        Returns:
+            dict: Representación de la fila.
+        """
+        data = {}
+        for name, column, converter, nested in fields:
+            value = row[column]
+            if value is None:
+                data[name] = None
+            elif nested is not None:
+                data[name] = self._build(row, nested)
+            elif converter is None:
+                data[name] = value
+            else:
+                data[name] = converter(value)
+        return data
+
+
+    def _compile_fields(self, serializer, prefix):
+        """
+        Compila los campos legibles de un serializador.
+
+        Args:
+            serializer (ModelSerializer): Serializador a compilar.
+            prefix (str): Prefijo de las columnas de un serializador anidado.
+
+        Returns:
+            list: Tuplas con el nombre, la columna, el convertidor y los campos anidados.
+
+        Raises:
+            TypeError: Si el serializador tiene campos que no se pueden compilar.
+        """
+        fields = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            column = prefix + field.source.replace('.', '__')
+
+            # Los serializadores anidados se leen con el prefijo de la relación
+            if isinstance(field, serializers.ModelSerializer):
+                nested = self._compile_fields(field, prefix=column + '__')
+                pk_name = field.Meta.model._meta.pk.name
+                fields.append((name, f'{column}__{pk_name}', None, nested))
+            elif isinstance(field, serializers.UUIDField):
+                fields.append((name, column, str, None))
+            elif isinstance(field, CONVERTED_FIELDS):
+                fields.append((name, column, field.to_representation, None))
+            elif isinstance(field, IDENTITY_FIELDS):
+                fields.append((name, column, None, None))
+            else:
+                raise TypeError(f'Field "{name}" of type {type(field).__name__} is not supported.')
+        return fields
+
+
+    def _get_columns(self, fields):
+        """
+        Obtiene las columnas de los campos compilados.
+
+        Args:
+            fields (list): Campos compilados.
+
+        Returns:
+            list: Columnas en el formato de `QuerySet.values()`.
+        """
+        columns = []
+        for _, column, _, nested in fields:
+            if column not in columns:
+                columns.append(column)
+            if nested is not None:
+                columns.extend(c for c in self._get_columns(nested) if c not in columns)
+        return columns
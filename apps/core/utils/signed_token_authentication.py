@@ -0,0 +1,147 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+
+def get_token_serializer():
+    """
+    Obtiene el serializador que firma los tokens con la llave secreta del proyecto.
+
+    Returns:
+        URLSafeTimedSerializer: Serializador de los tokens firmados.
+    """
+    return URLSafeTimedSerializer(settings.SECRET_KEY, salt='apps.core.signed-token')
+
+
+def get_token_state_cache_key(user_id):
+    """
+    Obtiene la llave de la caché del estado de los tokens de un usuario.
+
+    Args:
+        user_id (int): ID del usuario.
+
+    Returns:
+        str: Llave de la caché.
+    """
+    return f'auth:token_state:{user_id}'
+
+
+def get_token_state(user_id):
+    """
+    Obtiene la versión de revocación de los tokens de un usuario y si está
+    activo desde la caché, consultando ambos valores con una sola consulta
+    y guardando el resultado si no existe.
+
+    Args:
+        user_id (int): ID del usuario.
+
+    Returns:
+        tuple: Versión de revocación y si el usuario está activo, o None si el usuario no existe.
+    """
+    cache_key = get_token_state_cache_key(user_id)
+    token_state = cache.get(cache_key)
+    if token_state is None:
+        token_state = get_user_model().objects.filter(id=user_id).values_list('token_version', 'is_active').first()
+        if token_state is not None:
+            cache.set(cache_key, token_state, settings.TOKEN_CACHE_TIMEOUT)
+    return token_state
+
+
+def invalidate_token_state(user_id):
+    """
+    Elimina de la caché el estado de los tokens de un usuario.
+
+    Args:
+        user_id (int): ID del usuario.
+
+    Returns:
+        None
+    """
+    cache.delete(get_token_state_cache_key(user_id))
+
+
+def sign_user_token(user):
+    """
+    Emite un token firmado con la fecha actual que contiene el ID, el tipo y
+    la versión de revocación de los tokens del usuario.
+
+    Args:
+        user (CustomUser): Usuario autenticado.
+
+    Returns:
+        str: Token firmado.
+    """
+    return get_token_serializer().dumps({
+        'id': user.id,
+        'type': user.user_type,
+        'version': get_token_state(user.id)[0],
+    })
+
+
+def revoke_signed_tokens(user_id):
+    """
+    Revoca todos los tokens firmados emitidos a un usuario incrementando su
+    versión de revocación.
+
+    Args:
+        user_id (int): ID del usuario.
+
+    Returns:
+        None
+    """
+    get_user_model().objects.filter(id=user_id).update(token_version=F('token_version') + 1)
+    invalidate_token_state(user_id)
+
+
+class SignedTokenAuthentication(TokenAuthentication):
+    """
+    Autenticación con tokens firmados que se verifican en memoria.
+
+    Usa el mismo encabezado `Authorization: Token <token>` que los tokens de
+    la base de datos; las llaves que no tienen el formato de un token firmado
+    se dejan a la siguiente clase de autenticación. Solo se consultan la
+    versión de revocación y el estado activo del usuario, que se mantienen
+    en la caché.
+
+    El usuario autenticado solo tiene cargados su ID y su tipo, el resto de
+    sus campos se obtienen de la base de datos al usarlos.
+    """
+    def authenticate_credentials(self, key):
+        """
+        Verifica la firma, la expiración y la versión de revocación del token
+        y que su usuario exista y esté activo.
+
+        Args:
+            key (str): Token enviado en la petición.
+
+        Returns:
+            tuple: Usuario y datos del token, o None si la llave no es un token firmado.
+
+        Raises:
+            AuthenticationFailed: Si el token es inválido, expiró o fue revocado, o si el usuario está inactivo o no existe.
+        """
+        # Las llaves de los tokens de la base de datos no tienen separadores
+        if '.' not in key:
+            return None
+
+        try:
+            payload = get_token_serializer().loads(key, max_age=settings.TOKEN_EXPIRATION)
+        except SignatureExpired:
+            raise exceptions.AuthenticationFailed('Token has expired.')
+        except BadSignature:
+            raise exceptions.AuthenticationFailed('Invalid token.')
+
+        # Rechaza el token si el usuario fue eliminado, está inactivo o revocó sus tokens
+        token_state = get_token_state(payload['id'])
+        if token_state is None or not token_state[1]:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+        if token_state[0] != payload['version']:
+            raise exceptions.AuthenticationFailed('Token has been revoked.')
+
+        # Construye el usuario sin consultarlo, con el resto de sus campos diferidos
+        user = get_user_model().from_db('default', ['id', 'user_type'], [payload['id'], payload['type']])
+        return (user, payload)
@@ -14,8 +14,8 @@ def validate_user_is_creator(element, user):
         Response: Respuesta de error si el usuario no es el creador.
         None: Si el usuario es el creador.
     """
-    # Verifica que el usuario sea el creador
-    if element.user != user:
+    # Verifica que el usuario sea el creador comparando los IDs, sin consultar el usuario del elemento
+    if element.user_id != user.id:
         # Retorna un mensaje de error si el usuario no es el creador
         return Response({
             'status': 'error',
@@ -1,5 +1,6 @@
 from rest_framework.response import Response
 from rest_framework import status
+from apps.core.utils.get_principal import get_principal_profile
 
 
 def validate_user_profile(request, type_user):
@@ -15,7 +16,7 @@ def validate_user_profile(request, type_user):
         None: Si el usuario tiene un perfil asociado.
     """
     # Verifica si el usuario tiene un perfil de estudiante asociado
-    if not hasattr(request, type_user):
+    if get_principal_profile(request, type_user) is None:
         # Repuesta de error en la validación
         return Response({
             'status': 'error',
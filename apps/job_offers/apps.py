@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class JobOffersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.job_offers'
+
+
+    def ready(self):
+        """
+        Conecta las señales de la aplicación.
+        """
+        from . import signals
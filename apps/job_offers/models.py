@@ -1,8 +1,43 @@
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.utils import timezone
 from uuid import uuid4
+from apps.core.utils.normalize_text import normalize_text
 from apps.users.models import Company
 
 
+# Define el queryset de oferta de trabajo
+class JobOfferQuerySet(models.QuerySet):
+    def with_company(self):
+        """
+        Obtiene las ofertas de trabajo junto con su compañia en una sola consulta.
+
+        El manager de las ofertas de trabajo lo aplica por defecto, por lo
+        que las consultas cuyo resultado se serializa con
+        `JobOfferResponseSerializer` no realizan una consulta adicional por
+        cada oferta de trabajo.
+
+        Returns:
+            QuerySet: Ofertas de trabajo con la compañia cargada.
+        """
+        return self.select_related('company').defer('search_vector', 'company__search_vector')
+
+
+# Define el manager de oferta de trabajo
+class JobOfferManager(models.Manager.from_queryset(JobOfferQuerySet)):
+    def get_queryset(self):
+        """
+        Obtiene el queryset base de las ofertas de trabajo con su compañia
+        cargada y los vectores de búsqueda diferidos.
+
+        Returns:
+            QuerySet: Ofertas de trabajo con la compañia cargada.
+        """
+        return super().get_queryset().with_company()
+
+
 # Define el modelo de oferta de trabajo
 class JobOffer(models.Model):
     WORK_MODE_CHOICES = [
@@ -19,5 +54,83 @@ class JobOffer(models.Model):
     salary = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     is_closed = models.BooleanField(default=False)
     company = models.ForeignKey(Company, on_delete=models.CASCADE)
+    pending_postulations = models.PositiveIntegerField(default=0)
+    accepted_postulations = models.PositiveIntegerField(default=0)
+    rejected_postulations = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    closed_at = models.DateTimeField(null=True, blank=True)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config=settings.SEARCH_CONFIG)
+            + SearchVector('requirements', weight='B', config=settings.SEARCH_CONFIG)
+            + SearchVector('description', weight='C', config=settings.SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True
+    )
+
+    objects = JobOfferManager()
+
+    # Contadores de postulaciones por estado, mantenidos con actualizaciones atómicas
+    POSTULATION_COUNTER_FIELDS = {
+        'pending': 'pending_postulations',
+        'accepted': 'accepted_postulations',
+        'rejected': 'rejected_postulations',
+    }
+
+
+    def save(self, *args, **kwargs):
+        """
+        Guarda la oferta de trabajo sin sobrescribir los contadores de postulaciones.
+
+        Los contadores solo se modifican con actualizaciones atómicas, por lo que
+        al actualizar una oferta de trabajo existente se excluyen de los campos
+        guardados para no perder los cambios concurrentes. La fecha de cierre se
+        registra al cerrar la oferta de trabajo y se elimina al reabrirla.
+
+        Args:
+            *args (list): Lista de argumentos.
+            **kwargs (dict): Diccionario de argumentos.
+        """
+        if not self.is_closed:
+            self.closed_at = None
+        elif self.closed_at is None:
+            self.closed_at = timezone.now()
+
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and not field.generated
+                and field.name not in self.POSTULATION_COUNTER_FIELDS.values()
+            ]
+        super().save(*args, **kwargs)
+
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='job_offer_created_at_id_idx'),
+            GinIndex(fields=['search_vector'], name='job_offer_search_vector_idx'),
+            GinIndex(OpClass(normalize_text('location'), name='gin_trgm_ops'), name='job_offer_location_trgm_idx'),
+        ]
+
+
+# Define el modelo de oferta de trabajo archivada
+class ArchivedJobOffer(models.Model):
+    id = models.UUIDField(primary_key=True, editable=False)
+    title = models.CharField(max_length=100)
+    description = models.TextField(null=True, blank=True)
+    requirements = models.TextField(null=True, blank=True)
+    location = models.CharField(max_length=150)
+    work_mode = models.CharField(max_length=20, choices=JobOffer.WORK_MODE_CHOICES)
+    salary = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    is_closed = models.BooleanField(default=True)
+    company = models.ForeignKey(Company, on_delete=models.CASCADE)
+    pending_postulations = models.PositiveIntegerField(default=0)
+    accepted_postulations = models.PositiveIntegerField(default=0)
+    rejected_postulations = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    closed_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
@@ -1,5 +1,6 @@
+from decimal import Decimal
 from rest_framework import serializers
-from .models import JobOffer
+from .models import JobOffer, ArchivedJobOffer
 from apps.users.serializers import CompanyResponseSerializer
 
 
@@ -13,12 +14,12 @@ class JobOfferValidationSerializer(serializers.ModelSerializer):
 
         Attributes:
             model (JobOffer): Modelo de oferta de trabajo.
-            fields (list): Campos del serializador.
+            exclude (list): Campos excluidos del serializador.
             read_only_fields (list): Campos de solo lectura.
         """
         model = JobOffer
-        fields = '__all__'
-        read_only_fields = ['company']
+        exclude = ['search_vector']
+        read_only_fields = ['company', 'pending_postulations', 'accepted_postulations', 'rejected_postulations', 'closed_at']
 
 
     def create(self, validated_data):
@@ -47,7 +48,60 @@ class JobOfferResponseSerializer(serializers.ModelSerializer):
 
         Attributes:
             model (JobOffer): Modelo de oferta de trabajo.
-            fields (list): Campos del serializador.
+            exclude (list): Campos excluidos del serializador.
         """
         model = JobOffer
+        exclude = ['search_vector']
+
+
+class ArchivedJobOfferResponseSerializer(serializers.ModelSerializer):
+    """
+    Serializador para la respuesta de los datos de ofertas de trabajo archivadas.
+    """
+    company = CompanyResponseSerializer(read_only=True)
+    class Meta:
+        """
+        Metadatos del serializador.
+
+        Attributes:
+            model (ArchivedJobOffer): Modelo de oferta de trabajo archivada.
+            fields (str): Campos del serializador.
+        """
+        model = ArchivedJobOffer
         fields = '__all__'
+
+
+class JobOfferFilterSerializer(serializers.Serializer):
+    """
+    Serializador para la validación de los parámetros de filtrado de ofertas de trabajo.
+    """
+    min_salary = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=Decimal('0'), required=False)
+    max_salary = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=Decimal('0'), required=False)
+    requirements = serializers.CharField(max_length=255, required=False)
+    work_mode = serializers.ChoiceField(choices=JobOffer.WORK_MODE_CHOICES, required=False)
+    is_closed = serializers.BooleanField(required=False)
+    created_at = serializers.DateField(required=False)
+    updated_at = serializers.DateField(required=False)
+    location = serializers.CharField(max_length=150, required=False)
+    company = serializers.CharField(max_length=255, required=False)
+    q = serializers.CharField(max_length=255, required=False)
+
+
+    def validate(self, attrs):
+        """
+        Valida que el rango de salario sea coherente.
+
+        Args:
+            attrs (dict): Parámetros validados.
+
+        Returns:
+            dict: Parámetros validados.
+
+        Raises:
+            serializers.ValidationError: Si el salario mínimo es mayor que el salario máximo.
+        """
+        min_salary = attrs.get('min_salary')
+        max_salary = attrs.get('max_salary')
+        if min_salary is not None and max_salary is not None and min_salary > max_salary:
+            raise serializers.ValidationError({'min_salary': 'The minimum salary cannot be greater than the maximum salary.'})
+        return attrs
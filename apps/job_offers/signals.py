@@ -0,0 +1,40 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.users.models import Company
+from .models import JobOffer
+from .utils.job_offer_cache import invalidate_job_offer_cache, bump_job_offers_generation
+
+
+@receiver([post_save, post_delete], sender=JobOffer)
+def invalidate_job_offer(sender, instance, **kwargs):
+    """
+    Invalida la caché de una oferta de trabajo y del listado de ofertas de
+    trabajo al modificarla o eliminarla.
+
+    Args:
+        sender (Model): Modelo que envía la señal.
+        instance (JobOffer): Oferta de trabajo modificada.
+        **kwargs (dict): Argumentos adicionales de la señal.
+    """
+    invalidate_job_offer_cache([instance.pk])
+    bump_job_offers_generation()
+
+
+@receiver(post_save, sender=Company)
+def invalidate_company_job_offers(sender, instance, created, **kwargs):
+    """
+    Invalida la caché de las ofertas de trabajo de una compañia y del listado
+    de ofertas de trabajo al modificarla, ya que cada oferta incluye los datos
+    de su compañia.
+
+    Args:
+        sender (Model): Modelo que envía la señal.
+        instance (Company): Compañia modificada.
+        created (bool): Indica si la compañia se acaba de crear.
+        **kwargs (dict): Argumentos adicionales de la señal.
+    """
+    # Una compañia recién creada no tiene ofertas de trabajo
+    if created:
+        return
+    invalidate_job_offer_cache(JobOffer.objects.filter(company=instance).values_list('id', flat=True))
+    bump_job_offers_generation()
@@ -4,6 +4,7 @@ from django.test import TestCase
 from django.urls import reverse
 from apps.users.models import CustomUser, Company
 from apps.job_offers.models import JobOffer
+from apps.core.models import OutboxEvent
 from rest_framework.authtoken.models import Token
 
 
@@ -60,6 +61,64 @@ class CloseJobOfferTestCase(TestCase):
         self.assertTrue(self.job_offer.is_closed)
 
 
+    def test_close_job_offer_publishes_event(self):
+        """
+        Prueba del evento de dominio al cerrar una oferta de trabajo.
+
+        Verifica que el cierre registre un evento 'job_offer.closed'
+        en la tabla outbox.
+        """
+        self.client.put(self.url, format='json')
+        event = OutboxEvent.objects.get()
+        self.assertEqual(event.event_type, 'job_offer.closed')
+        self.assertEqual(event.payload['job_offer_id'], str(self.job_offer.id))
+
+
+    def test_close_job_offer_already_closed(self):
+        """
+        Prueba de cierre de una oferta de trabajo ya cerrada.
+
+        Verifica que el endpoint responda con un código de estado 200
+        sin modificar la oferta de trabajo ni registrar otro evento.
+        """
+        self.client.put(self.url, format='json')
+        self.job_offer.refresh_from_db()
+        closed_at, updated_at = self.job_offer.closed_at, self.job_offer.updated_at
+        response = self.client.put(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.job_offer.refresh_from_db()
+        self.assertEqual((self.job_offer.closed_at, self.job_offer.updated_at), (closed_at, updated_at))
+        self.assertEqual(OutboxEvent.objects.count(), 1)
+
+
+    def test_close_job_offer_single_statement(self):
+        """
+        Prueba del número de consultas al cerrar una oferta de trabajo.
+
+        Verifica que, además de la autenticación, de la transacción y del
+        registro del evento, el cierre y la validación del creador se
+        resuelvan con una sola sentencia.
+        """
+        with self.assertNumQueries(5):
+            response = self.client.put(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+    def test_close_job_offer_invalidates_cache(self):
+        """
+        Prueba de invalidación de la caché al cerrar la oferta de trabajo.
+
+        Verifica que la oferta de trabajo obtenida después del cierre
+        refleje el nuevo estado aunque estuviera guardada en la caché.
+        """
+        get_url = reverse('get_job_offer', kwargs={'job_offer_id': self.job_offer.id})
+        self.client.get(get_url, format='json')
+        self.client.put(self.url, format='json')
+        response = self.client.get(get_url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['data']['job_offer']['is_closed'])
+
+
     def test_close_job_offer_not_found(self):
         """
         Prueba de cierre de oferta de trabajo no encontrada.
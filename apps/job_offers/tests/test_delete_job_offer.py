@@ -2,8 +2,9 @@ from rest_framework.test import APIClient
 from rest_framework import status
 from django.test import TestCase
 from django.urls import reverse
-from apps.users.models import CustomUser, Company
+from apps.users.models import CustomUser, Company, Student
 from apps.job_offers.models import JobOffer
+from apps.postulations.models import Postulation
 from rest_framework.authtoken.models import Token
 
 
@@ -59,6 +60,57 @@ class DeleteJobOfferTestCase(TestCase):
         self.assertFalse(JobOffer.objects.filter(id=self.job_offer.id).exists())
 
 
+    def test_delete_job_offer_with_postulations(self):
+        """
+        Prueba de eliminación de una oferta de trabajo con postulaciones.
+
+        Verifica que la eliminación también elimine las postulaciones
+        de la oferta de trabajo.
+        """
+        student_user = CustomUser.objects.create(username='TestStudent', email='teststudent@email.com', user_type='student')
+        student = Student.objects.create(
+            university='Test University',
+            degree='Test Degree',
+            major='Test Major',
+            graduation_year=2025,
+            professional_experience='Test Experience',
+            about_me='Test About Me',
+            user=student_user
+        )
+        Postulation.objects.create(student=student, job_offer=self.job_offer)
+        response = self.client.delete(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(JobOffer.objects.filter(id=self.job_offer.id).exists())
+        self.assertFalse(Postulation.objects.filter(job_offer_id=self.job_offer.id).exists())
+
+
+    def test_delete_job_offer_single_statement(self):
+        """
+        Prueba del número de consultas al eliminar una oferta de trabajo.
+
+        Verifica que, además de la autenticación y de la transacción, la
+        eliminación y la validación del creador se resuelvan con una sola
+        sentencia.
+        """
+        with self.assertNumQueries(4):
+            response = self.client.delete(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+    def test_delete_job_offer_invalidates_cache(self):
+        """
+        Prueba de invalidación de la caché al eliminar la oferta de trabajo.
+
+        Verifica que la oferta de trabajo eliminada no se siga obteniendo
+        desde la caché.
+        """
+        get_url = reverse('get_job_offer', kwargs={'job_offer_id': self.job_offer.id})
+        self.client.get(get_url, format='json')
+        self.client.delete(self.url, format='json')
+        response = self.client.get(get_url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
     def test_delete_job_offer_not_found(self):
         """
         Prueba de eliminación de oferta de trabajo no encontrada.
@@ -1,9 +1,13 @@
 from rest_framework.test import APIClient
 from rest_framework import status
-from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from django.db import connection
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from apps.users.models import CustomUser, Company
 from apps.job_offers.models import JobOffer
+from apps.job_offers.serializers import JobOfferResponseSerializer
+from apps.job_offers.utils.compile_job_offer_filters import compile_job_offer_filters
 from rest_framework.authtoken.models import Token
 
 
@@ -174,6 +178,53 @@ class FilterJobOffersTestCase(TestCase):
         self.assertEqual(len(response.data['data']['job_offers']), 2)
 
 
+    def test_filter_job_offers_invalid_params(self):
+        """
+        Prueba de filtrado de ofertas de trabajo con parámetros inválidos.
+
+        Verifica que el endpoint responda con un código de estado
+        400 cuando los parámetros de filtrado no tienen el tipo esperado.
+        """
+        invalid_params = [
+            {'min_salary': 'abc'},
+            {'is_closed': 'maybe'},
+            {'created_at': '2024-13-45'},
+            {'work_mode': 'underwater'},
+            {'min_salary': 65000, 'max_salary': 55000},
+        ]
+        for params in invalid_params:
+            response = self.client.get(self.url, params, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+            self.assertTrue('errors' in response.data)
+
+
+    def test_filter_job_offers_ignores_empty_params(self):
+        """
+        Prueba de filtrado de ofertas de trabajo con parámetros vacíos.
+
+        Verifica que el endpoint responda con un código de estado
+        200 e ignore los parámetros de filtrado sin valor.
+        """
+        response = self.client.get(self.url, {'location': '', 'is_closed': ''}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['job_offers']), 2)
+
+
+    def test_filter_job_offers_query_count(self):
+        """
+        Prueba del número de consultas del filtrado de ofertas de trabajo.
+
+        Verifica que una página filtrada solo consulte el total y la
+        página, y que un filtrado sin resultados solo consulte el total.
+        """
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {'work_mode': 'hybrid', 'min_salary': 1000}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {'work_mode': 'onsite'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
     def test_filter_job_offers_without_token(self):
         """
         Prueba de filtrado de ofertas de trabajo sin token de autenticación.
@@ -185,3 +236,208 @@ class FilterJobOffersTestCase(TestCase):
         self.client.credentials()
         response = self.client.get(self.url, {'location': 'Test Location 1'}, format='json')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+    def test_filter_job_offers_cursor_pagination(self):
+        """
+        Prueba de filtrado de ofertas de trabajo con paginación por cursor.
+
+        Verifica que el endpoint responda con un código de estado
+        200 y que la información de la paginación incluya los cursores
+        sin calcular el total de ofertas de trabajo.
+        """
+        response = self.client.get(self.url, {'company': 'Test Company', 'cursor': '', 'page_size': 1}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        page_info = response.data['data']['page_info']
+        self.assertIsNone(page_info['count'])
+        self.assertIsNotNone(page_info['cursors']['next'])
+        self.assertEqual(len(response.data['data']['job_offers']), 1)
+
+
+    def test_filter_job_offers_by_search_text(self):
+        """
+        Prueba de filtrado de ofertas de trabajo por búsqueda de texto completo.
+
+        Verifica que el endpoint responda con un código de estado
+        200 y que la búsqueda encuentre las palabras con su raíz.
+        """
+        JobOffer.objects.filter(id=self.job_offer1.id).update(
+            title='Senior Python Developer',
+            requirements='Experience developing REST APIs with Django'
+        )
+        response = self.client.get(self.url, {'q': 'python developers'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['job_offers']), 1)
+        self.assertEqual(response.data['data']['job_offers'][0]['id'], str(self.job_offer1.id))
+        self.assertNotIn('search_vector', response.data['data']['job_offers'][0])
+
+
+    def test_filter_job_offers_by_search_text_relevance(self):
+        """
+        Prueba de ordenamiento por relevancia de la búsqueda de texto completo.
+
+        Verifica que las ofertas de trabajo con coincidencias en el título
+        aparezcan antes que las coincidencias en la descripción.
+        """
+        JobOffer.objects.filter(id=self.job_offer1.id).update(description='We use Kubernetes daily')
+        JobOffer.objects.filter(id=self.job_offer2.id).update(title='Kubernetes Engineer')
+        response = self.client.get(self.url, {'q': 'kubernetes'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        job_offers = response.data['data']['job_offers']
+        self.assertEqual([job_offer['id'] for job_offer in job_offers], [str(self.job_offer2.id), str(self.job_offer1.id)])
+
+
+    def test_filter_job_offers_by_search_text_company_name(self):
+        """
+        Prueba de búsqueda de texto completo por nombre de la compañia.
+
+        Verifica que la búsqueda también encuentre las ofertas de trabajo
+        por el nombre de la compañia que las publica.
+        """
+        response = self.client.get(self.url, {'q': 'company'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['job_offers']), 2)
+
+
+    def test_filter_job_offers_by_search_text_uses_indexes(self):
+        """
+        Prueba de los índices de la búsqueda de texto completo.
+
+        Verifica que la búsqueda en la oferta de trabajo y en la compañia
+        use el índice GIN de cada tabla.
+        """
+        job_offers = compile_job_offer_filters(JobOffer.objects.all(), {'q': 'python'})
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = job_offers.explain()
+        self.assertIn('job_offer_search_vector_idx', plan)
+        self.assertIn('company_search_vector_idx', plan)
+
+
+    def test_filter_job_offers_by_search_text_not_found(self):
+        """
+        Prueba de búsqueda de texto completo sin resultados.
+
+        Verifica que el endpoint responda con un código de estado
+        404 cuando ninguna oferta de trabajo coincide con la búsqueda.
+        """
+        response = self.client.get(self.url, {'q': 'astronaut'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+    def test_filter_job_offers_by_search_text_same_representation(self):
+        """
+        Prueba de representación de las ofertas de trabajo filtradas por texto.
+
+        Verifica que el JSON de las ofertas de trabajo ordenadas por
+        relevancia sea idéntico al generado por `JobOfferResponseSerializer`.
+        """
+        response = self.client.get(self.url, {'q': 'company'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [job_offer['id'] for job_offer in response.data['data']['job_offers']]
+        job_offers = sorted(JobOffer.objects.filter(id__in=ids), key=lambda job_offer: ids.index(str(job_offer.id)))
+        self.assertEqual(
+            JSONRenderer().render(response.data['data']['job_offers']),
+            JSONRenderer().render(JobOfferResponseSerializer(job_offers, many=True).data)
+        )
+
+
+    @override_settings(PAGINATION_COUNT_CAP=1)
+    def test_filter_job_offers_by_search_text_approximate_count(self):
+        """
+        Prueba de filtrado de ofertas de trabajo por texto con más registros que el límite de conteo.
+
+        Verifica que el endpoint responda con un código de estado
+        200 y que el total de las ofertas de trabajo filtradas se
+        marque como aproximado.
+        """
+        response = self.client.get(self.url, {'q': 'company'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        page_info = response.data['data']['page_info']
+        self.assertTrue(page_info['count_is_approximate'])
+        self.assertGreaterEqual(page_info['count'], len(response.data['data']['job_offers']))
+
+
+    def test_filter_job_offers_by_location_without_accents(self):
+        """
+        Prueba de filtrado de ofertas de trabajo por ubicación sin acentos.
+
+        Verifica que el filtro de ubicación no distinga mayúsculas ni acentos.
+        """
+        JobOffer.objects.filter(id=self.job_offer1.id).update(location='Bogotá, Colombia')
+        response = self.client.get(self.url, {'location': 'bogota'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['job_offers']), 1)
+        self.assertEqual(response.data['data']['job_offers'][0]['id'], str(self.job_offer1.id))
+
+
+    def test_filter_job_offers_by_location_misspelled(self):
+        """
+        Prueba de filtrado de ofertas de trabajo por ubicación mal escrita.
+
+        Verifica que el filtro de ubicación encuentre coincidencias
+        aproximadas por similitud de trigramas.
+        """
+        JobOffer.objects.filter(id=self.job_offer1.id).update(location='Medellín')
+        response = self.client.get(self.url, {'location': 'Medelin'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['job_offers']), 1)
+
+
+    def test_filter_job_offers_by_company_misspelled(self):
+        """
+        Prueba de filtrado de ofertas de trabajo por compañía mal escrita.
+
+        Verifica que el filtro de compañía encuentre coincidencias
+        aproximadas por similitud de trigramas.
+        """
+        response = self.client.get(self.url, {'company': 'Tets Compani'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['job_offers']), 2)
+
+
+    def test_filter_job_offers_by_location_and_company_approximate(self):
+        """
+        Prueba de filtrado por ubicación aproximada y compañía exacta.
+
+        Verifica que la coincidencia aproximada se use solo en el campo sin
+        coincidencias parciales, mientras que el otro campo conserva el
+        filtrado exacto.
+        """
+        other_user = CustomUser.objects.create_user(
+            username='OtherCompany',
+            user_type='company',
+            email='othercompany@email.com',
+            password='OtherPassword'
+        )
+        exact_company = Company.objects.create(name='Acme Corporation', industry='Tech', location='Medellin', user=other_user)
+        third_user = CustomUser.objects.create_user(
+            username='ThirdCompany',
+            user_type='company',
+            email='thirdcompany@email.com',
+            password='ThirdPassword'
+        )
+        fuzzy_company = Company.objects.create(name='Acme Corporatoin', industry='Tech', location='Medellin', user=third_user)
+        job_offer = JobOffer.objects.create(title='A', location='Medellin', work_mode='remote', company=exact_company)
+        JobOffer.objects.create(title='B', location='Medellin', work_mode='remote', company=fuzzy_company)
+
+        response = self.client.get(self.url, {'location': 'Medelin', 'company': 'Acme Corporation'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        job_offer_ids = [job_offer['id'] for job_offer in response.data['data']['job_offers']]
+        self.assertEqual(job_offer_ids, [str(job_offer.id)])
+
+
+    def test_filter_job_offers_cache_invalidated_on_write(self):
+        """
+        Prueba de invalidación de la caché del filtrado al modificar una oferta de trabajo.
+
+        Verifica que el filtrado refleje los cambios de una oferta de
+        trabajo aunque la página estuviera guardada en la caché.
+        """
+        response = self.client.get(self.url, {'work_mode': 'hybrid'}, format='json')
+        self.assertEqual(len(response.data['data']['job_offers']), 1)
+        self.job_offer2.work_mode = 'hybrid'
+        self.job_offer2.save()
+        response = self.client.get(self.url, {'work_mode': 'hybrid'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['job_offers']), 2)
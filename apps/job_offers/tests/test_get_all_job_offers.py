@@ -1,9 +1,11 @@
 from rest_framework.test import APIClient
 from rest_framework import status
-from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from apps.users.models import CustomUser, Company
 from apps.job_offers.models import JobOffer
+from apps.job_offers.serializers import JobOfferResponseSerializer
 from rest_framework.authtoken.models import Token
 
 
@@ -69,6 +71,22 @@ class GetAllJobOffersTestCase(TestCase):
         self.assertEqual(len(response.data['data']), 2)
 
 
+    def test_get_all_job_offers_same_representation(self):
+        """
+        Prueba de representación de las ofertas de trabajo del listado.
+
+        Verifica que el JSON de las ofertas de trabajo sea idéntico al
+        generado por `JobOfferResponseSerializer`.
+        """
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        expected = JobOfferResponseSerializer(JobOffer.objects.order_by('id'), many=True).data
+        self.assertEqual(
+            JSONRenderer().render(response.data['data']['job_offers']),
+            JSONRenderer().render(expected)
+        )
+
+
     def test_get_all_job_offers_without_token(self):
         """
         Prueba de obtención de todas las ofertas de trabajo sin token de autenticación.
@@ -80,3 +98,171 @@ class GetAllJobOffersTestCase(TestCase):
         self.client.credentials()
         response = self.client.get(self.url, format='json')
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+    def test_get_all_job_offers_cursor_pagination(self):
+        """
+        Prueba de obtención de todas las ofertas de trabajo con paginación por cursor.
+
+        Verifica que el endpoint responda con un código de estado
+        200 y que los cursores opacos permitan recorrer las páginas
+        hacia adelante y hacia atrás sin repetir ofertas de trabajo.
+        """
+        response = self.client.get(self.url, {'cursor': '', 'page_size': 1}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        page_info = response.data['data']['page_info']
+        self.assertIsNone(page_info['count'])
+        self.assertIsNone(page_info['cursors']['previous'])
+        self.assertIsNotNone(page_info['cursors']['next'])
+        self.assertEqual(response.data['data']['job_offers'][0]['id'], str(self.job_offer2.id))
+
+        response = self.client.get(self.url, {'cursor': page_info['cursors']['next'], 'page_size': 1}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        page_info = response.data['data']['page_info']
+        self.assertIsNone(page_info['cursors']['next'])
+        self.assertIsNotNone(page_info['cursors']['previous'])
+        self.assertEqual(response.data['data']['job_offers'][0]['id'], str(self.job_offer1.id))
+
+        response = self.client.get(self.url, {'cursor': page_info['cursors']['previous'], 'page_size': 1}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['job_offers'][0]['id'], str(self.job_offer2.id))
+        self.assertIsNone(response.data['data']['page_info']['links']['previous'])
+
+
+    def test_get_all_job_offers_invalid_cursor(self):
+        """
+        Prueba de obtención de todas las ofertas de trabajo con un cursor inválido.
+
+        Verifica que el endpoint responda con un código de estado
+        404 cuando se envía un cursor que no se puede decodificar.
+        """
+        response = self.client.get(self.url, {'cursor': 'invalid-cursor'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+    @override_settings(PAGINATION_COUNT_CAP=1)
+    def test_get_all_job_offers_approximate_count(self):
+        """
+        Prueba de obtención de todas las ofertas de trabajo con más registros que el límite de conteo.
+
+        Verifica que el endpoint responda con un código de estado
+        200 y que el total se marque como aproximado cuando supera
+        el límite de registros contados con exactitud.
+        """
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        page_info = response.data['data']['page_info']
+        self.assertTrue(page_info['count_is_approximate'])
+        self.assertGreaterEqual(page_info['count'], 2)
+        self.assertEqual(len(response.data['data']['job_offers']), 2)
+
+
+    @override_settings(PAGINATION_COUNT_CAP=1)
+    def test_get_all_job_offers_exact_count(self):
+        """
+        Prueba de obtención de todas las ofertas de trabajo con el total exacto.
+
+        Verifica que el endpoint responda con un código de estado
+        200 y con el total exacto cuando el cliente lo solicita aunque
+        supere el límite de registros contados con exactitud.
+        """
+        response = self.client.get(self.url, {'exact_count': 'true'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        page_info = response.data['data']['page_info']
+        self.assertFalse(page_info['count_is_approximate'])
+        self.assertEqual(page_info['count'], 2)
+
+
+    def test_get_all_job_offers_constant_queries(self):
+        """
+        Prueba de obtención de todas las ofertas de trabajo con varias compañias.
+
+        Verifica que el número de consultas no crezca con la cantidad de
+        ofertas de trabajo de compañias distintas en la página.
+        """
+        for index in range(3):
+            user = CustomUser.objects.create(
+                username=f'OtherCompany{index}',
+                email=f'othercompany{index}@email.com',
+                user_type='company'
+            )
+            company = Company.objects.create(
+                name=f'Other Company {index}',
+                industry='Tech',
+                location='Other Location',
+                description='Other Description',
+                user=user
+            )
+            JobOffer.objects.create(
+                title=f'Other Job Offer {index}',
+                location='Other Location',
+                work_mode='onsite',
+                company=company
+            )
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['job_offers']), 5)
+
+
+    def test_get_all_job_offers_served_from_cache(self):
+        """
+        Prueba de obtención de todas las ofertas de trabajo desde la caché.
+
+        Verifica que una página ya obtenida no vuelva a consultar las
+        ofertas de trabajo en la base de datos.
+        """
+        first_response = self.client.get(self.url, format='json')
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data'], first_response.data['data'])
+
+
+    def test_get_all_job_offers_cache_invalidated_on_write(self):
+        """
+        Prueba de invalidación de la caché del listado al crear una oferta de trabajo.
+
+        Verifica que una oferta de trabajo nueva aparezca en una página
+        que ya estaba guardada en la caché.
+        """
+        self.client.get(self.url, format='json')
+        JobOffer.objects.create(
+            title='Test Job Offer 3',
+            location='Test Location 3',
+            work_mode='onsite',
+            company=self.company
+        )
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['page_info']['count'], 3)
+
+
+    def test_get_all_job_offers_not_modified(self):
+        """
+        Prueba de obtención de todas las ofertas de trabajo sin modificaciones.
+
+        Verifica que el endpoint responda con un código de estado
+        304 sin consultar las ofertas de trabajo cuando el cliente
+        envía el ETag de la versión actual de la página.
+        """
+        etag = self.client.get(self.url, format='json')['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+    def test_get_all_job_offers_modified_after_delete(self):
+        """
+        Prueba de obtención de todas las ofertas de trabajo después de eliminar una.
+
+        Verifica que el endpoint responda con un código de estado
+        200 y un ETag distinto cuando se elimina una oferta de trabajo
+        de la página que tenía el cliente.
+        """
+        etag = self.client.get(self.url, format='json')['ETag']
+        self.job_offer2.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['data']['page_info']['count'], 1)
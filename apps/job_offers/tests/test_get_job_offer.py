@@ -1,9 +1,12 @@
+import time
 from rest_framework.test import APIClient
 from rest_framework import status
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 from apps.users.models import CustomUser, Company
 from apps.job_offers.models import JobOffer
+from apps.job_offers.utils.job_offer_cache import get_postulations_version_cache_key, postulation_counters_changed
 from rest_framework.authtoken.models import Token
 from faker import Faker
 
@@ -62,6 +65,117 @@ class GetJobOfferTestCase(TestCase):
         self.assertTrue('data' in response.data)
 
 
+    def test_get_job_offer_loads_company_in_single_query(self):
+        """
+        Prueba de obtención de oferta de trabajo junto con su compañia.
+
+        Verifica que la oferta de trabajo y su compañia se obtengan
+        en una sola consulta además de la autenticación.
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['job_offer']['company']['id'], self.company.id)
+
+
+    def test_default_manager_loads_company(self):
+        """
+        Prueba del queryset por defecto de las ofertas de trabajo.
+
+        Verifica que cualquier consulta del manager obtenga la compañia
+        en la misma consulta y difiera el vector de búsqueda.
+        """
+        with self.assertNumQueries(1):
+            job_offer = JobOffer.objects.filter(id=self.job_offer.id).first()
+            self.assertEqual(job_offer.company.name, self.company.name)
+        self.assertIn('search_vector', job_offer.get_deferred_fields())
+
+
+    def test_get_job_offer_served_from_cache(self):
+        """
+        Prueba de obtención de oferta de trabajo desde la caché.
+
+        Verifica que la segunda obtención de la oferta de trabajo no
+        consulte la oferta de trabajo en la base de datos.
+        """
+        first_response = self.client.get(self.url, format='json')
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['job_offer'], first_response.data['data']['job_offer'])
+
+
+    def test_get_job_offer_cache_invalidated_on_company_update(self):
+        """
+        Prueba de invalidación de la caché al actualizar la compañia.
+
+        Verifica que la oferta de trabajo refleje los datos actualizados
+        de su compañia después de haberse guardado en la caché.
+        """
+        self.client.get(self.url, format='json')
+        response = self.client.put(reverse('update_company_data'), {'name': 'Updated Company'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.data['data']['job_offer']['company']['name'], 'Updated Company')
+
+
+    def test_get_job_offer_not_modified(self):
+        """
+        Prueba de obtención de una oferta de trabajo sin modificaciones.
+
+        Verifica que el endpoint responda con un código de estado
+        304 cuando el cliente envía el ETag o la fecha de modificación
+        de la versión actual de la oferta de trabajo.
+        """
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', response.headers)
+        self.assertIn('Last-Modified', response.headers)
+
+        not_modified_response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified_response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified_response.content, b'')
+
+        not_modified_response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(not_modified_response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+    def test_get_job_offer_modified_after_update(self):
+        """
+        Prueba de obtención de una oferta de trabajo modificada.
+
+        Verifica que el endpoint responda con un código de estado
+        200 y un ETag distinto cuando la oferta de trabajo cambia
+        después de que el cliente obtuvo su versión.
+        """
+        etag = self.client.get(self.url, format='json')['ETag']
+        self.job_offer.title = 'Updated Job Offer'
+        self.job_offer.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+    def test_get_job_offer_modified_after_postulations_change(self):
+        """
+        Prueba de obtención de una oferta de trabajo después de cambiar sus contadores.
+
+        Verifica que el endpoint responda con un código de estado 200
+        cuando el cliente envía la fecha de modificación anterior al
+        último cambio de las postulaciones, aunque la fecha de
+        actualización de la oferta de trabajo no cambie.
+        """
+        last_modified = self.client.get(self.url, format='json')['Last-Modified']
+        JobOffer.objects.filter(id=self.job_offer.id).update(pending_postulations=1)
+        postulation_counters_changed(self.job_offer.id)
+        # Las fechas HTTP tienen precisión de segundos, por lo que el cambio se registra unos segundos después
+        cache.set(get_postulations_version_cache_key(self.job_offer.id), time.time_ns() + 5 * 10**9, None)
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['job_offer']['pending_postulations'], 1)
+        self.assertNotEqual(response['Last-Modified'], last_modified)
+
+
     def test_get_job_offer_not_found(self):
         """
         Prueba de obtención de oferta de trabajo no encontrada.
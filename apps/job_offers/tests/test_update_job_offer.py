@@ -1,6 +1,8 @@
 from rest_framework.test import APIClient
 from rest_framework import status
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from apps.users.models import CustomUser, Company
 from apps.job_offers.models import JobOffer
@@ -66,6 +68,38 @@ class UpdateJobOfferTestCase(TestCase):
         self.assertTrue('message' in response.data)
 
 
+    def test_update_job_offer_invalidates_cache(self):
+        """
+        Prueba de invalidación de la caché al actualizar la oferta de trabajo.
+
+        Verifica que la oferta de trabajo obtenida después de la
+        actualización refleje los nuevos datos aunque estuviera
+        guardada en la caché.
+        """
+        get_url = reverse('get_job_offer', kwargs={'job_offer_id': self.job_offer.id})
+        self.client.get(get_url, format='json')
+        self.client.put(self.url, self.data, format='json')
+        response = self.client.get(get_url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['job_offer']['title'], 'Updated Job Offer')
+
+
+    def test_update_job_offer_loads_owned_job_offer_once(self):
+        """
+        Prueba de la carga de la oferta de trabajo de la compañia.
+
+        Verifica que la oferta de trabajo se obtenga con una sola consulta
+        condicionada a la compañia del usuario, sin consultar la compañia
+        ni el usuario creador.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(self.url, {'salary': 70000}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        selects = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('SELECT')]
+        self.assertEqual(len([sql for sql in selects if f'FROM "{JobOffer._meta.db_table}"' in sql]), 1)
+        self.assertFalse([sql for sql in selects if f'FROM "{Company._meta.db_table}"' in sql])
+
+
     def test_update_job_offer_not_found(self):
         """
         Prueba de actualización de oferta de trabajo no encontrada.
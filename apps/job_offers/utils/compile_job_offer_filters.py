@@ -0,0 +1,95 @@
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db.models import Exists, F, Q, Value
+from django.utils import timezone
+from apps.core.utils.normalize_text import normalize_text
+from apps.job_offers.models import JobOffer
+
+
+def get_date_range(field_name, date):
+    """
+    Construye el predicado de un día completo como un rango sobre el campo,
+    que a diferencia de `__date` no convierte cada valor y puede usar su índice.
+
+    Args:
+        field_name (str): Nombre del campo de fecha y hora.
+        date (date): Día a filtrar en la zona horaria actual.
+
+    Returns:
+        Q: Predicado del rango [inicio del día, inicio del día siguiente).
+    """
+    start = timezone.make_aware(datetime.combine(date, time.min))
+    return Q(**{f'{field_name}__gte': start, f'{field_name}__lt': start + timedelta(days=1)})
+
+
+def compile_job_offer_filters(job_offers, filters):
+    """
+    Compila los parámetros de filtrado validados por `JobOfferFilterSerializer`
+    en los predicados y el ordenamiento del queryset de ofertas de trabajo.
+
+    Args:
+        job_offers (QuerySet): Ofertas de trabajo a filtrar.
+        filters (dict): Parámetros de filtrado validados.
+
+    Returns:
+        QuerySet: Ofertas de trabajo filtradas y ordenadas.
+    """
+    predicates = Q()
+
+    # Predicados de comparación directa sobre las columnas
+    if 'min_salary' in filters:
+        predicates &= Q(salary__gte=filters['min_salary'])
+    if 'max_salary' in filters:
+        predicates &= Q(salary__lte=filters['max_salary'])
+    if 'requirements' in filters:
+        predicates &= Q(requirements__icontains=filters['requirements'])
+    if 'work_mode' in filters:
+        predicates &= Q(work_mode=filters['work_mode'])
+    if 'is_closed' in filters:
+        predicates &= Q(is_closed=filters['is_closed'])
+
+    # Predicados de rango sobre las fechas
+    if 'created_at' in filters:
+        predicates &= get_date_range('created_at', filters['created_at'])
+    if 'updated_at' in filters:
+        predicates &= get_date_range('updated_at', filters['updated_at'])
+
+    job_offers = job_offers.filter(predicates)
+
+    # Parámetros de texto que se comparan por similitud de trigramas
+    similarity_filters = {
+        'normalized_location': ('location', filters.get('location')),
+        'normalized_company': ('company__name', filters.get('company')),
+    }
+
+    # Filtra por coincidencia parcial sin distinguir mayúsculas ni acentos y, solo si
+    # ninguna oferta de trabajo coincide parcialmente en ese campo, por coincidencia aproximada
+    base_job_offers = job_offers
+    ordering = []
+    for alias, (field_name, value) in similarity_filters.items():
+        if value is None:
+            continue
+        normalized_value = normalize_text(Value(value))
+        contains = Q(**{f'{alias}__contains': normalized_value})
+        # La subconsulta no depende de la fila, por lo que PostgreSQL la resuelve una sola vez
+        has_contains = Exists(base_job_offers.alias(**{alias: normalize_text(field_name)}).filter(contains))
+        job_offers = job_offers.alias(**{alias: normalize_text(field_name)}).filter(
+            contains | (Q(**{f'{alias}__trigram_similar': normalized_value}) & ~has_contains)
+        ).alias(**{f'{alias}_similarity': TrigramSimilarity(alias, normalized_value)})
+        ordering.append(F(f'{alias}_similarity').desc())
+
+    # Busca en el título, descripción y requisitos de la oferta y en el nombre de la compañia
+    if 'q' in filters:
+        search_query = SearchQuery(filters['q'], search_type='websearch', config=settings.SEARCH_CONFIG)
+        # Une las búsquedas de cada tabla para que ambas usen su índice GIN, ya que
+        # un OR entre las tablas de la unión obliga a recorrer todas las ofertas de trabajo
+        matching_ids = JobOffer.objects.filter(search_vector=search_query).values('id').union(
+            JobOffer.objects.filter(company__search_vector=search_query).values('id')
+        )
+        job_offers = job_offers.filter(id__in=matching_ids).annotate(
+            rank=SearchRank(F('search_vector'), search_query) + SearchRank(F('company__search_vector'), search_query)
+        )
+        ordering.insert(0, F('rank').desc())
+
+    return job_offers.order_by(*ordering, 'id')
@@ -0,0 +1,251 @@
+import hashlib
+import time
+from datetime import datetime, timezone
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+from rest_framework.response import Response
+from apps.core.utils.conditional_response import build_etag
+from apps.core.utils.get_model_data import get_model_data
+from apps.job_offers.models import JobOffer, ArchivedJobOffer
+from apps.job_offers.serializers import JobOfferResponseSerializer, ArchivedJobOfferResponseSerializer
+
+
+def get_job_offer_cache_key(job_offer_id):
+    """
+    Obtiene la llave de la caché del detalle de una oferta de trabajo.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+
+    Returns:
+        str: Llave de la caché.
+    """
+    return f'job_offers:detail:{job_offer_id}'
+
+
+def get_cached_job_offer(job_offer_id):
+    """
+    Obtiene los datos serializados de una oferta de trabajo desde la caché,
+    consultando la base de datos y guardando el resultado si no existen.
+
+    Si la oferta de trabajo no está en la tabla principal se busca en la
+    tabla de archivo, de modo que las ofertas archivadas se siguen sirviendo.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+
+    Returns:
+        dict: Datos serializados de la oferta de trabajo.
+        Response: Respuesta de error si no se encuentra la oferta de trabajo.
+    """
+    cache_key = get_job_offer_cache_key(job_offer_id)
+
+    # Retorna los datos de la caché si existen
+    job_offer = cache.get(cache_key)
+    if job_offer is not None:
+        return job_offer
+
+    # Obtiene los datos de la oferta de trabajo junto con su compañia
+    job_offer_data = get_model_data(JobOffer, 'id', job_offer_id)
+    serializer_class = JobOfferResponseSerializer
+
+    # Obtiene los datos de la oferta de trabajo archivada si no está en la tabla principal
+    if isinstance(job_offer_data, Response):
+        job_offer_data = get_model_data(
+            ArchivedJobOffer.objects.select_related('company').defer('company__search_vector'), 'id', job_offer_id
+        )
+        serializer_class = ArchivedJobOfferResponseSerializer
+
+    # Verifica si se obtuvo una respuesta de error en lugar de los datos
+    if isinstance(job_offer_data, Response):
+        return job_offer_data
+
+    # Serializa y guarda en la caché los datos de la oferta de trabajo
+    job_offer = dict(serializer_class(job_offer_data).data)
+    cache.set(cache_key, job_offer, settings.JOB_OFFER_CACHE_TIMEOUT)
+    return job_offer
+
+
+def get_job_offer_version(job_offer):
+    """
+    Obtiene el ETag y la fecha de la última modificación de los datos
+    serializados de una oferta de trabajo y de su compañia.
+
+    Los contadores de postulaciones cambian sin modificar la fecha de
+    actualización de la oferta de trabajo, por lo que la fecha de la última
+    modificación también considera el último cambio de sus postulaciones.
+
+    Args:
+        job_offer (dict): Datos serializados de la oferta de trabajo.
+
+    Returns:
+        tuple: ETag y fecha de la última modificación.
+    """
+    company = job_offer.get('company') or {}
+    # Los contadores de postulaciones cambian sin modificar la fecha de la oferta de trabajo
+    counters = [job_offer.get(counter_field) for counter_field in JobOffer.POSTULATION_COUNTER_FIELDS.values()]
+    etag = build_etag(job_offer['id'], job_offer['updated_at'], *counters, company.get('id'), company.get('updated_at'))
+    dates = [parse_datetime(value) for value in (job_offer['updated_at'], company.get('updated_at')) if value]
+    postulations_changed_at = datetime.fromtimestamp(get_postulations_version(job_offer['id']) / 1e9, tz=timezone.utc)
+    return etag, max(dates + [postulations_changed_at])
+
+
+def invalidate_job_offer_cache(job_offer_ids):
+    """
+    Elimina de la caché el detalle de las ofertas de trabajo.
+
+    La eliminación se repite al confirmar la transacción para que una lectura
+    concurrente no vuelva a guardar los datos anteriores a la modificación.
+
+    Args:
+        job_offer_ids (list): IDs de las ofertas de trabajo.
+
+    Returns:
+        None
+    """
+    cache_keys = [get_job_offer_cache_key(job_offer_id) for job_offer_id in job_offer_ids]
+    if not cache_keys:
+        return
+    cache.delete_many(cache_keys)
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
+
+def get_postulations_version_cache_key(job_offer_id):
+    """
+    Obtiene la llave de la caché de la versión de las postulaciones de una oferta de trabajo.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+
+    Returns:
+        str: Llave de la caché.
+    """
+    return f'job_offers:postulations_version:{job_offer_id}'
+
+
+def get_postulations_version(job_offer_id):
+    """
+    Obtiene la versión de las postulaciones de una oferta de trabajo, que es
+    la hora en nanosegundos de la última postulación nueva, retirada o decidida.
+
+    Si la versión no existe se inicializa con la hora actual, de modo que una
+    versión desalojada de la caché nunca se repite ni retrocede.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+
+    Returns:
+        int: Versión actual de las postulaciones.
+    """
+    return cache.get_or_set(get_postulations_version_cache_key(job_offer_id), time.time_ns, None)
+
+
+def postulation_counters_changed(job_offer_id):
+    """
+    Registra el cambio de los contadores de postulaciones de una oferta de
+    trabajo sin modificar su fecha de actualización.
+
+    Elimina el detalle de la oferta de trabajo de la caché y actualiza la
+    versión de sus postulaciones con la hora actual. El listado de ofertas de trabajo no se
+    invalida, por lo que sus contadores se actualizan al expirar cada página
+    (`JOB_OFFERS_LIST_CACHE_TIMEOUT`).
+
+    La actualización se repite al confirmar la transacción para que una lectura
+    concurrente no guarde en la nueva versión datos previos a la modificación.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+
+    Returns:
+        None
+    """
+    cache_key = get_postulations_version_cache_key(job_offer_id)
+
+    def bump():
+        cache.set(cache_key, time.time_ns(), None)
+
+    invalidate_job_offer_cache([job_offer_id])
+    bump()
+    transaction.on_commit(bump)
+
+
+# Llave de la caché del contador de generación del listado de ofertas de trabajo
+JOB_OFFERS_GENERATION_KEY = 'job_offers:generation'
+
+# Llave de la caché de la fecha de la última modificación del listado de ofertas de trabajo
+JOB_OFFERS_LAST_MODIFIED_KEY = 'job_offers:last_modified'
+
+
+def get_job_offers_generation():
+    """
+    Obtiene la generación actual del listado de ofertas de trabajo.
+
+    Si el contador no existe se inicializa con la hora actual en nanosegundos,
+    de modo que una generación desalojada de la caché nunca se repite.
+
+    Returns:
+        int: Generación actual del listado.
+    """
+    return cache.get_or_set(JOB_OFFERS_GENERATION_KEY, time.time_ns, None)
+
+
+def get_job_offers_last_modified():
+    """
+    Obtiene la fecha de la última modificación del listado de ofertas de trabajo.
+
+    La fecha se actualiza junto con la generación del listado, por lo que
+    también refleja las ofertas de trabajo eliminadas. Si no existe se
+    inicializa con la hora actual.
+
+    Returns:
+        datetime: Fecha de la última modificación del listado.
+    """
+    return datetime.fromtimestamp(cache.get_or_set(JOB_OFFERS_LAST_MODIFIED_KEY, time.time, None), tz=timezone.utc)
+
+
+def bump_job_offers_generation():
+    """
+    Incrementa la generación del listado de ofertas de trabajo, dejando
+    inalcanzables todas las páginas guardadas en la caché sin recorrerlas.
+
+    La actualización se repite al confirmar la transacción para que una lectura
+    concurrente no guarde en la nueva generación datos previos a la modificación.
+
+    Returns:
+        None
+    """
+    def bump():
+        try:
+            cache.incr(JOB_OFFERS_GENERATION_KEY)
+        except ValueError:
+            cache.set(JOB_OFFERS_GENERATION_KEY, time.time_ns(), None)
+        cache.set(JOB_OFFERS_LAST_MODIFIED_KEY, time.time(), None)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def get_job_offers_list_cache_key(request, view_name):
+    """
+    Obtiene la llave de la caché de una página del listado de ofertas de
+    trabajo a partir de los parámetros normalizados de la petición y la
+    generación actual del listado.
+
+    Args:
+        request (Request): Petición del cliente.
+        view_name (str): Nombre de la vista del listado.
+
+    Returns:
+        str: Llave de la caché.
+    """
+    # Normaliza los parámetros ordenándolos por nombre y valor
+    params = sorted(
+        (key, value)
+        for key, values in request.query_params.lists()
+        for value in values
+    )
+    fingerprint = repr((request.build_absolute_uri(request.path), params))
+    digest = hashlib.md5(fingerprint.encode('utf-8')).hexdigest()
+    return f'job_offers:list:{view_name}:{get_job_offers_generation()}:{digest}'
@@ -0,0 +1,73 @@
+from functools import wraps
+from rest_framework.response import Response
+from rest_framework import status
+from apps.core.utils.validate_uuid import validate_uuid
+from apps.core.utils.validator_user_type import validate_user_type
+from apps.core.utils.validate_user_profile import validate_user_profile
+from apps.core.utils.get_principal import get_principal_profile
+from apps.job_offers.models import JobOffer
+from apps.job_offers.utils.mutate_owned_job_offer import get_owned_job_offer_miss
+
+
+def load_owned_job_offer(*models, require_profile=True):
+    """
+    Decorador de las vistas que solo puede usar la compañia creadora de una
+    oferta de trabajo.
+
+    Valida el ID de la oferta de trabajo y el tipo del usuario autenticado,
+    y su perfil si se requiere, y obtiene la oferta de trabajo con una sola consulta
+    condicionada a que pertenezca a su compañia. Solo si no se encuentra se
+    consulta si la oferta de trabajo existe, para responder 403 o 404.
+
+    La vista decorada recibe la oferta de trabajo en lugar de su ID.
+
+    Args:
+        *models (list): Modelos en los que se busca la oferta de trabajo, en orden (por defecto JobOffer).
+        require_profile (bool): Responde 400 si el usuario no tiene un perfil de compañia en lugar
+            de tratarlo como un usuario que no es el creador, opcional.
+
+    Returns:
+        callable: Decorador de la vista.
+    """
+    models = models or (JobOffer,)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, job_offer_id, *args, **kwargs):
+            # Valida que el ID tenga el formato valido
+            validation_response = validate_uuid(job_offer_id)
+            if validation_response:
+                return validation_response
+
+            # Valida que el usuario autenticado sea de tipo compañia
+            validation_response = validate_user_type(request.user, 'company')
+            if validation_response:
+                return validation_response
+
+            # Valida que el usuario autenticado tenga un perfil de compañia asociado
+            if require_profile:
+                validation_response = validate_user_profile(request, 'company')
+                if validation_response:
+                    return validation_response
+
+            # Obtiene la oferta de trabajo solo si pertenece a la compañia del usuario autenticado
+            company = get_principal_profile(request, 'company')
+            for model in models if company is not None else ():
+                job_offer_data = model.objects.filter(id=job_offer_id, company_id=company.id).first()
+                if job_offer_data is not None:
+                    return view(request, job_offer_data, *args, **kwargs)
+
+            # Respuesta de error si la oferta de trabajo no existe
+            if get_owned_job_offer_miss(job_offer_id, models) == 'not_found':
+                return Response({
+                    'status': 'error',
+                    'message': 'Data not found.'
+                }, status=status.HTTP_404_NOT_FOUND)
+
+            # Respuesta de error si el usuario autenticado no es el creador de la oferta de trabajo
+            return Response({
+                'status': 'error',
+                'message': 'The user is not the creator.'
+            }, status=status.HTTP_403_FORBIDDEN)
+        return wrapper
+    return decorator
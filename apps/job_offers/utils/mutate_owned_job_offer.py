@@ -0,0 +1,111 @@
+from django.db import connection, transaction
+from apps.core.utils.outbox import publish_event
+from apps.users.models import Company
+from apps.job_offers.models import JobOffer
+from apps.job_offers.utils.job_offer_cache import invalidate_job_offer_cache, bump_job_offers_generation
+from apps.postulations.models import Postulation
+
+
+def get_owned_job_offer_miss(job_offer_id, models=(JobOffer,)):
+    """
+    Resuelve por qué una consulta o modificación condicionada al creador no
+    encontró ninguna oferta de trabajo. Solo se consulta cuando la operación falla.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+        models (tuple): Modelos en los que se busca la oferta de trabajo, opcional.
+
+    Returns:
+        str: 'forbidden' si la oferta de trabajo existe pero pertenece a otra compañia,
+        'not_found' si no existe.
+    """
+    exists = any(model.objects.filter(id=job_offer_id).exists() for model in models)
+    return 'forbidden' if exists else 'not_found'
+
+
+def close_owned_job_offer(job_offer_id, user_id):
+    """
+    Cierra una oferta de trabajo con una sola sentencia `UPDATE` condicionada
+    a que pertenezca a la compañia del usuario y a que siga abierta.
+
+    La sentencia no pasa por `save()`, por lo que invalida la caché de la
+    oferta de trabajo y registra el evento 'job_offer.closed' en la misma
+    transacción. Cerrar una oferta de trabajo ya cerrada no la modifica ni
+    registra el evento.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+        user_id (int): ID del usuario autenticado.
+
+    Returns:
+        str: Resultado del cierre ('closed', 'already_closed', 'not_found' o 'forbidden').
+    """
+    job_offer_table = connection.ops.quote_name(JobOffer._meta.db_table)
+    company_table = connection.ops.quote_name(Company._meta.db_table)
+    sql = f"""
+        UPDATE {job_offer_table} SET is_closed = true, closed_at = COALESCE(closed_at, NOW()), updated_at = NOW()
+        WHERE id = %s AND company_id = (SELECT id FROM {company_table} WHERE user_id = %s) AND NOT is_closed
+        RETURNING company_id
+    """
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [job_offer_id, user_id])
+            row = cursor.fetchone()
+
+        if row is None:
+            # Resuelve con una sola consulta si la oferta de trabajo no existe, es de otra compañia o ya estaba cerrada
+            owner_id = JobOffer.objects.filter(id=job_offer_id).values_list('company__user_id', flat=True).first()
+            if owner_id is None:
+                return 'not_found'
+            return 'already_closed' if owner_id == user_id else 'forbidden'
+
+        publish_event('job_offer.closed', {
+            'job_offer_id': job_offer_id,
+            'company_id': row[0],
+        })
+
+    invalidate_job_offer_cache([job_offer_id])
+    bump_job_offers_generation()
+    return 'closed'
+
+
+def delete_owned_job_offer(job_offer_id, user_id):
+    """
+    Elimina una oferta de trabajo y sus postulaciones con una sola sentencia
+    condicionada a que pertenezca a la compañia del usuario.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+        user_id (int): ID del usuario autenticado.
+
+    Returns:
+        str: Resultado de la eliminación ('deleted', 'not_found' o 'forbidden').
+    """
+    job_offer_table = connection.ops.quote_name(JobOffer._meta.db_table)
+    company_table = connection.ops.quote_name(Company._meta.db_table)
+    postulation_table = connection.ops.quote_name(Postulation._meta.db_table)
+    sql = f"""
+        WITH job_offer AS (
+            SELECT id FROM {job_offer_table}
+            WHERE id = %s AND company_id = (SELECT id FROM {company_table} WHERE user_id = %s)
+            FOR UPDATE
+        ), deleted_postulations AS (
+            DELETE FROM {postulation_table} WHERE job_offer_id IN (SELECT id FROM job_offer)
+        ), deleted AS (
+            DELETE FROM {job_offer_table} WHERE id IN (SELECT id FROM job_offer)
+            RETURNING id
+        )
+        SELECT EXISTS (SELECT 1 FROM deleted)
+    """
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [job_offer_id, user_id])
+            deleted, = cursor.fetchone()
+
+        if not deleted:
+            return get_owned_job_offer_miss(job_offer_id)
+
+    # La sentencia no pasa por delete(), por lo que invalida la caché de la oferta de trabajo
+    invalidate_job_offer_cache([job_offer_id])
+    bump_job_offers_generation()
+    return 'deleted'
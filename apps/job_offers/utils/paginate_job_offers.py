@@ -0,0 +1,54 @@
+from apps.core.utils.custom_pagination import CustomPageNumberPagination, CustomCursorPagination
+from apps.core.utils.row_serializer import RowSerializer
+from apps.job_offers.serializers import JobOfferResponseSerializer
+from config.settings.base import REST_FRAMEWORK
+
+
+# Serializador de filas con la misma representación que JobOfferResponseSerializer
+job_offer_row_serializer = RowSerializer(JobOfferResponseSerializer)
+
+
+def paginate_job_offers(job_offers, request):
+    """
+    Pagina y serializa las ofertas de trabajo de un listado.
+
+    La paginación es por cursor si el cliente envía el parámetro `cursor`
+    y por número de página en caso contrario. Las ofertas de trabajo se
+    obtienen como filas y se serializan con `job_offer_row_serializer`.
+
+    Args:
+        job_offers (QuerySet): Ofertas de trabajo a paginar.
+        request (Request): Petición del cliente.
+
+    Returns:
+        dict: Información de la paginación y ofertas de trabajo de la página.
+    """
+    # Crea la paginación de los datos obtenidos, por cursor si el cliente lo solicita
+    paginator = CustomCursorPagination() if 'cursor' in request.query_params else CustomPageNumberPagination()
+    paginated_rows = paginator.paginate_queryset(job_offer_row_serializer.get_values(job_offers), request)
+
+    # Serializa los datos de las ofertas de trabajo
+    job_offers_data = job_offer_row_serializer.to_representation(paginated_rows)
+
+    # Obtiene la respuesta con los datos paginados
+    response_data = paginator.get_paginated_response(job_offers_data)
+
+    # Obtiene la información de la paginación
+    page_info = {
+        'count': response_data['count'],
+        'page_size': int(request.query_params.get('page_size', REST_FRAMEWORK['PAGE_SIZE'])),
+        'links': response_data['links']
+    }
+
+    # Indica si el total es una estimación si la paginación es por número de página
+    if 'count_is_approximate' in response_data:
+        page_info['count_is_approximate'] = response_data['count_is_approximate']
+
+    # Agrega los cursores opacos si la paginación es por cursor
+    if 'cursors' in response_data:
+        page_info['cursors'] = response_data['cursors']
+
+    return {
+        'page_info': page_info,
+        'job_offers': response_data['results']
+    }
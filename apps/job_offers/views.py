@@ -1,28 +1,35 @@
 from rest_framework.decorators import api_view, authentication_classes, permission_classes
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from django.conf import settings
+from django.core.cache import cache
+from apps.core.utils.cached_token_authentication import CachedTokenAuthentication
+from apps.core.utils.signed_token_authentication import SignedTokenAuthentication
 from apps.core.utils.validator_user_type import validate_user_type
 from apps.core.utils.serializer_validation import serializer_validation
 from apps.core.utils.validate_user_profile import validate_user_profile
-from apps.core.utils.get_model_data import get_model_data
 from apps.core.utils.validate_uuid import validate_uuid
-from apps.core.utils.validate_user_is_creator import validate_user_is_creator
-from apps.core.utils.custom_pagination import CustomPageNumberPagination
-from .serializers import JobOfferValidationSerializer, JobOfferResponseSerializer
+from apps.core.utils.conditional_response import build_etag, conditional_response, set_conditional_headers
+from .serializers import JobOfferValidationSerializer, JobOfferFilterSerializer
 from .models import JobOffer
 from .utils.check_duplicate_job_offer import check_duplicate_job_offer
-from config.settings.base import REST_FRAMEWORK
+from .utils.compile_job_offer_filters import compile_job_offer_filters
+from .utils.mutate_owned_job_offer import close_owned_job_offer, delete_owned_job_offer
+from .utils.load_owned_job_offer import load_owned_job_offer
+from .utils.job_offer_cache import (
+    get_cached_job_offer, get_job_offer_version, get_job_offers_list_cache_key, get_job_offers_last_modified
+)
+from .utils.paginate_job_offers import paginate_job_offers
 
 
 # Endpoint para crear una oferta de trabajo
 @api_view(['POST'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def create_job_offer(request):
     # Valida que el usuario tenga un perfil de compañia asociado
-    validation_response = validate_user_profile(request.user, 'company')
+    validation_response = validate_user_profile(request, 'company')
 
     # Verifica si hay errores en la validación
     if validation_response:
@@ -68,7 +75,7 @@ def create_job_offer(request):
 
 # Endpoint para obtener una oferta de trabajo
 @api_view(['GET'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def get_job_offer(request, job_offer_id):
     # Valida que el ID tenga el formato valido
@@ -79,157 +86,141 @@ def get_job_offer(request, job_offer_id):
         # Retorna la respuesta de error
         return validation_response
     
-    # Obtener los datos de la oferta de trabajo
-    job_offer_data = get_model_data(JobOffer, 'id', job_offer_id)
+    # Obtener los datos serializados de la oferta de trabajo desde la caché
+    job_offer_data = get_cached_job_offer(job_offer_id)
 
     # Verifica si se obtuvo una respuesta de error en lugar de los datos
     if isinstance(job_offer_data, Response):
         # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
         return job_offer_data
 
-    # Serializar los datos de respuesta de la oferta de trabajo
-    job_offer_response_serializer = JobOfferResponseSerializer(job_offer_data)
+    # Obtiene la versión de la oferta de trabajo
+    etag, last_modified = get_job_offer_version(job_offer_data)
+
+    # Responde sin contenido si el cliente tiene la versión actual
+    not_modified_response = conditional_response(request, etag, last_modified)
+    if not_modified_response:
+        return not_modified_response
 
     # Respuesta exitosa al obtener la oferta de trabajo
-    return Response({
+    return set_conditional_headers(Response({
         'status': 'success',
         'message': 'Job offer was successfully obtained.',
         'data': {
-            'job_offer': job_offer_response_serializer.data
+            'job_offer': job_offer_data
         }
-    }, status=status.HTTP_200_OK)
+    }, status=status.HTTP_200_OK), etag, last_modified)
 
 
 # Endpoint para obtener todas las ofertas de trabajo
 @api_view(['GET'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def get_all_job_offers(request):
-    # Obtener todas las ofertas de trabajo
-    job_offers = JobOffer.objects.all().order_by('id')
+    # Obtiene la llave de la caché de la página solicitada
+    cache_key = get_job_offers_list_cache_key(request, 'get_all_job_offers')
+
+    # Obtiene la versión de la página a partir de la generación del listado
+    etag, last_modified = build_etag(cache_key), get_job_offers_last_modified()
+
+    # Responde sin contenido si el cliente tiene la versión actual
+    not_modified_response = conditional_response(request, etag, last_modified)
+    if not_modified_response:
+        return not_modified_response
+
+    # Obtiene los datos de la página desde la caché
+    job_offers_data = cache.get(cache_key)
 
-    # Crea la paginacion de los datos obtenidos
-    paginator = CustomPageNumberPagination()
-    paginated_queryset = paginator.paginate_queryset(job_offers, request)
+    # Verifica si la página no se encuentra en la caché
+    if job_offers_data is None:
+        # Obtener todas las ofertas de trabajo junto con su compañia
+        job_offers = JobOffer.objects.order_by('id')
 
-    # Serializa los datos de las ofertas de trabajo
-    job_offer_response_serializer = JobOfferResponseSerializer(paginated_queryset, many=True)
+        # Pagina y serializa las ofertas de trabajo
+        job_offers_data = paginate_job_offers(job_offers, request)
 
-    # Obtiene la respuesta con los datos paginados
-    response_data = paginator.get_paginated_response(job_offer_response_serializer.data)
+        # Guarda los datos de la página en la caché
+        cache.set(cache_key, job_offers_data, settings.JOB_OFFERS_LIST_CACHE_TIMEOUT)
 
     # Respuesta exitosa al obtener las ofertas de trabajo
-    return Response({
+    return set_conditional_headers(Response({
         'status': 'success',
         'message': 'The job offers were successfully obtained.',
-        'data': {
-            'page_info': {
-                'count': response_data['count'],
-                'page_size': int(request.query_params.get('page_size', REST_FRAMEWORK['PAGE_SIZE'])),
-                'links': response_data['links']
-            },
-            'job_offers': response_data['results']
-        }
-    }, status=status.HTTP_200_OK)
+        'data': job_offers_data
+    }, status=status.HTTP_200_OK), etag, last_modified)
 
 
 # Endpoint para filtrar ofertas de trabajo
 @api_view(['GET'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def filter_job_offers(request):
-    # Obtiene los parámetros de filtro de la solicitud
-    filters = {
-        'location__icontains': request.query_params.get('location'),
-        'company__name__icontains': request.query_params.get('company'),
-        'salary__gte': request.query_params.get('min_salary'),
-        'salary__lte': request.query_params.get('max_salary'),
-        'requirements__icontains': request.query_params.get('requirements'),
-        'work_mode__icontains': request.query_params.get('work_mode'),
-        'is_closed': request.query_params.get('is_closed'),
-        'created_at__date': request.query_params.get('created_at'),
-        'updated_at__date': request.query_params.get('updated_at')
-    }
-
-    # Elimina filtros con valores None
-    filters = {key: value for key, value in filters.items() if value is not None}
-
-    # Capitaliza el valor booleano de is_closed
-    if 'is_closed' in filters:
-        filters['is_closed'] = filters['is_closed'].capitalize()
-
-    # Filtrar las ofertas de trabajo según los parámetros proporcionados
-    job_offers = JobOffer.objects.filter(**filters).order_by('id')
-
-    # Respuesta de error si no se encontraron ofertas de trabajo
-    if not job_offers:
+    # Obtiene la llave de la caché de la página solicitada
+    cache_key = get_job_offers_list_cache_key(request, 'filter_job_offers')
+
+    # Obtiene la versión de la página a partir de la generación del listado
+    etag, last_modified = build_etag(cache_key), get_job_offers_last_modified()
+
+    # Responde sin contenido si el cliente tiene la versión actual
+    not_modified_response = conditional_response(request, etag, last_modified)
+    if not_modified_response:
+        return not_modified_response
+
+    # Obtiene los datos de la página desde la caché
+    job_offers_data = cache.get(cache_key)
+
+    # Verifica si la página se encuentra en la caché
+    if job_offers_data is not None:
+        # Respuesta exitosa con los datos de la caché
+        return set_conditional_headers(Response({
+            'status': 'success',
+            'message': 'The job offers were successfully obtained.',
+            'data': job_offers_data
+        }, status=status.HTTP_200_OK), etag, last_modified)
+
+    # Obtiene los parámetros de filtro de la solicitud, ignorando los vacíos
+    job_offer_filter_serializer = JobOfferFilterSerializer(data={
+        key: value for key, value in request.query_params.items() if value != ''
+    })
+
+    # Obtiene la validacion de los parámetros de filtro
+    validation_error = serializer_validation(job_offer_filter_serializer)
+
+    # Verifica si hay errores en la validacion
+    if validation_error:
+        # Retorna la respuesta de error
+        return validation_error
+
+    # Filtra las ofertas de trabajo con los predicados compilados de los parámetros
+    job_offers = compile_job_offer_filters(JobOffer.objects.all(), job_offer_filter_serializer.validated_data)
+
+    # Pagina y serializa las ofertas de trabajo
+    job_offers_data = paginate_job_offers(job_offers, request)
+
+    # Respuesta de error si la primera página no tiene ofertas de trabajo
+    if not job_offers_data['job_offers'] and not job_offers_data['page_info']['links']['previous']:
         return Response({
             'status': 'error',
             'message': 'No job offers found with the specified filters.'
         }, status=status.HTTP_404_NOT_FOUND)
 
-    # Crea la paginación de los datos obtenidos
-    paginator = CustomPageNumberPagination()
-    paginated_queryset = paginator.paginate_queryset(job_offers, request)
-
-    # Serializa los datos de las ofertas de trabajo
-    job_offer_response_serializer = JobOfferResponseSerializer(paginated_queryset, many=True)
-
-    # Obtiene la respuesta con los datos paginados
-    response_data = paginator.get_paginated_response(job_offer_response_serializer.data)
+    # Guarda los datos de la página en la caché
+    cache.set(cache_key, job_offers_data, settings.JOB_OFFERS_LIST_CACHE_TIMEOUT)
 
     # Respuesta exitosa al obtener las ofertas de trabajo filtradas
-    return Response({
+    return set_conditional_headers(Response({
         'status': 'success',
         'message': 'The job offers were successfully obtained.',
-        'data': {
-            'page_info': {
-                'count': response_data['count'],
-                'page_size': int(request.query_params.get('page_size', REST_FRAMEWORK['PAGE_SIZE'])),
-                'links': response_data['links']
-            },
-            'job_offers': response_data['results']
-        }
-    }, status=status.HTTP_200_OK)
+        'data': job_offers_data
+    }, status=status.HTTP_200_OK), etag, last_modified)
 
 
 # Endpoint para editar una oferta de trabajo
 @api_view(['PUT'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
-def update_job_offer(request, job_offer_id):
-    # Valida que el ID tenga el formato valido
-    validation_response = validate_uuid(job_offer_id)
-    
-    # Verifica si hay errores en la validación
-    if validation_response:
-        # Retorna la respuesta de error
-        return validation_response
-    
-    # Valida que que el usuario sea tipo compañia
-    validation_response = validate_user_type(request.user, 'company')
-
-    # Verifica si hay errores en la validación
-    if validation_response:
-        # Retorna la respuesta de error
-        return validation_response
-
-    # Obtener los datos de la oferta de trabajo
-    job_offer_data = get_model_data(JobOffer, 'id', job_offer_id)
-
-    # Verifica si se obtuvo una respuesta de error en lugar de los datos
-    if isinstance(job_offer_data, Response):
-        # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
-        return job_offer_data
-    
-    # Valida que el usuario autenticado sea el creador de la oferta de trabajo
-    validation_response = validate_user_is_creator(job_offer_data.company, request.user)
-    
-    # Verifica si hay errores en la validación
-    if validation_response:
-        # Retorna la respuesta de error
-        return validation_response
-
+@load_owned_job_offer(require_profile=False)
+def update_job_offer(request, job_offer_data):
     # Obtiene los datos enviados en la petición
     job_offer_validation_serializer = JobOfferValidationSerializer(job_offer_data, data=request.data, context={'request': request}, partial=True)
 
@@ -263,7 +254,7 @@ def update_job_offer(request, job_offer_id):
 
 # Endpoint para finalizar una oferta de trabajo
 @api_view(['PUT'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def close_job_offer(request, job_offer_id):
     # Valida que el ID tenga el formato valido
@@ -282,25 +273,22 @@ def close_job_offer(request, job_offer_id):
         # Retorna la respuesta de error
         return validation_response
 
-    # Obtiene los datos de la oferta de trabajo
-    job_offer_data = get_model_data(JobOffer, 'id', job_offer_id)
+    # Cierra la oferta de trabajo solo si pertenece a la compañia del usuario autenticado
+    result = close_owned_job_offer(job_offer_id, request.user.id)
 
-    # Verifica si se obtuvo una respuesta de error en lugar de los datos
-    if isinstance(job_offer_data, Response):
-        # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
-        return job_offer_data
-
-    # Valida que el usuario autenticado sea el creador de la oferta de trabajo
-    validation_response = validate_user_is_creator(job_offer_data.company, request.user)
-
-    # Verifica si hay errores en la validacion
-    if validation_response:
-        # Retorna la respuesta de error
-        return validation_response
+    # Respuesta de error si la oferta de trabajo no existe
+    if result == 'not_found':
+        return Response({
+            'status': 'error',
+            'message': 'Data not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
 
-    # Cierra la oferta de trabajo
-    job_offer_data.is_closed = True
-    job_offer_data.save()
+    # Respuesta de error si el usuario autenticado no es el creador de la oferta de trabajo
+    if result == 'forbidden':
+        return Response({
+            'status': 'error',
+            'message': 'The user is not the creator.'
+        }, status=status.HTTP_403_FORBIDDEN)
 
     # Respuesta exitosa al cerrar la oferta de trabajo
     return Response({
@@ -311,7 +299,7 @@ def close_job_offer(request, job_offer_id):
 
 # Endpoint para eliminar una oferta de trabajo
 @api_view(['DELETE'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def delete_job_offer(request, job_offer_id):    
     # Valida que el ID tenga el formato valido
@@ -330,24 +318,22 @@ def delete_job_offer(request, job_offer_id):
         # Retorna la respuesta de error
         return validation_response
 
-    # Obtiene los datos de la oferta de trabajo
-    job_offer_data = get_model_data(JobOffer, 'id', job_offer_id)
-
-    # Verifica si se obtuvo una respuesta de error en lugar de los datos
-    if isinstance(job_offer_data, Response):
-        # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
-        return job_offer_data
+    # Elimina la oferta de trabajo solo si pertenece a la compañia del usuario autenticado
+    result = delete_owned_job_offer(job_offer_id, request.user.id)
 
-    # Valida que el usuario autenticado sea el creador de la oferta de trabajo
-    validation_response = validate_user_is_creator(job_offer_data.company, request.user)
-
-    # Verifica si hay errores en la validacion
-    if validation_response:
-        # Retorna la respuesta de error
-        return validation_response
+    # Respuesta de error si la oferta de trabajo no existe
+    if result == 'not_found':
+        return Response({
+            'status': 'error',
+            'message': 'Data not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
 
-    # Elimina la oferta de trabajo
-    job_offer_data.delete()
+    # Respuesta de error si el usuario autenticado no es el creador de la oferta de trabajo
+    if result == 'forbidden':
+        return Response({
+            'status': 'error',
+            'message': 'The user is not the creator.'
+        }, status=status.HTTP_403_FORBIDDEN)
     
     # Respuesta exitosa al eliminar la oferta de trabajo
     return Response({
@@ -0,0 +1,49 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.job_offers.utils.job_offer_cache import bump_job_offers_generation
+from apps.postulations.utils.archive_job_offers import archive_job_offers
+
+
+class Command(BaseCommand):
+    help = 'Move the job offers closed longer than the archive period, and their postulations, to the archive tables'
+    def add_arguments(self, parser):
+        """
+        Agrega los argumentos del comando.
+
+        Args:
+            parser (ArgumentParser): Analizador de argumentos del comando.
+        """
+        parser.add_argument('--days', type=int, default=settings.JOB_OFFER_ARCHIVE_AFTER_DAYS, help='Days a job offer stays closed before it is archived')
+        parser.add_argument('--batch-size', type=int, default=500, help='Job offers archived per statement')
+
+
+    def handle(self, *args, **options):
+        """
+        Comando para archivar las ofertas de trabajo cerradas y sus postulaciones.
+
+        Cada lote se mueve con una sola sentencia en su propia transacción,
+        por lo que el comando se puede interrumpir sin dejar ofertas de
+        trabajo archivadas a medias.
+
+        Args:
+            *args (list): Lista de argumentos.
+            **options (dict): Diccionario de opciones.
+
+        Returns:
+            None
+        """
+        closed_before = timezone.now() - timedelta(days=options['days'])
+        job_offer_count = 0
+        postulation_count = 0
+        while True:
+            job_offer_ids, batch_postulation_count = archive_job_offers(closed_before, options['batch_size'])
+            if not job_offer_ids:
+                break
+            job_offer_count += len(job_offer_ids)
+            postulation_count += batch_postulation_count
+
+        if job_offer_count:
+            bump_job_offers_generation()
+        self.stdout.write(self.style.SUCCESS(f'{job_offer_count} job offers and {postulation_count} postulations archived.'))
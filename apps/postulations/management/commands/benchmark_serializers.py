@@ -0,0 +1,159 @@
+from time import perf_counter
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from apps.users.models import CustomUser, Company, Student
+from apps.job_offers.models import JobOffer
+from apps.job_offers.serializers import JobOfferResponseSerializer
+from apps.job_offers.utils.paginate_job_offers import job_offer_row_serializer
+from apps.postulations.models import Postulation
+from apps.postulations.serializers import PostulationsResponseSerializer
+from apps.postulations.views import postulation_row_serializer
+
+
+class Command(BaseCommand):
+    help = 'Compare the DRF serializers with the row serializers of the listing endpoints'
+    def add_arguments(self, parser):
+        """
+        Agrega los argumentos del comando.
+
+        Args:
+            parser (ArgumentParser): Analizador de argumentos del comando.
+        """
+        parser.add_argument('--rows', type=int, default=100, help='Rows serialized per page')
+        parser.add_argument('--iterations', type=int, default=200, help='Pages serialized per serializer')
+
+
+    def handle(self, *args, **options):
+        """
+        Comando para medir el tiempo de serialización de una página de ofertas
+        de trabajo y de postulaciones con ambos serializadores.
+
+        Cada página se consulta una sola vez, por lo que solo se mide el
+        tiempo de serialización y no el de la consulta.
+
+        Los datos de prueba se crean dentro de una transacción que se revierte
+        al finalizar, por lo que la base de datos no se modifica.
+
+        Args:
+            *args (list): Lista de argumentos.
+            **options (dict): Diccionario de opciones.
+
+        Returns:
+            None
+
+        Raises:
+            CommandError: Si las representaciones de ambos serializadores no son idénticas.
+        """
+        rows = options['rows']
+        iterations = options['iterations']
+
+        with transaction.atomic():
+            job_offer = self._create_data(rows)
+
+            job_offers = JobOffer.objects.order_by('id')[:rows]
+            job_offer_instances = list(job_offers)
+            job_offer_rows = list(job_offer_row_serializer.get_values(job_offers))
+            self._compare(
+                'job offers',
+                lambda: JobOfferResponseSerializer(job_offer_instances, many=True).data,
+                lambda: job_offer_row_serializer.to_representation(job_offer_rows),
+                iterations
+            )
+
+            postulations = Postulation.objects.filter(job_offer=job_offer).order_by('id')[:rows]
+            postulation_instances = list(postulations)
+            postulation_rows = list(postulation_row_serializer.get_values(postulations))
+            self._compare(
+                'postulations',
+                lambda: PostulationsResponseSerializer(postulation_instances, many=True).data,
+                lambda: postulation_row_serializer.to_representation(postulation_rows),
+                iterations
+            )
+
+            # Revierte los datos de prueba
+            transaction.set_rollback(True)
+
+
+    def _create_data(self, rows):
+        """
+        Crea las ofertas de trabajo y postulaciones de prueba.
+
+        Args:
+            rows (int): Cantidad de registros a crear de cada modelo.
+
+        Returns:
+            JobOffer: Oferta de trabajo con las postulaciones creadas.
+        """
+        company_user = CustomUser.objects.create(username='benchmark-company', email='benchmark-company@email.com', user_type='company')
+        company = Company.objects.create(
+            name='Benchmark Company',
+            industry='Tech',
+            location='Benchmark Location',
+            description='Benchmark Description',
+            user=company_user
+        )
+        job_offers = JobOffer.objects.bulk_create([
+            JobOffer(
+                title=f'Benchmark Job Offer {index}',
+                description='Benchmark Description',
+                requirements='Benchmark Requirements',
+                location='Benchmark Location',
+                salary=1000 + index,
+                work_mode='remote',
+                company=company
+            )
+            for index in range(rows)
+        ])
+        student_users = CustomUser.objects.bulk_create([
+            CustomUser(username=f'benchmark-student-{index}', email=f'benchmark-student-{index}@email.com', user_type='student')
+            for index in range(rows)
+        ])
+        students = Student.objects.bulk_create([
+            Student(
+                university='Benchmark University',
+                degree='Benchmark Degree',
+                major='Benchmark Major',
+                graduation_year=2025,
+                professional_experience='Benchmark Experience',
+                about_me='Benchmark About Me',
+                user=user
+            )
+            for user in student_users
+        ])
+        Postulation.objects.bulk_create([
+            Postulation(student=student, job_offer=job_offers[0])
+            for student in students
+        ])
+        return job_offers[0]
+
+
+    def _compare(self, name, serialize, serialize_rows, iterations):
+        """
+        Mide ambos serializadores y verifica que su JSON sea idéntico.
+
+        Args:
+            name (str): Nombre del listado medido.
+            serialize (callable): Serializa la página con el serializador de DRF.
+            serialize_rows (callable): Serializa la página con el serializador de filas.
+            iterations (int): Cantidad de páginas a serializar.
+
+        Raises:
+            CommandError: Si las representaciones de ambos serializadores no son idénticas.
+        """
+        renderer = JSONRenderer()
+        if renderer.render(serialize()) != renderer.render(serialize_rows()):
+            raise CommandError(f'The {name} representations are not identical.')
+
+        timings = []
+        for function in (serialize, serialize_rows):
+            start = perf_counter()
+            for _ in range(iterations):
+                function()
+            timings.append((perf_counter() - start) / iterations * 1000)
+
+        self.stdout.write(
+            f'{name}: serializer {timings[0]:.2f} ms/page, '
+            f'row serializer {timings[1]:.2f} ms/page, '
+            f'speedup {timings[0] / timings[1]:.1f}x'
+        )
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from apps.job_offers.utils.job_offer_cache import postulation_counters_changed
+from apps.postulations.models import Postulation
+
+
+class Command(BaseCommand):
+    help = 'Delete the duplicated postulations of a student to the same job offer'
+    def handle(self, *args, **options):
+        """
+        Comando para eliminar las postulaciones duplicadas de un estudiante a
+        una misma oferta de trabajo antes de aplicar la restricción
+        `unique_student_job_offer_postulation`.
+
+        De cada grupo de postulaciones duplicadas se conserva la más antigua
+        según `applied_at`. Solo se usan columnas que existen desde la primera
+        migración de las postulaciones, por lo que se puede ejecutar antes de
+        `migrate`; los contadores de postulaciones se corrigen después con
+        `reconcile_postulation_counters`.
+
+        Args:
+            *args (list): Lista de argumentos.
+            **options (dict): Diccionario de opciones.
+
+        Returns:
+            None
+        """
+        # En una base de datos nueva todavía no existe la tabla de postulaciones
+        if Postulation._meta.db_table not in connection.introspection.table_names():
+            self.stdout.write(self.style.SUCCESS('0 duplicated postulations deleted.'))
+            return
+
+        postulation_table = connection.ops.quote_name(Postulation._meta.db_table)
+        sql = f"""
+            WITH ranked AS (
+                SELECT id, ROW_NUMBER() OVER (PARTITION BY student_id, job_offer_id ORDER BY applied_at, id) AS position
+                FROM {postulation_table}
+            ), deleted AS (
+                DELETE FROM {postulation_table}
+                WHERE id IN (SELECT id FROM ranked WHERE position > 1)
+                RETURNING job_offer_id
+            )
+            SELECT (SELECT COUNT(*) FROM deleted), ARRAY(SELECT DISTINCT job_offer_id::text FROM deleted)
+        """
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(sql)
+            deleted_count, job_offer_ids = cursor.fetchone()
+            for job_offer_id in job_offer_ids:
+                postulation_counters_changed(job_offer_id)
+
+        self.stdout.write(self.style.SUCCESS(f'{deleted_count} duplicated postulations deleted.'))
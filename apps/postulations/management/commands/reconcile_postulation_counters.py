@@ -0,0 +1,81 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from apps.job_offers.models import JobOffer
+from apps.job_offers.utils.job_offer_cache import invalidate_job_offer_cache, bump_job_offers_generation
+from apps.postulations.models import Postulation
+
+
+class Command(BaseCommand):
+    help = 'Recalculate the postulation counters of the job offers that drifted'
+    def add_arguments(self, parser):
+        """
+        Agrega los argumentos del comando.
+
+        Args:
+            parser (ArgumentParser): Analizador de argumentos del comando.
+        """
+        parser.add_argument('--batch-size', type=int, default=1000, help='Job offers reconciled per statement')
+
+
+    def handle(self, *args, **options):
+        """
+        Comando para recalcular los contadores de postulaciones de las ofertas
+        de trabajo a partir de las postulaciones existentes.
+
+        Las ofertas de trabajo se recorren por lotes ordenados por ID y cada
+        lote se corrige con una sola sentencia `UPDATE` que solo modifica las
+        ofertas de trabajo cuyos contadores no coinciden.
+
+        Args:
+            *args (list): Lista de argumentos.
+            **options (dict): Diccionario de opciones.
+
+        Returns:
+            None
+        """
+        job_offer_table = connection.ops.quote_name(JobOffer._meta.db_table)
+        postulation_table = connection.ops.quote_name(Postulation._meta.db_table)
+        sql = f"""
+            WITH batch AS (
+                SELECT id FROM {job_offer_table}
+                WHERE %s::uuid IS NULL OR id > %s::uuid
+                ORDER BY id
+                LIMIT %s
+            ), counts AS (
+                SELECT
+                    batch.id,
+                    COUNT(postulation.id) FILTER (WHERE postulation.status = 'pending') AS pending,
+                    COUNT(postulation.id) FILTER (WHERE postulation.status = 'accepted') AS accepted,
+                    COUNT(postulation.id) FILTER (WHERE postulation.status = 'rejected') AS rejected
+                FROM batch
+                LEFT JOIN {postulation_table} AS postulation ON postulation.job_offer_id = batch.id
+                GROUP BY batch.id
+            ), fixed AS (
+                UPDATE {job_offer_table} AS job_offer
+                SET pending_postulations = counts.pending,
+                    accepted_postulations = counts.accepted,
+                    rejected_postulations = counts.rejected
+                FROM counts
+                WHERE job_offer.id = counts.id
+                  AND (job_offer.pending_postulations, job_offer.accepted_postulations, job_offer.rejected_postulations)
+                      IS DISTINCT FROM (counts.pending, counts.accepted, counts.rejected)
+                RETURNING job_offer.id
+            )
+            SELECT (SELECT id::text FROM batch ORDER BY id DESC LIMIT 1), ARRAY(SELECT id::text FROM fixed)
+        """
+
+        last_id = None
+        fixed_count = 0
+        while True:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(sql, [last_id, last_id, options['batch_size']])
+                last_id, fixed_ids = cursor.fetchone()
+                if fixed_ids:
+                    invalidate_job_offer_cache(fixed_ids)
+            fixed_count += len(fixed_ids)
+            if last_id is None:
+                break
+
+        if fixed_count:
+            bump_job_offers_generation()
+        self.stdout.write(self.style.SUCCESS(f'{fixed_count} job offers reconciled.'))
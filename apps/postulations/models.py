@@ -1,7 +1,7 @@
 from django.db import models
 from uuid import uuid4
 from apps.users.models import Student
-from apps.job_offers.models import JobOffer
+from apps.job_offers.models import JobOffer, ArchivedJobOffer
 
 
 # Define el modelo de postulacion
@@ -17,3 +17,29 @@ class Postulation(models.Model):
     job_offer = models.ForeignKey(JobOffer, on_delete=models.CASCADE)
     applied_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['student', 'job_offer'], name='unique_student_job_offer_postulation'),
+        ]
+        indexes = [
+            models.Index(fields=['student', 'applied_at', 'id'], name='postulation_student_date_idx'),
+            models.Index(fields=['job_offer', 'status', 'applied_at', 'id'], name='postulation_offer_status_idx'),
+        ]
+
+
+# Define el modelo de postulacion archivada junto con su oferta de trabajo
+class ArchivedPostulation(models.Model):
+    id = models.UUIDField(primary_key=True, editable=False)
+    status = models.CharField(max_length=20, choices=Postulation.STATUS_CHOICES)
+    student = models.ForeignKey(Student, on_delete=models.CASCADE)
+    job_offer = models.ForeignKey(ArchivedJobOffer, on_delete=models.CASCADE)
+    applied_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['student', 'applied_at', 'id'], name='archived_post_student_date_idx'),
+        ]
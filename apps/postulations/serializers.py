@@ -1,10 +1,12 @@
 from rest_framework import serializers
-from .models import Postulation
+from .models import Postulation, ArchivedPostulation
+from apps.job_offers.serializers import JobOfferResponseSerializer, ArchivedJobOfferResponseSerializer
 
 
 class PostulationValidationSerializer(serializers.ModelSerializer):
     """
-    Serializador para la validación de postulaciones.
+    Serializador para la validación de postulaciones. La postulación se
+    crea con `insert_postulation`, no con `save()`.
     """
     class Meta:
         """
@@ -20,21 +22,44 @@ class PostulationValidationSerializer(serializers.ModelSerializer):
         read_only_fields = ['student', 'job_offer']
 
 
-    def create(self, validated_data):
+class PostulationsResponseSerializer(serializers.ModelSerializer):
+    """
+    Serializador para la respuesta de postulaciones.
+    """
+    class Meta:
         """
-        Crea una nueva postulación con los datos validados.
+        Metadatos del serializador.
+
+        Attributes:
+            model (Postulation): Modelo de postulación.
+            fields (list): Campos del serializador.
         """
-        # Asigna el usuario autenticado al campo estudiante
-        validated_data['student'] = self.context['request'].user.student
-        # Asigna la oferta de trabajo al campo oferta de trabajo
-        validated_data['job_offer'] = self.context['job_offer']
-        return super().create(validated_data)
+        model = Postulation
+        fields = '__all__'
 
 
-class PostulationsResponseSerializer(serializers.ModelSerializer):
+class ArchivedPostulationsResponseSerializer(serializers.ModelSerializer):
     """
-    Serializador para la respuesta de postulaciones.
+    Serializador para la respuesta de postulaciones archivadas.
+    """
+    class Meta:
+        """
+        Metadatos del serializador.
+
+        Attributes:
+            model (ArchivedPostulation): Modelo de postulación archivada.
+            fields (list): Campos del serializador.
+        """
+        model = ArchivedPostulation
+        fields = '__all__'
+
+
+class StudentPostulationsResponseSerializer(serializers.ModelSerializer):
+    """
+    Serializador para la respuesta de las postulaciones de un estudiante
+    junto con su oferta de trabajo y compañia.
     """
+    job_offer = JobOfferResponseSerializer(read_only=True)
     class Meta:
         """
         Metadatos del serializador.
@@ -44,4 +69,44 @@ class PostulationsResponseSerializer(serializers.ModelSerializer):
             fields (list): Campos del serializador.
         """
         model = Postulation
-        fields = '__all__'
+        fields = ['id', 'status', 'applied_at', 'updated_at', 'job_offer']
+
+
+class ArchivedStudentPostulationsResponseSerializer(serializers.ModelSerializer):
+    """
+    Serializador para la respuesta de las postulaciones archivadas de un
+    estudiante junto con su oferta de trabajo archivada y compañia.
+    """
+    job_offer = ArchivedJobOfferResponseSerializer(read_only=True)
+    class Meta:
+        """
+        Metadatos del serializador.
+
+        Attributes:
+            model (ArchivedPostulation): Modelo de postulación archivada.
+            fields (list): Campos del serializador.
+        """
+        model = ArchivedPostulation
+        fields = ['id', 'status', 'applied_at', 'updated_at', 'job_offer']
+
+
+class StudentPostulationFilterSerializer(serializers.Serializer):
+    """
+    Serializador para la validación de los parámetros de las postulaciones
+    del estudiante autenticado.
+    """
+    archived = serializers.BooleanField(default=False)
+
+
+class PostulationFilterSerializer(serializers.Serializer):
+    """
+    Serializador para la validación de los parámetros de filtrado y
+    ordenamiento de las postulaciones a una oferta de trabajo.
+    """
+    SORT_CHOICES = [
+        ('applied_at', 'Oldest first'),
+        ('-applied_at', 'Newest first'),
+        ('relevance', 'Most relevant first'),
+    ]
+    status = serializers.ChoiceField(choices=Postulation.STATUS_CHOICES, required=False)
+    sort = serializers.ChoiceField(choices=SORT_CHOICES, default='applied_at')
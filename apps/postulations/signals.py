@@ -0,0 +1,29 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from apps.users.models import Student
+from .models import Postulation, ArchivedPostulation
+from .utils.rank_postulations import invalidate_relevance_cache
+
+
+@receiver(post_save, sender=Student)
+def invalidate_student_relevance(sender, instance, created, **kwargs):
+    """
+    Invalida la relevancia de las postulaciones de un estudiante al
+    modificar su perfil, ya que la relevancia se calcula a partir de él.
+
+    Incluye las postulaciones archivadas, ya que las postulaciones de una
+    oferta de trabajo archivada también se pueden ordenar por relevancia.
+
+    Args:
+        sender (Model): Modelo que envía la señal.
+        instance (Student): Estudiante modificado.
+        created (bool): Indica si el estudiante se acaba de crear.
+        **kwargs (dict): Argumentos adicionales de la señal.
+    """
+    # Un estudiante recién creado no tiene postulaciones
+    if created:
+        return
+    invalidate_relevance_cache([
+        *Postulation.objects.filter(student=instance).values_list('job_offer_id', flat=True),
+        *ArchivedPostulation.objects.filter(student=instance).values_list('job_offer_id', flat=True),
+    ])
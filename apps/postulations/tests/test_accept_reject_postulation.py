@@ -1,10 +1,13 @@
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.urls import reverse
 from apps.users.models import CustomUser, Company, Student
 from apps.job_offers.models import JobOffer
 from apps.postulations.models import Postulation
+from apps.core.models import OutboxEvent
 from rest_framework.authtoken.models import Token
 
 
@@ -67,6 +70,34 @@ class AcceptRejectPostulationTestCase(TestCase):
         self.url = reverse('accept_reject_postulation', kwargs={'job_offer_id': self.job_offer.id})
 
 
+    def create_postulation(self, index, job_offer):
+        """
+        Crea la postulación de un nuevo estudiante a una oferta de trabajo.
+
+        Args:
+            index (int): Índice del estudiante.
+            job_offer (JobOffer): Oferta de trabajo de la postulación.
+
+        Returns:
+            Postulation: Postulación creada.
+        """
+        user = CustomUser.objects.create(
+            username=f'OtherStudent{index}',
+            email=f'otherstudent{index}@email.com',
+            user_type='student'
+        )
+        student = Student.objects.create(
+            university='Test University',
+            degree='Test Degree',
+            major='Test Major',
+            graduation_year=2025,
+            professional_experience='Test Experience',
+            about_me='Test About Me',
+            user=user
+        )
+        return Postulation.objects.create(student=student, job_offer=job_offer)
+
+
     def test_accept_postulation_successful(self):
         """
         Prueba de aceptación de postulación a oferta de trabajo exitosa.
@@ -99,6 +130,127 @@ class AcceptRejectPostulationTestCase(TestCase):
         self.assertEqual(self.postulation.status, 'rejected')
 
 
+    def test_accept_reject_postulation_batch_results(self):
+        """
+        Prueba de aceptación y rechazo de un lote de postulaciones.
+
+        Verifica que el endpoint responda con un código de estado
+        200, que solo actualice las postulaciones de la oferta de trabajo
+        y que informe el resultado de cada postulación del lote.
+        """
+        other_job_offer = JobOffer.objects.create(
+            title='Other Job Offer',
+            location='Test Location',
+            work_mode='remote',
+            company=self.company
+        )
+        second_postulation = self.create_postulation(1, self.job_offer)
+        other_postulation = self.create_postulation(2, other_job_offer)
+        missing_id = 'e23cbcc5-6a30-4008-bcef-4536414e744f'
+        data = [
+            {'id': str(self.postulation.id), 'status': 'accept'},
+            {'id': str(second_postulation.id), 'status': 'reject'},
+            {'id': str(other_postulation.id), 'status': 'accept'},
+            {'id': missing_id, 'status': 'reject'},
+        ]
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['updated'], 2)
+        results = {result['id']: result['result'] for result in response.data['data']['results']}
+        self.assertEqual(results, {
+            str(self.postulation.id): 'updated',
+            str(second_postulation.id): 'updated',
+            str(other_postulation.id): 'wrong_job_offer',
+            missing_id: 'not_found',
+        })
+        self.postulation.refresh_from_db()
+        second_postulation.refresh_from_db()
+        other_postulation.refresh_from_db()
+        self.assertEqual(self.postulation.status, 'accepted')
+        self.assertEqual(second_postulation.status, 'rejected')
+        self.assertEqual(other_postulation.status, 'pending')
+
+
+    def test_accept_reject_postulation_moves_counters(self):
+        """
+        Prueba de los contadores de postulaciones al aceptar y rechazar.
+
+        Verifica que los contadores de la oferta de trabajo reflejen las
+        transiciones de estado y que repetir una decisión no los modifique.
+        """
+        JobOffer.objects.filter(id=self.job_offer.id).update(pending_postulations=2)
+        second_postulation = self.create_postulation(1, self.job_offer)
+        data = [
+            {'id': str(self.postulation.id), 'status': 'accept'},
+            {'id': str(second_postulation.id), 'status': 'reject'},
+        ]
+        self.client.post(self.url, data, format='json')
+        self.client.post(self.url, data, format='json')
+        self.job_offer.refresh_from_db()
+        self.assertEqual(self.job_offer.pending_postulations, 0)
+        self.assertEqual(self.job_offer.accepted_postulations, 1)
+        self.assertEqual(self.job_offer.rejected_postulations, 1)
+
+
+    def test_accept_reject_postulation_publishes_events(self):
+        """
+        Prueba de los eventos de dominio al aceptar o rechazar postulaciones.
+
+        Verifica que cada cambio de estado registre un evento
+        'postulation.status_changed' y que repetir la misma decisión
+        no registre un nuevo evento.
+        """
+        data = [{'id': str(self.postulation.id), 'status': 'accept'}]
+        self.client.post(self.url, data, format='json')
+        self.client.post(self.url, data, format='json')
+        event = OutboxEvent.objects.get()
+        self.assertEqual(event.event_type, 'postulation.status_changed')
+        self.assertEqual(event.payload['postulation_id'], str(self.postulation.id))
+        self.assertEqual(event.payload['previous_status'], 'pending')
+        self.assertEqual(event.payload['status'], 'accepted')
+
+
+    def test_accept_reject_postulation_constant_queries(self):
+        """
+        Prueba del número de consultas de un lote de postulaciones.
+
+        Verifica que el número de consultas no crezca con la cantidad
+        de postulaciones del lote.
+        """
+        postulations = [self.create_postulation(index, self.job_offer) for index in range(10)]
+        data = [{'id': str(self.postulation.id), 'status': 'accept'}]
+
+        # Autentica el token antes de medir para que ambas peticiones lo obtengan de la caché
+        self.client.post(self.url, [], format='json')
+        with CaptureQueriesContext(connection) as single_queries:
+            self.client.post(self.url, data, format='json')
+        data = [
+            {'id': str(postulation.id), 'status': 'accept' if index % 2 else 'reject'}
+            for index, postulation in enumerate(postulations)
+        ]
+        with CaptureQueriesContext(connection) as batch_queries:
+            response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(batch_queries), len(single_queries) + 1)
+
+
+    def test_accept_reject_postulation_invalid_entry_applies_nothing(self):
+        """
+        Prueba de un lote de postulaciones con un elemento inválido.
+
+        Verifica que el endpoint responda con un código de estado
+        400 y que no aplique ninguna decisión del lote.
+        """
+        data = [
+            {'id': str(self.postulation.id), 'status': 'accept'},
+            {'id': 'invalid-uuid', 'status': 'accept'},
+        ]
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.postulation.refresh_from_db()
+        self.assertEqual(self.postulation.status, 'pending')
+
+
     def test_accept_reject_postulation_invalid_uuid(self):
         """
         Prueba de aceptación o rechazo de postulación a oferta de trabajo con UUID inválido.
@@ -0,0 +1,137 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from apps.users.models import CustomUser, Company, Student
+from apps.job_offers.models import JobOffer, ArchivedJobOffer
+from apps.postulations.models import Postulation, ArchivedPostulation
+
+
+class ArchiveJobOffersTestCase(TestCase):
+    """
+    Test case para el comando de archivo de ofertas de trabajo cerradas.
+    """
+    def setUp(self):
+        """
+        Configuración inicial de los casos de prueba.
+        """
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(
+            username='TestCompany',
+            first_name='TestFirstName',
+            last_name='TestLastName',
+            user_type='company',
+            email='testcompany@email.com',
+            password='TestPassword'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.company = Company.objects.create(
+            name='Test Company',
+            industry='Tech',
+            location='Test Location',
+            description='Test Description',
+            user=self.user
+        )
+        self.old_job_offer, self.recent_job_offer, self.open_job_offer = [
+            JobOffer.objects.create(
+                title=f'Test Job Offer {index}',
+                location='Test Location',
+                work_mode='hybrid',
+                salary=50000,
+                is_closed=is_closed,
+                company=self.company
+            )
+            for index, is_closed in enumerate([True, True, False])
+        ]
+        JobOffer.objects.filter(id=self.old_job_offer.id).update(closed_at=timezone.now() - timedelta(days=365))
+        student_user = CustomUser.objects.create(username='TestStudent', email='teststudent@email.com', user_type='student')
+        self.student = Student.objects.create(
+            university='Test University',
+            degree='Test Degree',
+            major='Test Major',
+            graduation_year=2025,
+            professional_experience='Test Experience',
+            about_me='Test About Me',
+            user=student_user
+        )
+        self.postulation = Postulation.objects.create(student=self.student, job_offer=self.old_job_offer, status='accepted')
+        Postulation.objects.create(student=self.student, job_offer=self.recent_job_offer)
+
+
+    def test_archive_job_offers(self):
+        """
+        Prueba del archivo de las ofertas de trabajo cerradas.
+
+        Verifica que solo las ofertas de trabajo cerradas antes del periodo
+        de archivo se muevan, junto con sus postulaciones, a las tablas de archivo.
+        """
+        out = StringIO()
+        call_command('archive_job_offers', '--days', '30', '--batch-size', '1', stdout=out)
+        self.assertIn('1 job offers and 1 postulations archived', out.getvalue())
+        self.assertFalse(JobOffer.objects.filter(id=self.old_job_offer.id).exists())
+        self.assertFalse(Postulation.objects.filter(id=self.postulation.id).exists())
+        self.assertEqual(JobOffer.objects.filter(id__in=[self.recent_job_offer.id, self.open_job_offer.id]).count(), 2)
+
+        archived_job_offer = ArchivedJobOffer.objects.get()
+        self.assertEqual(archived_job_offer.id, self.old_job_offer.id)
+        self.assertEqual(archived_job_offer.title, self.old_job_offer.title)
+        self.assertEqual(archived_job_offer.company, self.company)
+        self.assertIsNotNone(archived_job_offer.archived_at)
+        archived_postulation = ArchivedPostulation.objects.get()
+        self.assertEqual(archived_postulation.id, self.postulation.id)
+        self.assertEqual(archived_postulation.status, 'accepted')
+        self.assertEqual(archived_postulation.job_offer, archived_job_offer)
+
+
+    def test_close_job_offer_sets_closed_at(self):
+        """
+        Prueba de la fecha de cierre de las ofertas de trabajo.
+
+        Verifica que cerrar una oferta de trabajo registre la fecha de
+        cierre y que reabrirla la elimine.
+        """
+        self.assertIsNone(self.open_job_offer.closed_at)
+        response = self.client.put(reverse('close_job_offer', kwargs={'job_offer_id': self.open_job_offer.id}), format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.open_job_offer.refresh_from_db()
+        self.assertIsNotNone(self.open_job_offer.closed_at)
+        self.open_job_offer.is_closed = False
+        self.open_job_offer.save()
+        self.assertIsNone(self.open_job_offer.closed_at)
+
+
+    def test_get_archived_job_offer(self):
+        """
+        Prueba de obtención de una oferta de trabajo archivada.
+
+        Verifica que el detalle de una oferta de trabajo archivada se
+        siga sirviendo desde la tabla de archivo.
+        """
+        call_command('archive_job_offers', '--days', '30', stdout=StringIO())
+        response = self.client.get(reverse('get_job_offer', kwargs={'job_offer_id': self.old_job_offer.id}), format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['job_offer']['id'], str(self.old_job_offer.id))
+        self.assertEqual(response.data['data']['job_offer']['company']['name'], 'Test Company')
+        self.assertIsNotNone(response.data['data']['job_offer']['archived_at'])
+
+
+    def test_get_archived_postulations(self):
+        """
+        Prueba de obtención de las postulaciones de una oferta de trabajo archivada.
+
+        Verifica que las postulaciones archivadas se sigan sirviendo a
+        la compañia creadora de la oferta de trabajo.
+        """
+        call_command('archive_job_offers', '--days', '30', stdout=StringIO())
+        response = self.client.get(reverse('get_postulations', kwargs={'job_offer_id': self.old_job_offer.id}), format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        postulations = response.data['data']['postulations']
+        self.assertEqual(len(postulations), 1)
+        self.assertEqual(postulations[0]['id'], str(self.postulation.id))
+        self.assertEqual(postulations[0]['status'], 'accepted')
@@ -0,0 +1,109 @@
+from io import StringIO
+from datetime import timedelta
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from apps.users.models import CustomUser, Company, Student
+from apps.job_offers.models import JobOffer
+from apps.postulations.models import Postulation
+
+
+class DeduplicatePostulationsTestCase(TestCase):
+    """
+    Test case para el comando de eliminación de postulaciones duplicadas.
+    """
+    def setUp(self):
+        """
+        Configuración inicial de los casos de prueba.
+        """
+        self.user = CustomUser.objects.create_user(
+            username='TestCompany',
+            first_name='TestFirstName',
+            last_name='TestLastName',
+            user_type='company',
+            email='testcompany@email.com',
+            password='TestPassword'
+        )
+        self.company = Company.objects.create(
+            name='Test Company',
+            industry='Tech',
+            location='Test Location',
+            description='Test Description',
+            user=self.user
+        )
+        self.job_offer = JobOffer.objects.create(
+            title='Test Job Offer',
+            location='Test Location',
+            work_mode='hybrid',
+            company=self.company
+        )
+        self.students = []
+        for index in range(2):
+            user = CustomUser.objects.create(
+                username=f'TestStudent{index}',
+                email=f'teststudent{index}@email.com',
+                user_type='student'
+            )
+            self.students.append(Student.objects.create(
+                university='Test University',
+                degree='Test Degree',
+                major='Test Major',
+                graduation_year=2025,
+                professional_experience='Test Experience',
+                about_me='Test About Me',
+                user=user
+            ))
+
+        # Elimina la restricción dentro de la transacción de la prueba para simular una base de datos previa
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'ALTER TABLE {connection.ops.quote_name(Postulation._meta.db_table)} '
+                'DROP CONSTRAINT unique_student_job_offer_postulation'
+            )
+
+
+    def test_deduplicate_postulations(self):
+        """
+        Prueba de eliminación de postulaciones duplicadas.
+
+        Verifica que de cada estudiante se conserve la postulación más
+        antigua y que la reconciliación posterior corrija los contadores de
+        la oferta de trabajo.
+        """
+        postulations = []
+        for days, postulation_status in [(2, 'accepted'), (0, 'pending'), (1, 'rejected')]:
+            postulation = Postulation.objects.create(student=self.students[0], job_offer=self.job_offer, status=postulation_status)
+            Postulation.objects.filter(id=postulation.id).update(applied_at=timezone.now() + timedelta(days=days))
+            postulations.append(postulation)
+        other = Postulation.objects.create(student=self.students[1], job_offer=self.job_offer, status='accepted')
+        JobOffer.objects.filter(id=self.job_offer.id).update(pending_postulations=1, accepted_postulations=2, rejected_postulations=1)
+
+        output = StringIO()
+        call_command('deduplicate_postulations', stdout=output)
+        self.assertIn('2 duplicated postulations deleted.', output.getvalue())
+        self.assertEqual(
+            set(Postulation.objects.values_list('id', flat=True)),
+            {postulations[1].id, other.id}
+        )
+        call_command('reconcile_postulation_counters', stdout=StringIO())
+        self.job_offer.refresh_from_db()
+        self.assertEqual(
+            (self.job_offer.pending_postulations, self.job_offer.accepted_postulations, self.job_offer.rejected_postulations),
+            (1, 1, 0)
+        )
+
+
+    def test_deduplicate_postulations_without_duplicates(self):
+        """
+        Prueba de eliminación de postulaciones sin duplicados.
+
+        Verifica que el comando no elimine postulaciones cuando cada
+        estudiante tiene una sola postulación por oferta de trabajo.
+        """
+        for student in self.students:
+            Postulation.objects.create(student=student, job_offer=self.job_offer)
+        output = StringIO()
+        call_command('deduplicate_postulations', stdout=output)
+        self.assertIn('0 duplicated postulations deleted.', output.getvalue())
+        self.assertEqual(Postulation.objects.count(), 2)
@@ -0,0 +1,184 @@
+import csv
+import json
+from io import StringIO
+from rest_framework.test import APIClient
+from rest_framework import status
+from django.test import TestCase
+from django.urls import reverse
+from apps.users.models import CustomUser, Company, Student
+from apps.job_offers.models import JobOffer
+from apps.postulations.models import Postulation
+from rest_framework.authtoken.models import Token
+
+
+class ExportPostulationsTestCase(TestCase):
+    """
+    Test case para el endpoint de exportación de postulaciones a ofertas de trabajo.
+    """
+    def setUp(self):
+        """
+        Configuración inicial de los casos de prueba.
+        """
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(
+            username='TestCompany',
+            first_name='TestFirstName',
+            last_name='TestLastName',
+            user_type='company',
+            email='testcompany@email.com',
+            password='TestPassword'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.company = Company.objects.create(
+            name='Test Company',
+            industry='Tech',
+            location='Test Location',
+            description='Test Description',
+            user=self.user
+        )
+        self.job_offer = JobOffer.objects.create(
+            title='Test Job Offer',
+            location='Test Location',
+            work_mode='hybrid',
+            company=self.company
+        )
+        self.postulations = []
+        for index in range(3):
+            student_user = CustomUser.objects.create(
+                username=f'TestStudent{index}',
+                first_name=f'Student{index}',
+                email=f'teststudent{index}@email.com',
+                user_type='student'
+            )
+            student = Student.objects.create(
+                university='Test University',
+                degree='Test Degree',
+                major='Test Major',
+                graduation_year=2025,
+                professional_experience='Test Experience, with commas',
+                about_me='Test About Me',
+                user=student_user
+            )
+            self.postulations.append(Postulation.objects.create(student=student, job_offer=self.job_offer))
+        self.url = reverse('export_postulations', kwargs={'job_offer_id': self.job_offer.id})
+
+
+    def test_export_postulations_csv(self):
+        """
+        Prueba de exportación de postulaciones en CSV.
+
+        Verifica que el endpoint responda con un código de estado
+        200 y un CSV en streaming con una fila por postulación y los
+        datos del estudiante.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        rows = list(csv.DictReader(StringIO(b''.join(response.streaming_content).decode('utf-8'))))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(
+            {row['id'] for row in rows},
+            {str(postulation.id) for postulation in self.postulations}
+        )
+        self.assertEqual(rows[0]['professional_experience'], 'Test Experience, with commas')
+        self.assertEqual(rows[0]['email'], 'teststudent0@email.com')
+
+
+    def test_export_postulations_ndjson(self):
+        """
+        Prueba de exportación de postulaciones en NDJSON.
+
+        Verifica que el endpoint responda con un código de estado
+        200 y un objeto JSON por línea para cada postulación.
+        """
+        response = self.client.get(self.url, {'export_format': 'ndjson'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]['status'], 'pending')
+        self.assertEqual(rows[0]['graduation_year'], 2025)
+
+
+    def test_export_postulations_formula_values(self):
+        """
+        Prueba de exportación de postulaciones con valores que empiezan como una fórmula.
+
+        Verifica que en el CSV esos valores se antepongan con un apóstrofo
+        y que en el NDJSON se exporten sin modificar.
+        """
+        Student.objects.update(
+            about_me='=HYPERLINK("http://example.com")',
+            major='@SUM(A1)',
+            degree='-1+1',
+            university='\t=1+1',
+            professional_experience='\r=1+1'
+        )
+        response = self.client.get(self.url)
+        rows = list(csv.DictReader(StringIO(b''.join(response.streaming_content).decode('utf-8'))))
+        self.assertEqual(rows[0]['about_me'], '\'=HYPERLINK("http://example.com")')
+        self.assertEqual(rows[0]['major'], "'@SUM(A1)")
+        self.assertEqual(rows[0]['degree'], "'-1+1")
+        self.assertEqual(rows[0]['university'], "'\t=1+1")
+        self.assertEqual(rows[0]['professional_experience'], "'\r=1+1")
+
+        response = self.client.get(self.url, {'export_format': 'ndjson'})
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode('utf-8').splitlines()]
+        self.assertEqual(rows[0]['about_me'], '=HYPERLINK("http://example.com")')
+
+
+    def test_export_postulations_invalid_format(self):
+        """
+        Prueba de exportación de postulaciones con un formato inválido.
+
+        Verifica que el endpoint responda con un código de estado
+        400 cuando se solicita un formato de exportación no soportado.
+        """
+        response = self.client.get(self.url, {'export_format': 'xml'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue('status' in response.data)
+        self.assertTrue('message' in response.data)
+
+
+    def test_export_postulations_not_creator(self):
+        """
+        Prueba de exportación de postulaciones por un usuario que no es el creador.
+
+        Verifica que el endpoint responda con un código de estado
+        403 cuando la oferta de trabajo no pertenece a la compañia
+        del usuario autenticado.
+        """
+        other_user = CustomUser.objects.create_user(
+            username='OtherCompany',
+            first_name='OtherFirstName',
+            last_name='OtherLastName',
+            user_type='company',
+            email='othercompany@email.com',
+            password='OtherPassword'
+        )
+        Company.objects.create(
+            name='Other Company',
+            industry='Tech',
+            location='Other Location',
+            description='Other Description',
+            user=other_user
+        )
+        other_token = Token.objects.create(user=other_user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + other_token.key)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+    def test_export_postulations_without_token(self):
+        """
+        Prueba de exportación de postulaciones sin token de autenticación.
+
+        Verifica que el endpoint responda con un código de estado
+        401 cuando se intenta exportar sin un token de autenticación.
+        """
+        self.client.credentials()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
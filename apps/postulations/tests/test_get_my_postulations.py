@@ -0,0 +1,206 @@
+from datetime import timedelta
+from io import StringIO
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from apps.users.models import CustomUser, Company, Student
+from apps.job_offers.models import JobOffer
+from apps.postulations.models import Postulation
+from apps.postulations.serializers import StudentPostulationsResponseSerializer
+from rest_framework.authtoken.models import Token
+
+
+class GetMyPostulationsTestCase(TestCase):
+    """
+    Test case para el endpoint de obtención de las postulaciones del estudiante autenticado.
+    """
+    def setUp(self):
+        """
+        Configuración inicial de los casos de prueba.
+        """
+        self.client = APIClient()
+        self.url = reverse('get_my_postulations')
+        self.company_user = CustomUser.objects.create_user(
+            username='TestCompany',
+            first_name='TestFirstName',
+            last_name='TestLastName',
+            user_type='company',
+            email='testcompany@email.com',
+            password='TestPassword'
+        )
+        self.company = Company.objects.create(
+            name='Test Company',
+            industry='Tech',
+            location='Test Location',
+            description='Test Description',
+            user=self.company_user
+        )
+        self.user = CustomUser.objects.create_user(
+            username='TestStudent',
+            first_name='TestFirstName',
+            last_name='TestLastName',
+            user_type='student',
+            email='teststudent@email.com',
+            password='TestPassword'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.student = Student.objects.create(
+            university='Test University',
+            degree='Test Degree',
+            major='Test Major',
+            graduation_year=2025,
+            professional_experience='Test Experience',
+            about_me='Test About Me',
+            user=self.user
+        )
+        self.postulations = []
+        for index in range(3):
+            job_offer = JobOffer.objects.create(
+                title=f'Test Job Offer {index}',
+                location='Test Location',
+                salary=50000 + index,
+                work_mode='hybrid',
+                company=self.company
+            )
+            postulation = Postulation.objects.create(student=self.student, job_offer=job_offer)
+            # Separa las fechas de postulación para que el orden sea determinista
+            Postulation.objects.filter(id=postulation.id).update(applied_at=postulation.applied_at + timedelta(minutes=index))
+            self.postulations.append(postulation)
+
+
+    def test_get_my_postulations_successful(self):
+        """
+        Prueba de obtención de las postulaciones del estudiante exitosa.
+
+        Verifica que el endpoint responda con un código de estado
+        200 y con las postulaciones del estudiante junto con su oferta
+        de trabajo y compañia, de la más reciente a la más antigua.
+        """
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue('status' in response.data)
+        self.assertTrue('message' in response.data)
+        postulations = response.data['data']['postulations']
+        self.assertEqual([postulation['id'] for postulation in postulations], [str(p.id) for p in reversed(self.postulations)])
+        self.assertEqual(postulations[0]['job_offer']['title'], 'Test Job Offer 2')
+        self.assertEqual(postulations[0]['job_offer']['company']['name'], 'Test Company')
+
+
+    def test_get_my_postulations_same_representation(self):
+        """
+        Prueba de representación de las postulaciones del estudiante.
+
+        Verifica que el JSON de las postulaciones sea idéntico al
+        generado por `StudentPostulationsResponseSerializer`.
+        """
+        response = self.client.get(self.url, format='json')
+        expected = StudentPostulationsResponseSerializer(
+            Postulation.objects.filter(student=self.student).order_by('-applied_at', '-id'), many=True
+        ).data
+        self.assertEqual(
+            JSONRenderer().render(response.data['data']['postulations']),
+            JSONRenderer().render(expected)
+        )
+
+
+    def test_get_my_postulations_single_query(self):
+        """
+        Prueba del número de consultas de las postulaciones del estudiante.
+
+        Verifica que las postulaciones, sus ofertas de trabajo y sus
+        compañias se obtengan con una sola consulta.
+        """
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+    def test_get_my_postulations_cursor_pagination(self):
+        """
+        Prueba de paginación por cursor de las postulaciones del estudiante.
+
+        Verifica que los cursores permitan recorrer todas las
+        postulaciones sin repetirlas.
+        """
+        response = self.client.get(self.url, {'page_size': 2}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first_page = [postulation['id'] for postulation in response.data['data']['postulations']]
+        self.assertEqual(len(first_page), 2)
+        next_cursor = response.data['data']['page_info']['cursors']['next']
+        response = self.client.get(self.url, {'page_size': 2, 'cursor': next_cursor}, format='json')
+        second_page = [postulation['id'] for postulation in response.data['data']['postulations']]
+        self.assertEqual(second_page, [str(self.postulations[0].id)])
+        self.assertIsNone(response.data['data']['page_info']['cursors']['next'])
+
+
+    def test_get_my_postulations_archived(self):
+        """
+        Prueba de obtención de las postulaciones archivadas del estudiante.
+
+        Verifica que, después de archivar una oferta de trabajo, su
+        postulación deje de aparecer en el listado habitual y se obtenga
+        al solicitar las postulaciones archivadas.
+        """
+        archived_job_offer_id = self.postulations[0].job_offer_id
+        JobOffer.objects.filter(id=archived_job_offer_id).update(is_closed=True, closed_at=timezone.now() - timedelta(days=365))
+        call_command('archive_job_offers', '--days', '30', stdout=StringIO())
+
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [postulation['id'] for postulation in response.data['data']['postulations']],
+            [str(self.postulations[2].id), str(self.postulations[1].id)]
+        )
+
+        response = self.client.get(self.url, {'archived': 'true'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        postulations = response.data['data']['postulations']
+        self.assertEqual([postulation['id'] for postulation in postulations], [str(self.postulations[0].id)])
+        self.assertEqual(postulations[0]['job_offer']['id'], str(archived_job_offer_id))
+        self.assertEqual(postulations[0]['job_offer']['title'], 'Test Job Offer 0')
+        self.assertEqual(postulations[0]['job_offer']['company']['name'], 'Test Company')
+
+
+    def test_get_my_postulations_invalid_archived(self):
+        """
+        Prueba de obtención de las postulaciones con un parámetro de archivo inválido.
+
+        Verifica que el endpoint responda con un código de estado 400.
+        """
+        response = self.client.get(self.url, {'archived': 'maybe'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue('status' in response.data)
+        self.assertTrue('message' in response.data)
+
+
+    def test_get_my_postulations_non_student_user(self):
+        """
+        Prueba de obtención de las postulaciones con un usuario no estudiante.
+
+        Verifica que el endpoint responda con un código de estado
+        403 cuando el usuario autenticado no es de tipo estudiante.
+        """
+        self.user.user_type = 'company'
+        self.user.save()
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue('status' in response.data)
+        self.assertTrue('message' in response.data)
+
+
+    def test_get_my_postulations_without_token(self):
+        """
+        Prueba de obtención de las postulaciones sin token de autenticación.
+
+        Verifica que el endpoint responda con un código de estado
+        401 cuando se intenta obtener las postulaciones sin un token
+        de autenticación.
+        """
+        self.client.credentials()
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
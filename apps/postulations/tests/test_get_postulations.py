@@ -1,10 +1,17 @@
 from rest_framework.test import APIClient
 from rest_framework import status
+from datetime import timedelta
+from rest_framework.renderers import JSONRenderer
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from django.urls import reverse
 from apps.users.models import CustomUser, Company, Student
 from apps.job_offers.models import JobOffer
 from apps.postulations.models import Postulation
+from apps.postulations.utils.insert_postulation import insert_postulation
+from apps.postulations.serializers import PostulationsResponseSerializer
 from rest_framework.authtoken.models import Token
 
 
@@ -82,6 +89,183 @@ class GetPostulationsTestCase(TestCase):
         self.assertTrue('postulations' in response.data['data'])
 
 
+    def test_get_postulations_same_representation(self):
+        """
+        Prueba de representación de las postulaciones a oferta de trabajo.
+
+        Verifica que el JSON de las postulaciones sea idéntico al
+        generado por `PostulationsResponseSerializer`.
+        """
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        expected = PostulationsResponseSerializer(Postulation.objects.filter(job_offer=self.job_offer), many=True).data
+        self.assertEqual(
+            JSONRenderer().render(response.data['data']['postulations']),
+            JSONRenderer().render(expected)
+        )
+
+
+    def create_postulations(self, statuses):
+        """
+        Crea una postulación por estado, cada una un día después que la anterior.
+
+        Args:
+            statuses (list): Estado de cada postulación.
+
+        Returns:
+            list: Postulaciones creadas.
+        """
+        postulations = []
+        for index, postulation_status in enumerate(statuses):
+            user = CustomUser.objects.create(username=f'TestStudent{index}', email=f'teststudent{index}@email.com', user_type='student')
+            student = Student.objects.create(
+                university='Test University',
+                degree='Test Degree',
+                major='Test Major',
+                graduation_year=2025,
+                professional_experience='Test Experience',
+                about_me='Test About Me',
+                user=user
+            )
+            postulation = Postulation.objects.create(student=student, job_offer=self.job_offer, status=postulation_status)
+            Postulation.objects.filter(id=postulation.id).update(applied_at=timezone.now() + timedelta(days=index + 1))
+            postulations.append(postulation)
+        return postulations
+
+
+    def test_get_postulations_filter_by_status(self):
+        """
+        Prueba de obtención de postulaciones filtradas por estado.
+
+        Verifica que solo se obtengan las postulaciones con el estado
+        solicitado, ordenadas de la más antigua a la más reciente.
+        """
+        pending, _, other_pending = self.create_postulations(['pending', 'accepted', 'pending'])
+        response = self.client.get(self.url, {'status': 'pending'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [postulation['id'] for postulation in response.data['data']['postulations']],
+            [str(self.postulation.id), str(pending.id), str(other_pending.id)]
+        )
+
+
+    def test_get_postulations_sort_newest_first(self):
+        """
+        Prueba de obtención de postulaciones de la más reciente a la más antigua.
+
+        Verifica que el parámetro sort invierta el orden por fecha de postulación.
+        """
+        first, second = self.create_postulations(['accepted', 'rejected'])
+        response = self.client.get(self.url, {'sort': '-applied_at'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [postulation['id'] for postulation in response.data['data']['postulations']],
+            [str(second.id), str(first.id), str(self.postulation.id)]
+        )
+
+
+    def test_get_postulations_sort_by_relevance(self):
+        """
+        Prueba de obtención de postulaciones ordenadas por relevancia.
+
+        Verifica que las postulaciones cuyo perfil coincide con los
+        requisitos de la oferta de trabajo se obtengan primero junto
+        con su relevancia.
+        """
+        JobOffer.objects.filter(id=self.job_offer.id).update(requirements='Python Django PostgreSQL developer')
+        unrelated, related = self.create_postulations(['pending', 'pending'])
+        Student.objects.filter(id=related.student_id).update(professional_experience='Python and Django developer')
+        Student.objects.filter(id=unrelated.student_id).update(professional_experience='Graphic design')
+        response = self.client.get(self.url, {'sort': 'relevance'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        postulations = response.data['data']['postulations']
+        self.assertEqual(postulations[0]['id'], str(related.id))
+        self.assertGreater(postulations[0]['relevance'], postulations[1]['relevance'])
+        self.assertGreaterEqual(postulations[1]['relevance'], postulations[2]['relevance'])
+        self.assertEqual(response.data['data']['page_info']['count'], 3)
+
+
+    def test_get_postulations_relevance_cache(self):
+        """
+        Prueba de la caché de la relevancia de las postulaciones.
+
+        Verifica que la relevancia se reutilice entre peticiones y que se
+        recalcule al modificar el perfil de un estudiante postulado.
+        """
+        JobOffer.objects.filter(id=self.job_offer.id).update(requirements='Python developer')
+        self.client.get(self.url, {'sort': 'relevance'}, format='json')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'sort': 'relevance'}, format='json')
+        self.assertFalse(any(
+            'about_me' in query['sql'] and Postulation._meta.db_table in query['sql']
+            for query in queries.captured_queries
+        ))
+        relevance = response.data['data']['postulations'][0]['relevance']
+
+        self.student.about_me = 'Python developer'
+        self.student.save()
+        response = self.client.get(self.url, {'sort': 'relevance'}, format='json')
+        self.assertGreater(response.data['data']['postulations'][0]['relevance'], relevance)
+
+
+    def test_get_postulations_relevance_cache_new_postulation(self):
+        """
+        Prueba de la caché de la relevancia al recibir una postulación.
+
+        Verifica que la relevancia se recalcule cuando la oferta de trabajo
+        recibe una postulación nueva, aunque su fecha de actualización no cambie.
+        """
+        self.client.get(self.url, {'sort': 'relevance'}, format='json')
+        user = CustomUser.objects.create(username='TestStudentNew', email='teststudentnew@email.com', user_type='student')
+        student = Student.objects.create(
+            university='Test University',
+            degree='Test Degree',
+            major='Test Major',
+            graduation_year=2025,
+            professional_experience='Test Experience',
+            about_me='Test About Me',
+            user=user
+        )
+        self.assertEqual(insert_postulation(self.job_offer.id, student.id), 'created')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'sort': 'relevance'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['postulations']), 2)
+        self.assertTrue(any(
+            'about_me' in query['sql'] and Postulation._meta.db_table in query['sql']
+            for query in queries.captured_queries
+        ))
+
+
+    def test_get_postulations_invalid_filters(self):
+        """
+        Prueba de obtención de postulaciones con parámetros inválidos.
+
+        Verifica que el endpoint responda con un código de estado
+        400 cuando el estado o el ordenamiento no son válidos.
+        """
+        for params in ({'status': 'unknown'}, {'sort': 'id'}):
+            response = self.client.get(self.url, params, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertTrue('status' in response.data)
+            self.assertTrue('message' in response.data)
+
+
+    def test_get_postulations_status_index(self):
+        """
+        Prueba del índice de las postulaciones por estado.
+
+        Verifica que la página de postulaciones de un estado se obtenga
+        recorriendo el índice compuesto, sin ordenar los resultados.
+        """
+        postulations = Postulation.objects.filter(job_offer=self.job_offer, status='pending').order_by('applied_at', 'id')[:50]
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = postulations.explain()
+        self.assertIn('postulation_offer_status_idx', plan)
+        self.assertNotIn('Sort', plan)
+
+
     def test_get_postulations_invalid_uuid(self):
         """
         Prueba de obtención de postulaciones a oferta de trabajo con UUID inválido.
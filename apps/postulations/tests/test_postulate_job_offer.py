@@ -1,10 +1,13 @@
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.test import TestCase
+from django.db import IntegrityError, transaction
 from django.urls import reverse
 from apps.users.models import CustomUser, Student, Company
 from apps.job_offers.models import JobOffer
+from apps.job_offers.utils.job_offer_cache import get_job_offers_generation, get_postulations_version
 from apps.postulations.models import Postulation
+from apps.core.models import OutboxEvent
 from rest_framework.authtoken.models import Token
 
 
@@ -77,6 +80,58 @@ class PostulateJobOfferTestCase(TestCase):
         self.assertTrue(Postulation.objects.filter(student=self.student, job_offer=self.job_offer).exists())
 
 
+    def test_postulate_job_offer_increments_counter(self):
+        """
+        Prueba del contador de postulaciones al postularse a una oferta de trabajo.
+
+        Verifica que la postulación incremente el contador de postulaciones
+        pendientes de la oferta de trabajo y que se refleje en su detalle.
+        """
+        response = self.client.post(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.job_offer.refresh_from_db()
+        self.assertEqual(self.job_offer.pending_postulations, 1)
+        self.assertEqual(self.job_offer.accepted_postulations, 0)
+        response = self.client.get(reverse('get_job_offer', kwargs={'job_offer_id': self.job_offer.id}), format='json')
+        self.assertEqual(response.data['data']['job_offer']['pending_postulations'], 1)
+
+
+    def test_postulate_job_offer_keeps_job_offer_version(self):
+        """
+        Prueba de la versión de la oferta de trabajo al postularse.
+
+        Verifica que la postulación solo modifique los contadores, sin
+        cambiar la fecha de actualización de la oferta de trabajo ni la
+        generación del listado, y que cambie la versión de sus postulaciones.
+        """
+        updated_at = self.job_offer.updated_at
+        generation = get_job_offers_generation()
+        postulations_version = get_postulations_version(self.job_offer.id)
+        response = self.client.post(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.job_offer.refresh_from_db()
+        self.assertEqual(self.job_offer.updated_at, updated_at)
+        self.assertEqual(get_job_offers_generation(), generation)
+        self.assertNotEqual(get_postulations_version(self.job_offer.id), postulations_version)
+
+
+    def test_postulate_job_offer_publishes_event(self):
+        """
+        Prueba del evento de dominio al postularse a una oferta de trabajo.
+
+        Verifica que la postulación registre un evento 'postulation.created'
+        en la tabla outbox y que una postulación duplicada no registre otro.
+        """
+        self.client.post(self.url, format='json')
+        self.client.post(self.url, format='json')
+        postulation = Postulation.objects.get(student=self.student, job_offer=self.job_offer)
+        event = OutboxEvent.objects.get()
+        self.assertEqual(event.event_type, 'postulation.created')
+        self.assertEqual(event.payload['postulation_id'], str(postulation.id))
+        self.assertEqual(event.payload['job_offer_id'], str(self.job_offer.id))
+        self.assertIsNone(event.processed_at)
+
+
     def test_postulate_job_offer_invalid_uuid(self):
         """
         Prueba de postulación a oferta de trabajo con UUID inválido.
@@ -165,6 +220,24 @@ class PostulateJobOfferTestCase(TestCase):
         self.assertTrue('message' in response.data)
 
 
+    def test_postulate_job_offer_duplicate_not_created(self):
+        """
+        Prueba de postulación repetida a oferta de trabajo.
+
+        Verifica que una segunda postulación del mismo estudiante no se
+        inserte ni incremente el contador de la oferta de trabajo, y que
+        la base de datos rechace los duplicados creados por otras vías.
+        """
+        self.client.post(self.url, format='json')
+        response = self.client.post(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Postulation.objects.filter(student=self.student, job_offer=self.job_offer).count(), 1)
+        self.job_offer.refresh_from_db()
+        self.assertEqual(self.job_offer.pending_postulations, 1)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Postulation.objects.create(student=self.student, job_offer=self.job_offer)
+
+
     def test_postulate_job_offer_without_token(self):
         """
         Prueba de postulación a oferta de trabajo sin token de autenticación.
@@ -0,0 +1,49 @@
+from django.test import SimpleTestCase
+from apps.postulations.utils.rank_postulations import compute_relevance_scores, tokenize
+
+
+class RankPostulationsTestCase(SimpleTestCase):
+    """
+    Test case para el cálculo de la relevancia de las postulaciones.
+    """
+    def test_tokenize(self):
+        """
+        Prueba de la separación de un texto en términos.
+
+        Verifica que los términos se obtengan en minúsculas, sin acentos
+        y sin los términos de un solo carácter.
+        """
+        self.assertEqual(tokenize('Ingeniería de Software, C y Python3'), ['ingenieria', 'de', 'software', 'python3'])
+        self.assertEqual(tokenize(None), [])
+
+
+    def test_compute_relevance_scores(self):
+        """
+        Prueba del cálculo de la similitud TF-IDF.
+
+        Verifica que un documento idéntico a la consulta tenga similitud 1,
+        que un documento sin términos en común tenga similitud 0 y que un
+        documento más parecido tenga mayor similitud.
+        """
+        scores = compute_relevance_scores('python django developer', [
+            'graphic design',
+            'python developer',
+            'python django developer',
+            '',
+        ])
+        self.assertEqual(len(scores), 4)
+        self.assertEqual(scores[0], 0)
+        self.assertAlmostEqual(scores[2], 1)
+        self.assertGreater(scores[2], scores[1])
+        self.assertGreater(scores[1], 0)
+        self.assertEqual(scores[3], 0)
+
+
+    def test_compute_relevance_scores_empty(self):
+        """
+        Prueba del cálculo de la similitud sin documentos ni consulta.
+
+        Verifica que no se produzcan errores y que todas las similitudes sean 0.
+        """
+        self.assertEqual(len(compute_relevance_scores('python', [])), 0)
+        self.assertEqual(compute_relevance_scores('', ['python developer']).tolist(), [0])
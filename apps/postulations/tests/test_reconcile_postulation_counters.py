@@ -0,0 +1,89 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from apps.users.models import CustomUser, Company, Student
+from apps.job_offers.models import JobOffer
+from apps.postulations.models import Postulation
+
+
+class ReconcilePostulationCountersTestCase(TestCase):
+    """
+    Test case para el comando de reconciliación de los contadores de postulaciones.
+    """
+    def setUp(self):
+        """
+        Configuración inicial de los casos de prueba.
+        """
+        self.user = CustomUser.objects.create_user(
+            username='TestCompany',
+            first_name='TestFirstName',
+            last_name='TestLastName',
+            user_type='company',
+            email='testcompany@email.com',
+            password='TestPassword'
+        )
+        self.company = Company.objects.create(
+            name='Test Company',
+            industry='Tech',
+            location='Test Location',
+            description='Test Description',
+            user=self.user
+        )
+        self.job_offers = [
+            JobOffer.objects.create(
+                title=f'Test Job Offer {index}',
+                location='Test Location',
+                work_mode='hybrid',
+                company=self.company
+            )
+            for index in range(3)
+        ]
+        for index, postulation_status in enumerate(['pending', 'accepted', 'rejected', 'pending']):
+            user = CustomUser.objects.create(
+                username=f'TestStudent{index}',
+                email=f'teststudent{index}@email.com',
+                user_type='student'
+            )
+            student = Student.objects.create(
+                university='Test University',
+                degree='Test Degree',
+                major='Test Major',
+                graduation_year=2025,
+                professional_experience='Test Experience',
+                about_me='Test About Me',
+                user=user
+            )
+            Postulation.objects.create(student=student, job_offer=self.job_offers[0], status=postulation_status)
+
+
+    def test_reconcile_postulation_counters(self):
+        """
+        Prueba de reconciliación de contadores con diferencias.
+
+        Verifica que el comando corrija los contadores que no coinciden
+        con las postulaciones existentes recorriendo todos los lotes.
+        """
+        JobOffer.objects.filter(id=self.job_offers[1].id).update(rejected_postulations=5)
+        output = StringIO()
+        call_command('reconcile_postulation_counters', batch_size=1, stdout=output)
+        self.assertIn('2 job offers reconciled.', output.getvalue())
+        counters = {
+            job_offer.id: (job_offer.pending_postulations, job_offer.accepted_postulations, job_offer.rejected_postulations)
+            for job_offer in JobOffer.objects.all()
+        }
+        self.assertEqual(counters[self.job_offers[0].id], (2, 1, 1))
+        self.assertEqual(counters[self.job_offers[1].id], (0, 0, 0))
+        self.assertEqual(counters[self.job_offers[2].id], (0, 0, 0))
+
+
+    def test_reconcile_postulation_counters_without_drift(self):
+        """
+        Prueba de reconciliación de contadores sin diferencias.
+
+        Verifica que el comando no modifique ofertas de trabajo cuando
+        los contadores ya coinciden con las postulaciones existentes.
+        """
+        call_command('reconcile_postulation_counters', stdout=StringIO())
+        output = StringIO()
+        call_command('reconcile_postulation_counters', stdout=output)
+        self.assertIn('0 job offers reconciled.', output.getvalue())
@@ -81,6 +81,32 @@ class WithdrawPostulationTestCase(TestCase):
         self.assertFalse(Postulation.objects.filter(student=self.student, job_offer=self.job_offer).exists())
 
 
+    def test_withdraw_postulation_decrements_counter(self):
+        """
+        Prueba del contador de postulaciones al retirar una postulación.
+
+        Verifica que retirar la postulación decremente el contador del
+        estado que tenía la postulación en la oferta de trabajo.
+        """
+        JobOffer.objects.filter(id=self.job_offer.id).update(pending_postulations=1)
+        response = self.client.delete(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.job_offer.refresh_from_db()
+        self.assertEqual(self.job_offer.pending_postulations, 0)
+
+
+    def test_withdraw_postulation_single_statement(self):
+        """
+        Prueba del número de consultas al retirar una postulación.
+
+        Verifica que, además de la autenticación y del perfil del estudiante,
+        el retiro y la actualización del contador se resuelvan con una sola sentencia.
+        """
+        with self.assertNumQueries(3):
+            response = self.client.delete(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
     def test_withdraw_postulation_invalid_uuid(self):
         """
         Prueba de retiro de postulación a oferta de trabajo con UUID inválido.
@@ -0,0 +1,90 @@
+from django.db import transaction
+from django.utils import timezone
+from apps.core.utils.outbox import publish_events
+from apps.postulations.models import Postulation
+from apps.postulations.utils.update_postulation_counters import update_postulation_counters
+
+
+# Estado de la postulación que corresponde a cada acción
+ACTION_STATUSES = {
+    'accept': 'accepted',
+    'reject': 'rejected',
+}
+
+
+def apply_postulation_decisions(job_offer_id, decisions):
+    """
+    Aplica en una sola transacción las decisiones de una compañia sobre las
+    postulaciones de una oferta de trabajo.
+
+    Las postulaciones se clasifican con una sola consulta que las bloquea y
+    se actualizan con una sentencia `UPDATE` por cada estado de destino,
+    restringida a las postulaciones de la oferta de trabajo. Los contadores
+    de la oferta de trabajo se ajustan con las transiciones de estado y
+    cada transición se registra como un evento 'postulation.status_changed'.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+        decisions (dict): Acción ('accept' o 'reject') por ID de postulación.
+
+    Returns:
+        list: Resultado por postulación ('updated', 'not_found' o 'wrong_job_offer').
+    """
+    with transaction.atomic():
+        # Obtiene y bloquea la oferta de trabajo y el estado de cada postulación existente
+        job_offers_by_postulation = {}
+        statuses_by_postulation = {}
+        for postulation_id, postulation_job_offer_id, postulation_status in Postulation.objects.select_for_update().filter(
+            id__in=list(decisions)
+        ).values_list('id', 'job_offer_id', 'status'):
+            job_offers_by_postulation[str(postulation_id)] = str(postulation_job_offer_id)
+            statuses_by_postulation[str(postulation_id)] = postulation_status
+
+        # Agrupa las postulaciones de la oferta de trabajo por estado de destino
+        ids_by_status = {}
+        deltas = {}
+        events = []
+        for postulation_id, action in decisions.items():
+            if job_offers_by_postulation.get(postulation_id) != str(job_offer_id):
+                continue
+            new_status = ACTION_STATUSES[action]
+            ids_by_status.setdefault(new_status, []).append(postulation_id)
+
+            # Registra la transición de estado para los contadores
+            old_status = statuses_by_postulation[postulation_id]
+            if old_status != new_status:
+                deltas[old_status] = deltas.get(old_status, 0) - 1
+                deltas[new_status] = deltas.get(new_status, 0) + 1
+                events.append({
+                    'postulation_id': postulation_id,
+                    'job_offer_id': job_offer_id,
+                    'previous_status': old_status,
+                    'status': new_status,
+                })
+
+        # Actualiza las postulaciones de cada estado con una sola sentencia
+        now = timezone.now()
+        for new_status, postulation_ids in ids_by_status.items():
+            Postulation.objects.filter(id__in=postulation_ids, job_offer_id=job_offer_id).update(
+                status=new_status,
+                updated_at=now
+            )
+
+        # Ajusta los contadores de postulaciones de la oferta de trabajo
+        update_postulation_counters(job_offer_id, deltas)
+
+        # Registra las transiciones de estado en la tabla outbox
+        publish_events('postulation.status_changed', events)
+
+    # Obtiene el resultado de cada postulación
+    results = []
+    for postulation_id in decisions:
+        postulation_job_offer_id = job_offers_by_postulation.get(postulation_id)
+        if postulation_job_offer_id is None:
+            result = 'not_found'
+        elif postulation_job_offer_id != str(job_offer_id):
+            result = 'wrong_job_offer'
+        else:
+            result = 'updated'
+        results.append({'id': postulation_id, 'result': result})
+    return results
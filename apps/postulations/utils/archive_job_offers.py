@@ -0,0 +1,75 @@
+from django.db import connection, transaction
+from apps.job_offers.models import JobOffer, ArchivedJobOffer
+from apps.job_offers.utils.job_offer_cache import invalidate_job_offer_cache
+from apps.postulations.models import Postulation, ArchivedPostulation
+
+
+def get_archived_columns(model):
+    """
+    Obtiene las columnas que un modelo archivado comparte con su tabla principal.
+
+    Args:
+        model (Model): Modelo archivado.
+
+    Returns:
+        str: Columnas separadas por comas.
+    """
+    return ', '.join(
+        connection.ops.quote_name(field.column)
+        for field in model._meta.concrete_fields
+        if field.name != 'archived_at'
+    )
+
+
+def archive_job_offers(closed_before, batch_size):
+    """
+    Mueve un lote de ofertas de trabajo cerradas antes de una fecha, junto
+    con sus postulaciones, a las tablas de archivo con una sola sentencia.
+
+    Las ofertas de trabajo del lote se bloquean con `FOR UPDATE SKIP LOCKED`,
+    por lo que una oferta modificada de forma concurrente queda para el
+    siguiente lote. Las ofertas cerradas sin fecha de cierre usan su fecha
+    de actualización.
+
+    Args:
+        closed_before (datetime): Fecha de cierre límite de las ofertas de trabajo a archivar.
+        batch_size (int): Cantidad máxima de ofertas de trabajo del lote.
+
+    Returns:
+        tuple: IDs de las ofertas de trabajo archivadas y cantidad de postulaciones archivadas.
+    """
+    job_offer_table = connection.ops.quote_name(JobOffer._meta.db_table)
+    archived_job_offer_table = connection.ops.quote_name(ArchivedJobOffer._meta.db_table)
+    postulation_table = connection.ops.quote_name(Postulation._meta.db_table)
+    archived_postulation_table = connection.ops.quote_name(ArchivedPostulation._meta.db_table)
+    job_offer_columns = get_archived_columns(ArchivedJobOffer)
+    postulation_columns = get_archived_columns(ArchivedPostulation)
+    sql = f"""
+        WITH batch AS (
+            SELECT id FROM {job_offer_table}
+            WHERE is_closed AND COALESCE(closed_at, updated_at) < %s
+            ORDER BY id
+            LIMIT %s
+            FOR UPDATE SKIP LOCKED
+        ), moved_job_offers AS (
+            DELETE FROM {job_offer_table} WHERE id IN (SELECT id FROM batch)
+            RETURNING {job_offer_columns}
+        ), archived_job_offers AS (
+            INSERT INTO {archived_job_offer_table} ({job_offer_columns}, archived_at)
+            SELECT {job_offer_columns}, NOW() FROM moved_job_offers
+        ), moved_postulations AS (
+            DELETE FROM {postulation_table} WHERE job_offer_id IN (SELECT id FROM batch)
+            RETURNING {postulation_columns}
+        ), archived_postulations AS (
+            INSERT INTO {archived_postulation_table} ({postulation_columns})
+            SELECT {postulation_columns} FROM moved_postulations
+        )
+        SELECT ARRAY(SELECT id::text FROM moved_job_offers), (SELECT COUNT(*) FROM moved_postulations)
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(sql, [closed_before, batch_size])
+        job_offer_ids, postulation_count = cursor.fetchone()
+
+        # La sentencia no pasa por delete(), por lo que invalida la caché de las ofertas de trabajo
+        invalidate_job_offer_cache(job_offer_ids)
+    return job_offer_ids, postulation_count
@@ -0,0 +1,56 @@
+from django.db import connection
+from apps.job_offers.models import JobOffer
+from apps.job_offers.utils.job_offer_cache import postulation_counters_changed
+from apps.postulations.models import Postulation
+
+
+def delete_postulation(job_offer_id, student_id):
+    """
+    Elimina la postulación de un estudiante a una oferta de trabajo abierta
+    con una sola sentencia.
+
+    La sentencia solo elimina si la oferta de trabajo existe y no está
+    cerrada, y decrementa el contador de postulaciones de la oferta de
+    trabajo que corresponde al estado de la postulación eliminada.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+        student_id (int): ID del estudiante.
+
+    Returns:
+        str: Resultado de la eliminación ('deleted', 'not_found', 'closed' o 'not_applied').
+    """
+    job_offer_table = connection.ops.quote_name(JobOffer._meta.db_table)
+    postulation_table = connection.ops.quote_name(Postulation._meta.db_table)
+    counters = ', '.join(
+        f"{counter_field} = GREATEST({counter_field} - (SELECT COUNT(*) FROM deleted WHERE status = '{postulation_status}'), 0)"
+        for postulation_status, counter_field in JobOffer.POSTULATION_COUNTER_FIELDS.items()
+    )
+    sql = f"""
+        WITH job_offer AS (
+            SELECT id, is_closed FROM {job_offer_table} WHERE id = %s
+        ), deleted AS (
+            DELETE FROM {postulation_table}
+            WHERE student_id = %s AND job_offer_id IN (SELECT id FROM job_offer WHERE NOT is_closed)
+            RETURNING status
+        ), counter AS (
+            UPDATE {job_offer_table}
+            SET {counters}
+            WHERE id IN (SELECT id FROM job_offer) AND EXISTS (SELECT 1 FROM deleted)
+        )
+        SELECT (SELECT is_closed FROM job_offer), EXISTS (SELECT 1 FROM deleted)
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [job_offer_id, student_id])
+        is_closed, deleted = cursor.fetchone()
+
+    if is_closed is None:
+        return 'not_found'
+    if is_closed:
+        return 'closed'
+    if not deleted:
+        return 'not_applied'
+
+    # La sentencia no pasa por save(), por lo que registra el cambio de los contadores
+    postulation_counters_changed(job_offer_id)
+    return 'deleted'
@@ -0,0 +1,68 @@
+from uuid import uuid4
+from django.db import connection, transaction
+from apps.job_offers.models import JobOffer
+from apps.core.utils.outbox import publish_event
+from apps.job_offers.utils.job_offer_cache import postulation_counters_changed
+from apps.postulations.models import Postulation
+
+
+def insert_postulation(job_offer_id, student_id, postulation_status='pending'):
+    """
+    Inserta la postulación de un estudiante a una oferta de trabajo abierta
+    con una sola sentencia.
+
+    La sentencia solo inserta si la oferta de trabajo existe y no está
+    cerrada, descarta los duplicados con `ON CONFLICT DO NOTHING` sobre la
+    restricción única (estudiante, oferta de trabajo) e incrementa el
+    contador de postulaciones de la oferta de trabajo. El evento
+    'postulation.created' se registra en la misma transacción.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+        student_id (int): ID del estudiante.
+        postulation_status (str): Estado inicial de la postulación, opcional.
+
+    Returns:
+        str: Resultado de la inserción ('created', 'not_found', 'closed' o 'duplicate').
+    """
+    job_offer_table = connection.ops.quote_name(JobOffer._meta.db_table)
+    postulation_table = connection.ops.quote_name(Postulation._meta.db_table)
+    counter_field = JobOffer.POSTULATION_COUNTER_FIELDS[postulation_status]
+    sql = f"""
+        WITH job_offer AS (
+            SELECT id, is_closed FROM {job_offer_table} WHERE id = %s
+        ), inserted AS (
+            INSERT INTO {postulation_table} (id, status, student_id, job_offer_id, applied_at, updated_at)
+            SELECT %s, %s, %s, job_offer.id, NOW(), NOW() FROM job_offer WHERE NOT job_offer.is_closed
+            ON CONFLICT (student_id, job_offer_id) DO NOTHING
+            RETURNING job_offer_id
+        ), counter AS (
+            UPDATE {job_offer_table}
+            SET {counter_field} = {counter_field} + 1
+            WHERE id IN (SELECT job_offer_id FROM inserted)
+        )
+        SELECT (SELECT is_closed FROM job_offer), EXISTS (SELECT 1 FROM inserted)
+    """
+    postulation_id = uuid4()
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [job_offer_id, postulation_id, postulation_status, student_id])
+            is_closed, created = cursor.fetchone()
+
+        if is_closed is None:
+            return 'not_found'
+        if is_closed:
+            return 'closed'
+        if not created:
+            return 'duplicate'
+
+        publish_event('postulation.created', {
+            'postulation_id': postulation_id,
+            'job_offer_id': job_offer_id,
+            'student_id': student_id,
+            'status': postulation_status,
+        })
+
+    # La sentencia no pasa por save(), por lo que registra el cambio de los contadores
+    postulation_counters_changed(job_offer_id)
+    return 'created'
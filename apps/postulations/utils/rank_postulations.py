@@ -0,0 +1,142 @@
+import re
+import unicodedata
+from itertools import chain
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from apps.job_offers.utils.job_offer_cache import get_postulations_version
+
+
+# Campos del perfil del estudiante que se comparan con la oferta de trabajo
+PROFILE_FIELDS = ['student__major', 'student__degree', 'student__professional_experience', 'student__about_me']
+
+# Expresión que separa un texto normalizado en términos
+TERM_PATTERN = re.compile(r'[a-z0-9]{2,}')
+
+
+def tokenize(text):
+    """
+    Separa un texto en términos en minúsculas y sin acentos.
+
+    Args:
+        text (str): Texto a separar.
+
+    Returns:
+        list: Términos del texto.
+    """
+    text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode('ascii')
+    return TERM_PATTERN.findall(text.lower())
+
+
+def compute_relevance_scores(query, documents):
+    """
+    Calcula la similitud del coseno entre los vectores TF-IDF de un texto
+    de consulta y de cada documento.
+
+    Los documentos se representan como una matriz dispersa en formato de
+    coordenadas (documento, término, peso), por lo que todo el conjunto se
+    puntúa con operaciones vectorizadas de NumPy sin construir la matriz densa.
+    La frecuencia de los términos es sublineal y el IDF se suaviza sobre
+    el conjunto de documentos.
+
+    Args:
+        query (str): Texto de consulta.
+        documents (list): Textos de los documentos.
+
+    Returns:
+        ndarray: Similitud de cada documento con la consulta, entre 0 y 1.
+    """
+    document_count = len(documents)
+    vocabulary = {}
+    document_terms = [[vocabulary.setdefault(term, len(vocabulary)) for term in tokenize(document)] for document in documents]
+    query_terms = [vocabulary.setdefault(term, len(vocabulary)) for term in tokenize(query)]
+    term_count = len(vocabulary)
+    if not document_count or not term_count:
+        return np.zeros(document_count)
+
+    # Cuenta cada par (documento, término) con una sola ordenación
+    lengths = np.fromiter(map(len, document_terms), dtype=np.int64, count=document_count)
+    term_ids = np.fromiter(chain.from_iterable(document_terms), dtype=np.int64, count=int(lengths.sum()))
+    document_ids = np.repeat(np.arange(document_count, dtype=np.int64), lengths)
+    pairs, counts = np.unique(document_ids * term_count + term_ids, return_counts=True)
+    pair_documents, pair_terms = np.divmod(pairs, term_count)
+
+    # Pondera los términos con la frecuencia sublineal y el IDF suavizado
+    document_frequency = np.bincount(pair_terms, minlength=term_count)
+    idf = np.log((1 + document_count) / (1 + document_frequency)) + 1
+    weights = (1 + np.log(counts)) * idf[pair_terms]
+
+    query_ids, query_counts = np.unique(np.array(query_terms, dtype=np.int64), return_counts=True)
+    query_weights = np.zeros(term_count)
+    query_weights[query_ids] = (1 + np.log(query_counts)) * idf[query_ids]
+
+    # Calcula el producto punto y las normas de todos los documentos a la vez
+    dots = np.bincount(pair_documents, weights=weights * query_weights[pair_terms], minlength=document_count)
+    norms = np.sqrt(np.bincount(pair_documents, weights=weights ** 2, minlength=document_count)) * np.linalg.norm(query_weights)
+    return np.divide(dots, norms, out=np.zeros(document_count), where=norms > 0)
+
+
+def get_relevance_cache_key(job_offer_id):
+    """
+    Obtiene la llave de la caché de la relevancia de las postulaciones a una oferta de trabajo.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+
+    Returns:
+        str: Llave de la caché.
+    """
+    return f'postulations:relevance:{job_offer_id}'
+
+
+def invalidate_relevance_cache(job_offer_ids):
+    """
+    Elimina de la caché la relevancia de las postulaciones a las ofertas de trabajo.
+
+    Args:
+        job_offer_ids (list): IDs de las ofertas de trabajo.
+
+    Returns:
+        None
+    """
+    cache.delete_many([get_relevance_cache_key(job_offer_id) for job_offer_id in job_offer_ids])
+
+
+def get_relevance_scores(job_offer, postulation_model):
+    """
+    Obtiene la relevancia de cada postulación a una oferta de trabajo,
+    comparando el perfil del estudiante con los requisitos y la descripción
+    de la oferta.
+
+    Las puntuaciones se guardan en la caché junto con la fecha de la última
+    modificación de la oferta de trabajo y la versión de sus postulaciones,
+    que cambia con cada postulación nueva, retirada o decidida, de modo que
+    una versión anterior se descarta sin invalidarla explícitamente.
+
+    Args:
+        job_offer (JobOffer | ArchivedJobOffer): Oferta de trabajo.
+        postulation_model (Model): Modelo de las postulaciones de la oferta de trabajo.
+
+    Returns:
+        dict: Relevancia por ID de postulación.
+    """
+    cache_key = get_relevance_cache_key(job_offer.id)
+    version = [job_offer.updated_at.isoformat(), get_postulations_version(job_offer.id)]
+
+    # Retorna las puntuaciones de la caché si corresponden a la versión actual de la oferta
+    cached = cache.get(cache_key)
+    if cached is not None and cached['version'] == version:
+        return cached['scores']
+
+    # Obtiene el perfil del estudiante de todas las postulaciones con una sola consulta
+    rows = postulation_model.objects.filter(job_offer=job_offer.id).values_list('id', *PROFILE_FIELDS)
+    postulation_ids = []
+    documents = []
+    for postulation_id, *profile in rows:
+        postulation_ids.append(str(postulation_id))
+        documents.append(' '.join(value for value in profile if value))
+
+    query = ' '.join(value for value in (job_offer.requirements, job_offer.description) if value)
+    scores = dict(zip(postulation_ids, compute_relevance_scores(query, documents).round(6).tolist()))
+    cache.set(cache_key, {'version': version, 'scores': scores}, settings.POSTULATION_RELEVANCE_CACHE_TIMEOUT)
+    return scores
@@ -0,0 +1,99 @@
+import csv
+import json
+from datetime import datetime
+from uuid import UUID
+
+
+# Columnas de la exportación y su ruta en la consulta de postulaciones
+EXPORT_COLUMNS = {
+    'id': 'id',
+    'status': 'status',
+    'applied_at': 'applied_at',
+    'updated_at': 'updated_at',
+    'student_id': 'student__id',
+    'first_name': 'student__user__first_name',
+    'last_name': 'student__user__last_name',
+    'email': 'student__user__email',
+    'university': 'student__university',
+    'degree': 'student__degree',
+    'major': 'student__major',
+    'graduation_year': 'student__graduation_year',
+    'professional_experience': 'student__professional_experience',
+    'cv': 'student__cv',
+    'about_me': 'student__about_me',
+}
+
+# Cantidad de filas que se leen del cursor del servidor en cada viaje a la base de datos
+EXPORT_CHUNK_SIZE = 2000
+
+# Caracteres iniciales que las hojas de cálculo interpretan como una fórmula
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class EchoBuffer:
+    """
+    Buffer que retorna el texto escrito en lugar de guardarlo, para que
+    `csv.writer` genere cada línea sin acumular el archivo en memoria.
+    """
+    def write(self, value):
+        """
+        Retorna el texto escrito.
+
+        Args:
+            value (str): Texto escrito por el escritor de CSV.
+
+        Returns:
+            str: Texto escrito.
+        """
+        return value
+
+
+def format_export_value(value, export_format):
+    """
+    Convierte un valor de la base de datos a su representación en la exportación.
+
+    En el formato CSV los textos que empiezan como una fórmula se anteponen
+    con un apóstrofo, para que las hojas de cálculo no los ejecuten.
+
+    Args:
+        value (object): Valor de la columna.
+        export_format (str): Formato de la exportación ('csv' o 'ndjson').
+
+    Returns:
+        object: Valor convertido.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if export_format == 'csv' and isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_postulations(postulations, export_format):
+    """
+    Genera la exportación de las postulaciones línea por línea.
+
+    Las filas se leen con un cursor del servidor en bloques de
+    `EXPORT_CHUNK_SIZE`, por lo que la memoria usada no depende de la
+    cantidad de postulaciones.
+
+    Args:
+        postulations (QuerySet): Postulaciones a exportar.
+        export_format (str): Formato de la exportación ('csv' o 'ndjson').
+
+    Returns:
+        generator: Líneas de la exportación.
+    """
+    columns = list(EXPORT_COLUMNS)
+    rows = postulations.values_list(*EXPORT_COLUMNS.values()).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+    if export_format == 'csv':
+        writer = csv.writer(EchoBuffer())
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow([format_export_value(value, export_format) for value in row])
+    else:
+        for row in rows:
+            yield json.dumps(dict(zip(columns, [format_export_value(value, export_format) for value in row]))) + '\n'
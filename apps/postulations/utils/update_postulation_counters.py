@@ -0,0 +1,32 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+from apps.job_offers.models import JobOffer
+from apps.job_offers.utils.job_offer_cache import postulation_counters_changed
+
+
+def update_postulation_counters(job_offer_id, deltas):
+    """
+    Actualiza atómicamente los contadores de postulaciones de una oferta de
+    trabajo con una sola sentencia `UPDATE`.
+
+    Los contadores nunca bajan de cero, de modo que una diferencia previa
+    no impide la operación y queda para el comando de reconciliación. Solo
+    se modifican los contadores, no la fecha de actualización de la oferta
+    de trabajo, y se registra el cambio en la versión de sus postulaciones.
+
+    Args:
+        job_offer_id (str): ID de la oferta de trabajo.
+        deltas (dict): Variación del contador por estado de la postulación.
+
+    Returns:
+        None
+    """
+    changes = {
+        JobOffer.POSTULATION_COUNTER_FIELDS[postulation_status]: Greatest(F(JobOffer.POSTULATION_COUNTER_FIELDS[postulation_status]) + delta, 0)
+        for postulation_status, delta in deltas.items()
+        if delta
+    }
+    if not changes:
+        return
+    JobOffer.objects.filter(id=job_offer_id).update(**changes)
+    postulation_counters_changed(job_offer_id)
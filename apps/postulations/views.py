@@ -1,24 +1,55 @@
+import uuid
+from django.http import StreamingHttpResponse
 from rest_framework.decorators import api_view, authentication_classes, permission_classes
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from apps.core.utils.cached_token_authentication import CachedTokenAuthentication
+from apps.core.utils.signed_token_authentication import SignedTokenAuthentication
 from apps.core.utils.validate_uuid import validate_uuid
 from apps.core.utils.validator_user_type import validate_user_type
 from apps.core.utils.validate_user_profile import validate_user_profile
-from apps.core.utils.get_model_data import get_model_data
 from apps.core.utils.serializer_validation import serializer_validation
-from apps.core.utils.validate_user_is_creator import validate_user_is_creator
-from apps.core.utils.custom_pagination import CustomPageNumberPagination
-from apps.job_offers.models import JobOffer
-from .serializers import PostulationValidationSerializer, PostulationsResponseSerializer
-from .models import Postulation
+from apps.core.utils.custom_pagination import CustomPageNumberPagination, CustomCursorPagination
+from apps.core.utils.row_serializer import RowSerializer
+from apps.job_offers.models import JobOffer, ArchivedJobOffer
+from .serializers import (
+    PostulationValidationSerializer, PostulationsResponseSerializer, ArchivedPostulationsResponseSerializer,
+    StudentPostulationsResponseSerializer, ArchivedStudentPostulationsResponseSerializer,
+    PostulationFilterSerializer, StudentPostulationFilterSerializer
+)
+from .models import Postulation, ArchivedPostulation
+from .utils.apply_postulation_decisions import ACTION_STATUSES, apply_postulation_decisions
+from .utils.insert_postulation import insert_postulation
+from .utils.delete_postulation import delete_postulation
+from .utils.stream_postulations import stream_postulations
+from .utils.rank_postulations import get_relevance_scores
+from apps.job_offers.utils.load_owned_job_offer import load_owned_job_offer
 from config.settings.base import REST_FRAMEWORK
 
 
+# Tipo de contenido de cada formato de exportación de postulaciones
+EXPORT_CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+# Serializador de filas con la misma representación que PostulationsResponseSerializer
+postulation_row_serializer = RowSerializer(PostulationsResponseSerializer)
+
+# Serializador de filas con la misma representación que ArchivedPostulationsResponseSerializer
+archived_postulation_row_serializer = RowSerializer(ArchivedPostulationsResponseSerializer)
+
+# Serializador de filas con la misma representación que StudentPostulationsResponseSerializer
+student_postulation_row_serializer = RowSerializer(StudentPostulationsResponseSerializer)
+
+# Serializador de filas con la misma representación que ArchivedStudentPostulationsResponseSerializer
+archived_student_postulation_row_serializer = RowSerializer(ArchivedStudentPostulationsResponseSerializer)
+
+
 # Endpoint para la postulación a una oferta de trabajo
 @api_view(['POST'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def postulate_job_offer(request, job_offer_id):
     # Valida que el ID tenga el formato valido
@@ -38,51 +69,52 @@ def postulate_job_offer(request, job_offer_id):
         return validation_response
 
     # Valida que el usuario autenticado tenga un perfil de estudiante asociado
-    validation_response = validate_user_profile(request.user, 'student')
+    validation_response = validate_user_profile(request, 'student')
 
     # Verifica si hay errores en la validacion
     if validation_response:
         # Retorna la respuesta de error
         return validation_response
 
-    # Obtiene los datos de la oferta de trabajo
-    job_offer_data = get_model_data(JobOffer, 'id', job_offer_id)
+    # Obtiene los datos enviados en la peticion
+    postulation_validation_serializer = PostulationValidationSerializer(data=request.data, context={'request': request})
+
+    # Obtiene la validacion del serializer
+    validation_error = serializer_validation(postulation_validation_serializer)
+
+    # Verifica si hay errores en la validacion
+    if validation_error:
+        # Retorna la respuesta de error
+        return validation_error
+
+    # Inserta la postulacion si la oferta de trabajo existe, esta abierta y el estudiante no se ha postulado
+    result = insert_postulation(
+        job_offer_id,
+        request.user.student.id,
+        postulation_validation_serializer.validated_data.get('status', 'pending')
+    )
 
-    # Verifica si se obtuvo una respuesta de error en lugar de los datos
-    if isinstance(job_offer_data, Response):
-        # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
-        return job_offer_data
+    # Respuesta de error si la oferta de trabajo no existe
+    if result == 'not_found':
+        return Response({
+            'status': 'error',
+            'message': 'Data not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
 
-    # Valida que la oferta de trabajo no este cerrada
-    if job_offer_data.is_closed == True:
-        # Respuesta de error al intentar postular a una oferta de trabajo cerrada
+    # Respuesta de error al intentar postular a una oferta de trabajo cerrada
+    if result == 'closed':
         return Response({
             'status': 'error',
             'message': 'The job offer is closed'
         }, status=status.HTTP_400_BAD_REQUEST)
 
-    # Valida que el usuario no haya postulado a la oferta de trabajo
-    if Postulation.objects.filter(job_offer_id=job_offer_id, student=request.user.student).exists():
-        # Respuesta de error al intentar postular a una oferta de trabajo a la que ya se postulo
+    # Respuesta de error al intentar postular a una oferta de trabajo a la que ya se postulo
+    if result == 'duplicate':
         return Response({
             'status': 'error',
             'message': 'You have already applied to this job offer'
         }, status=status.HTTP_400_BAD_REQUEST)
 
-    # Obtiene los datos enviados en la peticion
-    postulation_validation_serializer = PostulationValidationSerializer(data=request.data, context={'request': request, 'job_offer': job_offer_data})
-
-    # Obtiene la validacion del serializer
-    validation_error = serializer_validation(postulation_validation_serializer)
-
-    # Verifica si hay errores en la validacion
-    if validation_error:
-        # Retorna la respuesta de error
-        return validation_error
-
-    # Guarda la postulacion a la oferta de trabajo
-    postulation_validation_serializer.save()
-
     # Respuesta exitosa al crear la postulacion
     return Response({
         'status': 'success',
@@ -92,7 +124,7 @@ def postulate_job_offer(request, job_offer_id):
 
 # Endpoint para retirar la postulación a una oferta de trabajo
 @api_view(['DELETE'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def withdraw_postulation(request, job_offer_id):
     # Valida que el ID tenga el formato valido
@@ -112,40 +144,37 @@ def withdraw_postulation(request, job_offer_id):
         return validation_response
 
     # Valida que el usuario autenticado tenga un perfil de estudiante asociado
-    validation_response = validate_user_profile(request.user, 'student')
+    validation_response = validate_user_profile(request, 'student')
 
     # Verifica si hay errores en la validacion
     if validation_response:
         # Retorna la respuesta de error
         return validation_response
     
-    # Obtiene los datos de la oferta de trabajo
-    job_offer_data = get_model_data(JobOffer, 'id', job_offer_id)
+    # Elimina la postulacion si la oferta de trabajo existe, esta abierta y el estudiante se ha postulado
+    result = delete_postulation(job_offer_id, request.user.student.id)
 
-    # Verifica si se obtuvo una respuesta de error en lugar de los datos
-    if isinstance(job_offer_data, Response):
-        # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
-        return job_offer_data
+    # Respuesta de error si la oferta de trabajo no existe
+    if result == 'not_found':
+        return Response({
+            'status': 'error',
+            'message': 'Data not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
 
-    # Valida que la oferta de trabajo no este cerrada
-    if job_offer_data.is_closed == True:
-        # Respuesta de error al intentar retirar la postulacion a una oferta de trabajo cerrada
+    # Respuesta de error al intentar retirar la postulacion a una oferta de trabajo cerrada
+    if result == 'closed':
         return Response({
             'status': 'error',
             'message': 'The job offer is closed'
         }, status=status.HTTP_400_BAD_REQUEST)
 
-    # Valida que el usuario haya postulado a la oferta de trabajo
-    if not Postulation.objects.filter(job_offer_id=job_offer_id, student=request.user.student).exists():
-        # Respuesta de error al intentar retirar la postulacion a una oferta de trabajo a la que no se ha postulado
+    # Respuesta de error al intentar retirar la postulacion a una oferta de trabajo a la que no se ha postulado
+    if result == 'not_applied':
         return Response({
             'status': 'error',
             'message': 'You have not applied to this job offer'
         }, status=status.HTTP_400_BAD_REQUEST)
 
-    # Elimina la postulacion a la oferta de trabajo
-    Postulation.objects.filter(job_offer_id=job_offer_id, student=request.user.student).delete()
-
     # Respuesta exitosa al retirar la postulacion
     return Response({
         'status': 'success',
@@ -155,75 +184,70 @@ def withdraw_postulation(request, job_offer_id):
 
 # Endpoint para obtener las postulaciones a una oferta de trabajo
 @api_view(['GET'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
-def get_postulations(request, job_offer_id):
-    # Valida que el ID tenga el formato valido
-    validation_response = validate_uuid(job_offer_id)
+@load_owned_job_offer(JobOffer, ArchivedJobOffer)
+def get_postulations(request, job_offer_data):
+    # Obtiene los parámetros de filtro y ordenamiento de la solicitud, ignorando los vacíos
+    postulation_filter_serializer = PostulationFilterSerializer(data={
+        key: value for key, value in request.query_params.items() if value != ''
+    })
 
-    # Verifica si hay errores en la validacion
-    if validation_response:
-        # Retorna la respuesta de error
-        return validation_response
-
-    # - Validar que el usuario autenticado sea de tipo compañia
-
-    # Valida que el usuario autenticado sea de tipo compañia
-    validation_response = validate_user_type(request.user, 'company')
+    # Obtiene la validacion de los parámetros de filtro
+    validation_error = serializer_validation(postulation_filter_serializer)
 
     # Verifica si hay errores en la validacion
-    if validation_response:
-        # Retorna la respuesta de error
-        return validation_response
-
-    # - Validar que el usuario autenticado tenga un perfil de compañia asociado
-
-    # Valida que el usuario autenticado tenga un perfil de compañia asociado
-    validation_response = validate_user_profile(request.user, 'company')
-
-    # Verifica si hay errores en la validacion
-    if validation_response:
+    if validation_error:
         # Retorna la respuesta de error
-        return validation_response
-
-    # - Obtener los datos de la oferta de trabajo
-
-    # Obtiene los datos de la oferta de trabajo
-    job_offer_data = get_model_data(JobOffer, 'id', job_offer_id)
-
-    # Verifica si se obtuvo una respuesta de error en lugar de los datos
-    if isinstance(job_offer_data, Response):
-        # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
-        return job_offer_data
-
-    # - Validar que la oferta de trabajo pertenezca a la compañia del usuario autenticado
-
-    # Valida que la oferta de trabajo pertenezca a la compañia del usuario autenticado
-    validation_response = validate_user_is_creator(job_offer_data.company, request.user)
+        return validation_error
 
-    # Verifica si hay errores en la validacion
-    if validation_response:
-        # Retorna la respuesta de error
-        return validation_response
+    # Usa las tablas de archivo si la oferta de trabajo está archivada
+    if isinstance(job_offer_data, ArchivedJobOffer):
+        postulation_model, row_serializer = ArchivedPostulation, archived_postulation_row_serializer
+    else:
+        postulation_model, row_serializer = Postulation, postulation_row_serializer
 
     # - Obtener las postulaciones a la oferta de trabajo
 
-    # Obtiene las postulaciones a la oferta de trabajo
-    postulations = Postulation.objects.filter(job_offer=job_offer_id).order_by('id')
+    # Obtiene las postulaciones a la oferta de trabajo, filtradas por estado si se solicita
+    filters = postulation_filter_serializer.validated_data
+    postulations = postulation_model.objects.filter(job_offer=job_offer_data.id)
+    if 'status' in filters:
+        postulations = postulations.filter(status=filters['status'])
 
     # - Serializar los datos de las postulaciones
 
-    # Serializa los datos de las postulaciones
-
     # Crea la paginacion de los datos obtenidos
     paginator = CustomPageNumberPagination()
-    paginated_queryset = paginator.paginate_queryset(postulations, request)
 
-    # Serializa los datos de las ofertas de trabajo
-    postulation_response_serializer = PostulationsResponseSerializer(paginated_queryset, many=True)
+    if filters['sort'] == 'relevance':
+        # Ordena los IDs de las postulaciones por la relevancia del perfil del estudiante
+        scores = get_relevance_scores(job_offer_data, postulation_model)
+        postulation_ids = sorted(
+            (str(postulation_id) for postulation_id in postulations.values_list('id', flat=True)),
+            key=lambda postulation_id: (-scores.get(postulation_id, 0), postulation_id)
+        )
+        page_ids = paginator.paginate_queryset(postulation_ids, request)
+
+        # Obtiene solo las filas de la página y conserva el orden por relevancia
+        rows = {str(row['id']): row for row in row_serializer.get_values(postulation_model.objects.filter(id__in=page_ids))}
+        paginated_rows = [rows[postulation_id] for postulation_id in page_ids if postulation_id in rows]
+
+        # Serializa los datos de las postulaciones junto con su relevancia
+        postulations_data = row_serializer.to_representation(paginated_rows)
+        for postulation in postulations_data:
+            postulation['relevance'] = scores.get(postulation['id'], 0)
+    else:
+        # Ordena por fecha de postulación y por ID para que el orden sea estable entre páginas
+        descending = filters['sort'].startswith('-')
+        postulations = postulations.order_by(filters['sort'], '-id' if descending else 'id')
+        paginated_rows = paginator.paginate_queryset(row_serializer.get_values(postulations), request)
+
+        # Serializa los datos de las postulaciones a partir de las filas obtenidas
+        postulations_data = row_serializer.to_representation(paginated_rows)
 
     # Obtiene la respuesta con los datos paginados
-    response_data = paginator.get_paginated_response(postulation_response_serializer.data)
+    response_data = paginator.get_paginated_response(postulations_data)
 
     # Respuesta exitosa al obtener las ofertas de trabajo
     return Response({
@@ -232,6 +256,7 @@ def get_postulations(request, job_offer_id):
         'data': {
             'page_info': {
                 'count': response_data['count'],
+                'count_is_approximate': response_data['count_is_approximate'],
                 'page_size': int(request.query_params.get('page_size', REST_FRAMEWORK['PAGE_SIZE'])),
                 'links': response_data['links']
             },
@@ -240,88 +265,168 @@ def get_postulations(request, job_offer_id):
     }, status=status.HTTP_200_OK)
 
 
-# Endpoint para aceptar o rechazar una postulación a una oferta de trabajo
-@api_view(['POST'])
-@authentication_classes([TokenAuthentication])
+# Endpoint para exportar las postulaciones a una oferta de trabajo
+@api_view(['GET'])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
-def accept_reject_postulation(request, job_offer_id):
-    # Valida que el ID de la oferta de trabajo tenga el formato valido
-    validation_response = validate_uuid(job_offer_id)
+@load_owned_job_offer()
+def export_postulations(request, job_offer_data):
+    # Valida que el formato de la exportación sea valido
+    export_format = request.query_params.get('export_format', 'csv')
+    if export_format not in EXPORT_CONTENT_TYPES:
+        return Response({
+            'status': 'error',
+            'message': 'Invalid export format. Format must be "csv" or "ndjson".'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    # Obtiene las postulaciones a la oferta de trabajo junto con los datos del estudiante
+    postulations = Postulation.objects.filter(job_offer=job_offer_data).order_by('applied_at', 'id')
+
+    # Respuesta que envía la exportación a medida que se generan las líneas
+    response = StreamingHttpResponse(
+        stream_postulations(postulations, export_format),
+        content_type=EXPORT_CONTENT_TYPES[export_format]
+    )
+    response['Content-Disposition'] = f'attachment; filename="postulations-{job_offer_data.id}.{export_format}"'
+    return response
+
+
+# Endpoint para obtener las postulaciones del estudiante autenticado
+@api_view(['GET'])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
+@permission_classes([IsAuthenticated])
+def get_my_postulations(request):
+    # Valida que el usuario autenticado sea de tipo estudiante
+    validation_response = validate_user_type(request.user, 'student')
 
     # Verifica si hay errores en la validacion
     if validation_response:
         # Retorna la respuesta de error
         return validation_response
 
-    # Valida que el usuario autenticado sea de tipo compañia
-    validation_response = validate_user_type(request.user, 'company')
+    # Valida que el usuario autenticado tenga un perfil de estudiante asociado
+    validation_response = validate_user_profile(request, 'student')
 
     # Verifica si hay errores en la validacion
     if validation_response:
         # Retorna la respuesta de error
         return validation_response
 
-    # Valida que el usuario autenticado tenga un perfil de compañia asociado
-    validation_response = validate_user_profile(request.user, 'company')
+    # Obtiene los parámetros de la solicitud, ignorando los vacíos
+    student_postulation_filter_serializer = StudentPostulationFilterSerializer(data={
+        key: value for key, value in request.query_params.items() if value != ''
+    })
+
+    # Obtiene la validacion de los parámetros
+    validation_error = serializer_validation(student_postulation_filter_serializer)
 
     # Verifica si hay errores en la validacion
-    if validation_response:
+    if validation_error:
         # Retorna la respuesta de error
-        return validation_response
+        return validation_error
 
-    # Obtiene los datos de la oferta de trabajo
-    job_offer_data = get_model_data(JobOffer, 'id', job_offer_id)
+    # Usa las tablas de archivo si se solicitan las postulaciones a ofertas de trabajo archivadas
+    if student_postulation_filter_serializer.validated_data['archived']:
+        postulation_model, row_serializer = ArchivedPostulation, archived_student_postulation_row_serializer
+    else:
+        postulation_model, row_serializer = Postulation, student_postulation_row_serializer
 
-    # Verifica si se obtuvo una respuesta de error en lugar de los datos
-    if isinstance(job_offer_data, Response):
-        # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
-        return job_offer_data
+    # Obtiene las postulaciones del estudiante
+    postulations = postulation_model.objects.filter(student=request.user.student)
 
-    # Valida que la oferta de trabajo pertenezca a la compañia del usuario autenticado
-    validation_response = validate_user_is_creator(job_offer_data.company, request.user)
+    # Pagina por cursor sobre la fecha de postulación, la más reciente primero
+    paginator = CustomCursorPagination(ordering=('-applied_at', '-id'))
+    paginated_rows = paginator.paginate_queryset(row_serializer.get_values(postulations), request)
 
-    # Verifica si hay errores en la validacion
-    if validation_response:
-        # Retorna la respuesta de error
-        return validation_response
+    # Serializa las postulaciones junto con su oferta de trabajo y compañia
+    postulations_data = row_serializer.to_representation(paginated_rows)
 
+    # Obtiene la respuesta con los datos paginados
+    response_data = paginator.get_paginated_response(postulations_data)
+
+    # Respuesta exitosa al obtener las postulaciones del estudiante
+    return Response({
+        'status': 'success',
+        'message': 'The postulations were successfully obtained.',
+        'data': {
+            'page_info': {
+                'count': response_data['count'],
+                'page_size': response_data['page_size'],
+                'links': response_data['links'],
+                'cursors': response_data['cursors']
+            },
+            'postulations': response_data['results']
+        }
+    }, status=status.HTTP_200_OK)
+
+
+# Endpoint para aceptar o rechazar una postulación a una oferta de trabajo
+@api_view(['POST'])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
+@permission_classes([IsAuthenticated])
+@load_owned_job_offer()
+def accept_reject_postulation(request, job_offer_data):
     # Obtiene la lista de postulaciones de la solicitud
     postulations = request.data
 
-    # Itera sobre cada postulación en la lista
+    # Valida que la solicitud sea una lista de postulaciones
+    if not isinstance(postulations, list) or not postulations:
+        return Response({
+            'status': 'error',
+            'message': 'The request body must be a non-empty list of postulations.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    # Valida todas las postulaciones antes de aplicar cualquier decisión
+    decisions = {}
     for postulation in postulations:
+        # Valida que cada elemento sea un objeto
+        if not isinstance(postulation, dict):
+            return Response({
+                'status': 'error',
+                'message': 'Each postulation must be an object with "id" and "status".'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
         # Valida que el ID de la postulación tenga el formato valido
-        validation_response = validate_uuid(postulation.get('id'))
+        validation_response = validate_uuid(str(postulation.get('id')))
 
         # Verifica si hay errores en la validacion
         if validation_response:
             # Retorna la respuesta de error
             return validation_response
 
-        # Obtiene los datos de la postulación
-        postulation_data = get_model_data(Postulation, 'id', postulation.get('id'))
-
-        # Verifica si se obtuvo una respuesta de error en lugar de los datos
-        if isinstance(postulation_data, Response):
-            # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
-            return postulation_data
-
         # Obtiene la acción (aceptar o rechazar) de la solicitud
         action = postulation.get('status')
 
         # Verifica que la acción sea válida
-        if action not in ['accept', 'reject']:
+        if action not in ACTION_STATUSES:
             return Response({
                 'status': 'error',
                 'message': 'Invalid action. Action must be "accept" or "reject".'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # Actualiza el estado de la postulación
-        postulation_data.status = 'accepted' if action == 'accept' else 'rejected'
-        postulation_data.save()
+        # La última decisión sobre una misma postulación es la que se aplica
+        decisions[str(uuid.UUID(str(postulation.get('id'))))] = action
+
+    # Aplica las decisiones en una sola transacción
+    results = apply_postulation_decisions(job_offer_data.id, decisions)
+    updated = sum(1 for result in results if result['result'] == 'updated')
+
+    # Respuesta de error si ninguna postulación pertenece a la oferta de trabajo
+    if not updated:
+        return Response({
+            'status': 'error',
+            'message': 'No postulations found for this job offer.',
+            'data': {
+                'results': results
+            }
+        }, status=status.HTTP_404_NOT_FOUND)
 
     # Respuesta exitosa al aceptar o rechazar las postulaciones
     return Response({
         'status': 'success',
-        'message': 'Postulations status successfully applied.'
+        'message': 'Postulations status successfully applied.',
+        'data': {
+            'updated': updated,
+            'results': results
+        }
     }, status=status.HTTP_200_OK)
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.users'
+
+
+    def ready(self):
+        """
+        Conecta las señales de la aplicación.
+        """
+        from . import signals
@@ -1,5 +1,9 @@
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from apps.core.utils.normalize_text import normalize_text
 
 
 # Define el modelo de usuario
@@ -13,6 +17,7 @@ class CustomUser(AbstractUser):
     user_type = models.CharField(max_length=255, choices=USER_CHOICES)
     failed_login_attempts = models.IntegerField(default=0)
     last_failed_login = models.DateTimeField(null=True, blank=True)
+    token_version = models.PositiveIntegerField(default=0)
 
 
 # Define el modelo de estudiante
@@ -25,6 +30,7 @@ class Student(models.Model):
     cv = models.URLField(max_length=500, null=True, blank=True)
     about_me = models.TextField()
     user = models.OneToOneField(CustomUser, on_delete=models.CASCADE)
+    updated_at = models.DateTimeField(auto_now=True, null=True)
 
 
 # Define el modelo de compañia
@@ -33,4 +39,17 @@ class Company(models.Model):
     industry = models.CharField(max_length=255)
     location = models.CharField(max_length=255)
     description = models.TextField()
-    user = models.OneToOneField(CustomUser, on_delete=models.CASCADE)
\ No newline at end of file
+    user = models.OneToOneField(CustomUser, on_delete=models.CASCADE)
+    updated_at = models.DateTimeField(auto_now=True, null=True)
+    search_vector = models.GeneratedField(
+        expression=SearchVector('name', weight='A', config=settings.SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True
+    )
+
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='company_search_vector_idx'),
+            GinIndex(OpClass(normalize_text('name'), name='gin_trgm_ops'), name='company_name_trgm_idx'),
+        ]
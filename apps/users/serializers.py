@@ -160,11 +160,11 @@ class CompanyValidationSerializer(serializers.ModelSerializer):
 
         Attributes:
             model (Company): Modelo de la comapañia.
-            fields (list): Campos del serializador.
+            exclude (list): Campos excluidos del serializador.
             read_only_fields (list): Campos de solo lectura.
         """
         model = Company
-        fields = '__all__'
+        exclude = ['search_vector']
         read_only_fields = ['user']
 
 
@@ -193,7 +193,7 @@ class CompanyResponseSerializer(serializers.ModelSerializer):
 
         Attributes:
             model (Company): Modelo de la compañia.
-            fields (list): Campos del serializador.
+            exclude (list): Campos excluidos del serializador.
         """
         model = Company
-        fields = '__all__'
+        exclude = ['search_vector']
@@ -0,0 +1,55 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from apps.core.utils.cached_token_authentication import invalidate_cached_token
+from apps.core.utils.signed_token_authentication import invalidate_token_state
+from .models import CustomUser
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """
+    Elimina de la caché un token al eliminarlo, lo que ocurre al cerrar
+    sesión, al actualizar los datos del usuario y al eliminar el usuario.
+
+    Args:
+        sender (Model): Modelo que envía la señal.
+        instance (Token): Token eliminado.
+        **kwargs (dict): Argumentos adicionales de la señal.
+    """
+    invalidate_cached_token(instance.key)
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_user_token(sender, instance, created, **kwargs):
+    """
+    Elimina de la caché el token de un usuario al modificarlo, ya que la
+    caché guarda el token junto con los datos del usuario, y el estado de
+    sus tokens firmados, que incluye si está activo.
+
+    Args:
+        sender (Model): Modelo que envía la señal.
+        instance (CustomUser): Usuario modificado.
+        created (bool): Indica si el usuario se acaba de crear.
+        **kwargs (dict): Argumentos adicionales de la señal.
+    """
+    # Un usuario recién creado no tiene token
+    if created:
+        return
+    invalidate_token_state(instance.id)
+    for key in Token.objects.filter(user=instance).values_list('key', flat=True):
+        invalidate_cached_token(key)
+
+
+@receiver(post_delete, sender=CustomUser)
+def invalidate_deleted_user_token_state(sender, instance, **kwargs):
+    """
+    Elimina de la caché el estado de los tokens firmados de un usuario al
+    eliminarlo, para que sus tokens se rechacen de inmediato.
+
+    Args:
+        sender (Model): Modelo que envía la señal.
+        instance (CustomUser): Usuario eliminado.
+        **kwargs (dict): Argumentos adicionales de la señal.
+    """
+    invalidate_token_state(instance.id)
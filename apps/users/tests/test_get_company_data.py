@@ -49,6 +49,40 @@ class GetCompanyDataTestCase(TestCase):
         self.assertTrue('data' in response.data)
 
 
+    def test_get_company_data_not_modified(self):
+        """
+        Prueba de obtención de datos de la compañia sin modificaciones.
+
+        Verifica que el endpoint responda con un código de estado
+        304 cuando el cliente envía el ETag o la fecha de modificación
+        de la versión actual de los datos de la compañia.
+        """
+        response = self.client.get(self.url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        not_modified_response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified_response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        not_modified_response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(not_modified_response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+    def test_get_company_data_modified_after_update(self):
+        """
+        Prueba de obtención de datos de la compañia modificados.
+
+        Verifica que el endpoint responda con un código de estado
+        200 y un ETag distinto cuando los datos de la compañia cambian
+        después de que el cliente obtuvo su versión.
+        """
+        etag = self.client.get(self.url, format='json')['ETag']
+        self.company_data.description = 'Updated Value'
+        self.company_data.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+
     def test_get_company_data_non_company_user(self):
         """
         Prueba de obtención de datos de la compañia con un usuario no estudiante.
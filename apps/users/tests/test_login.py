@@ -1,6 +1,9 @@
 from rest_framework.test import APIClient
 from rest_framework import status
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from apps.users.models import CustomUser
 from django.utils import timezone
@@ -91,6 +94,44 @@ class LoginTestCase(TestCase):
         self.assertTrue('message' in response.data)
 
 
+    def test_login_locks_after_failed_attempts(self):
+        """
+        Prueba del bloqueo de la cuenta por intentos fallidos.
+
+        Verifica que los intentos fallidos previos al bloqueo no escriban
+        en el usuario y que la cuenta se bloquee al alcanzar el máximo,
+        aunque la contraseña enviada después sea correcta.
+        """
+        wrong_data = {**self.data, 'password': 'WrongPassword'}
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(2):
+                response = self.client.post(self.url, wrong_data, format='json')
+                self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertFalse([query for query in queries.captured_queries if query['sql'].startswith('UPDATE')])
+
+        response = self.client.post(self.url, wrong_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.post(self.url, self.data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.failed_login_attempts, 3)
+
+
+    def test_login_lock_survives_cache_loss(self):
+        """
+        Prueba del respaldo del bloqueo en la base de datos.
+
+        Verifica que la cuenta siga bloqueada aunque se pierda el contador
+        de intentos fallidos de la caché.
+        """
+        wrong_data = {**self.data, 'password': 'WrongPassword'}
+        for _ in range(3):
+            self.client.post(self.url, wrong_data, format='json')
+        cache.clear()
+        response = self.client.post(self.url, self.data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
     def test_login_reset_failed_attempts(self):
         """
         Prueba de restablecimiento de intentos fallidos.
@@ -104,3 +145,19 @@ class LoginTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.user.refresh_from_db()
         self.assertEqual(self.user.failed_login_attempts, 0)
+
+
+    def test_login_without_failed_attempts_skips_user_write(self):
+        """
+        Prueba del inicio de sesión sin intentos fallidos.
+
+        Verifica que un inicio de sesión exitoso no escriba en el usuario
+        si no tiene intentos fallidos que restablecer.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, self.data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse([
+            query for query in queries.captured_queries
+            if query['sql'].startswith(f'UPDATE "{CustomUser._meta.db_table}"')
+        ])
@@ -0,0 +1,90 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+
+def get_failed_login_cache_key(user_id):
+    """
+    Obtiene la llave de la caché del contador de intentos fallidos de un usuario.
+
+    Args:
+        user_id (int): ID del usuario.
+
+    Returns:
+        str: Llave de la caché.
+    """
+    return f'auth:failed_logins:{user_id}'
+
+
+def is_login_locked(user):
+    """
+    Verifica si la cuenta del usuario está bloqueada por exceso de intentos fallidos.
+
+    El contador se consulta en la caché compartida. Los campos del usuario
+    se usan como respaldo, ya que solo se escriben cuando la cuenta se
+    bloquea y conservan el bloqueo si la caché se pierde.
+
+    Args:
+        user (CustomUser): Usuario que intenta iniciar sesión.
+
+    Returns:
+        bool: True si la cuenta está bloqueada.
+    """
+    if cache.get(get_failed_login_cache_key(user.id), 0) >= settings.LOGIN_MAX_FAILED_ATTEMPTS:
+        return True
+    return bool(
+        user.failed_login_attempts >= settings.LOGIN_MAX_FAILED_ATTEMPTS
+        and user.last_failed_login
+        and timezone.now() < user.last_failed_login + timedelta(seconds=settings.LOGIN_LOCKOUT_TIMEOUT)
+    )
+
+
+def register_failed_login(user):
+    """
+    Incrementa de forma atómica el contador de intentos fallidos del usuario.
+
+    El contador expira `LOGIN_LOCKOUT_TIMEOUT` segundos después del primer
+    intento fallido. Al alcanzar el máximo de intentos, se extiende su
+    expiración y se escriben en el usuario solo los campos del bloqueo.
+
+    Args:
+        user (CustomUser): Usuario que intentó iniciar sesión.
+
+    Returns:
+        int: Cantidad de intentos fallidos.
+    """
+    cache_key = get_failed_login_cache_key(user.id)
+    cache.add(cache_key, 0, settings.LOGIN_LOCKOUT_TIMEOUT)
+    try:
+        failed_attempts = cache.incr(cache_key)
+    except ValueError:
+        # El contador expiró entre su creación y el incremento
+        failed_attempts = 1
+        cache.set(cache_key, failed_attempts, settings.LOGIN_LOCKOUT_TIMEOUT)
+
+    # Bloquea la cuenta desde el último intento fallido
+    if failed_attempts >= settings.LOGIN_MAX_FAILED_ATTEMPTS:
+        cache.touch(cache_key, settings.LOGIN_LOCKOUT_TIMEOUT)
+        user.failed_login_attempts = failed_attempts
+        user.last_failed_login = timezone.now()
+        user.save(update_fields=['failed_login_attempts', 'last_failed_login'])
+    return failed_attempts
+
+
+def reset_failed_logins(user):
+    """
+    Restablece los intentos fallidos del usuario tras un inicio de sesión exitoso.
+
+    El usuario solo se escribe si tenía intentos fallidos guardados.
+
+    Args:
+        user (CustomUser): Usuario que inició sesión.
+
+    Returns:
+        None
+    """
+    cache.delete(get_failed_login_cache_key(user.id))
+    if user.failed_login_attempts:
+        user.failed_login_attempts = 0
+        user.save(update_fields=['failed_login_attempts'])
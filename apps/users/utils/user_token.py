@@ -0,0 +1,52 @@
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from apps.core.utils.cached_token_authentication import get_token_expiration
+from apps.core.utils.signed_token_authentication import sign_user_token, revoke_signed_tokens
+
+
+def issue_user_token(user):
+    """
+    Emite el token de un usuario según el modo de autenticación configurado
+    en `AUTH_TOKEN_MODE`.
+
+    En el modo 'database' se reutiliza el token del usuario, reemplazándolo
+    si ya expiró. En el modo 'signed' se emite un token firmado.
+
+    Args:
+        user (CustomUser): Usuario autenticado.
+
+    Returns:
+        tuple: Llave del token y fecha de expiración.
+    """
+    if settings.AUTH_TOKEN_MODE == 'signed':
+        return sign_user_token(user), timezone.now() + timedelta(seconds=settings.TOKEN_EXPIRATION)
+
+    # Crea o actualiza el token del usuario
+    token, created = Token.objects.get_or_create(user=user)
+
+    # Reemplaza el token si ya expiró
+    if timezone.now() >= get_token_expiration(token):
+        token.delete()
+        token = Token.objects.create(user=user)
+    return token.key, get_token_expiration(token)
+
+
+def revoke_user_token(request):
+    """
+    Revoca el token con el que se autenticó la petición.
+
+    Los tokens de la base de datos se eliminan y los tokens firmados se
+    revocan incrementando la versión de revocación del usuario.
+
+    Args:
+        request (Request): Petición autenticada.
+
+    Returns:
+        None
+    """
+    if isinstance(request.auth, Token):
+        request.auth.delete()
+    else:
+        revoke_signed_tokens(request.user.id)
@@ -1,21 +1,23 @@
 from rest_framework.decorators import api_view, authentication_classes, permission_classes
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.authtoken.models import Token
 from django.utils import timezone
+from apps.core.utils.cached_token_authentication import CachedTokenAuthentication
+from apps.core.utils.signed_token_authentication import SignedTokenAuthentication
 from apps.core.utils.serializer_validation import serializer_validation
 from apps.core.utils.validate_user_is_creator import validate_user_is_creator
 from apps.core.utils.validator_user_type import validate_user_type
-from apps.core.utils.get_model_data import get_model_data
+from apps.core.utils.get_principal import get_principal_profile
+from apps.core.utils.conditional_response import build_etag, conditional_response, set_conditional_headers
 from .serializers import (UserValidationSerializer, UserResponseSerializer,
                           StudentValidationSerializer, StudentResponseSerializer,
                           CompanyValidationSerializer, CompanyResponseSerializer)
 from .models import CustomUser, Student, Company
 from .utils.validator_existing_data import validate_existing_data
 from .utils.upload_file_cloudinary import upload_cv_to_cloudinary
-from datetime import timedelta
+from .utils.user_token import issue_user_token, revoke_user_token
+from .utils.login_lockout import is_login_locked, register_failed_login, reset_failed_logins
 
 
 # Endpoint para el registro de usuario
@@ -65,7 +67,7 @@ def login(request):
         }, status=status.HTTP_401_UNAUTHORIZED)
     
     # Verifica si la cuenta está bloqueada
-    if user.failed_login_attempts >= 3 and user.last_failed_login and timezone.now() < user.last_failed_login + timedelta(minutes=15):
+    if is_login_locked(user):
         # Retorna un mensaje de error por cuenta bloqueada
         return Response({
             'status': 'errors',
@@ -75,9 +77,7 @@ def login(request):
     # Verifica la contraseña del usuario
     if not user.check_password(password):
         # Incrementa el contador de intentos fallidos
-        user.failed_login_attempts += 1
-        user.last_failed_login = timezone.now()
-        user.save()
+        register_failed_login(user)
 
         # Retorna un mensaje de error por contraseña incorrecta
         return Response({
@@ -91,14 +91,10 @@ def login(request):
         }, status=status.HTTP_401_UNAUTHORIZED)
 
     # Restablece el contador de intentos fallidos en caso de éxito
-    user.failed_login_attempts = 0
-    user.save()
-
-    # Crea o actualiza el token del usuario
-    token, created = Token.objects.get_or_create(user=user)
+    reset_failed_logins(user)
 
-    # Configura el tiempo de expiración del token
-    token_expiration = timezone.now() + timedelta(days=3)
+    # Emite el token del usuario según el modo de autenticación
+    token_key, token_expiration = issue_user_token(user)
 
     # Serializa los datos del usuario
     user_response_serializer = UserResponseSerializer(user)
@@ -109,7 +105,7 @@ def login(request):
         'message': 'User logged in successfully.',
         'data': {
             'token': {
-                'token_key': token.key,
+                'token_key': token_key,
                 'token_expiration': token_expiration.isoformat()
             },
             'user': user_response_serializer.data
@@ -119,7 +115,7 @@ def login(request):
 
 # Endpoint para el cierre de sesión de usuario
 @api_view(['POST'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def logout(request):
     # Obtener el usuario actual
@@ -128,8 +124,8 @@ def logout(request):
     # Actualizar los campos
     user.last_login = timezone.now()
     
-    # Eliminar el token del usuario
-    user.auth_token.delete()
+    # Revocar el token del usuario
+    revoke_user_token(request)
     
     # Guardar el usuario
     user.save()
@@ -143,11 +139,16 @@ def logout(request):
 
 # Endpoint para actualizar los datos del usuario
 @api_view(['PUT'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def update_user(request):
+    # Carga todos los campos del usuario autenticado con un token firmado
+    user = request.user
+    if user.get_deferred_fields():
+        user = CustomUser.objects.get(id=user.id)
+
     # Obtiene los datos enviados en la petición
-    user_validation_serializer = UserValidationSerializer(request.user, data=request.data, partial=True)
+    user_validation_serializer = UserValidationSerializer(user, data=request.data, partial=True)
 
     # Obtiene la validación del serializer
     validation_error = serializer_validation(user_validation_serializer)
@@ -160,17 +161,14 @@ def update_user(request):
     # Guarda los datos actualizados del usuario
     user_validation_serializer.save()
 
-    # Elimina el token del usuario autenticado
-    request.user.auth_token.delete()
-    
-    # Crea o actualiza el token del usuario
-    token, created = Token.objects.get_or_create(user=request.user)
+    # Revoca el token del usuario autenticado
+    revoke_user_token(request)
 
-    # Configura el tiempo de expiración del token
-    token_expiration = timezone.now() + timedelta(days=3)
+    # Emite un nuevo token del usuario
+    token_key, token_expiration = issue_user_token(user)
 
     # Serializa los datos del usuario
-    user_response_serializer = UserResponseSerializer(request.user)
+    user_response_serializer = UserResponseSerializer(user)
 
     # Respuesta de éxito en la actualización de datos del usuario
     return Response({
@@ -178,7 +176,7 @@ def update_user(request):
         'message': 'User data updated successfully.',
         'data': {
             'token': {
-                'token_key': token.key,
+                'token_key': token_key,
                 'token_expiration': token_expiration.isoformat()
             },
             'user': user_response_serializer.data
@@ -188,11 +186,11 @@ def update_user(request):
 
 # Endpoint para eliminar el usuario
 @api_view(['DELETE'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def delete_user(request):
-    # Elimina el token del usuario autenticado
-    request.user.auth_token.delete()
+    # Revoca el token del usuario autenticado
+    revoke_user_token(request)
 
     # Elimina el usuario autenticado
     request.user.delete()
@@ -206,7 +204,7 @@ def delete_user(request):
 
 # Endpoint para agregar los datos del estudiante
 @api_view(['POST'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def add_student_data(request):
     # Valida que el usuario autenticado sea de tipo estudiante
@@ -266,7 +264,7 @@ def add_student_data(request):
 
 # Endpoint para obtener los datos del estudiante
 @api_view(['GET'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def get_student_data(request):
     # Valida que el usuario autenticado sea de tipo estudiante
@@ -277,13 +275,16 @@ def get_student_data(request):
         # Retorna la respuesta de error
         return validation_response
     
-    # Obtener los datos del estudiante
-    student_data = get_model_data(Student, 'user', request.user)
+    # Obtener los datos del estudiante cargados con el usuario autenticado
+    student_data = get_principal_profile(request, 'student')
 
-    # Verificar si se obtuvo una respuesta de error en lugar de los datos
-    if isinstance(student_data, Response):
-        # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
-        return student_data
+    # Verificar si el usuario no tiene los datos creados
+    if student_data is None:
+        # Retorna una respuesta de error si no se encuentran los datos
+        return Response({
+            'status': 'error',
+            'message': 'Data not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
 
     # Valida que el usuario sea el creador
     validation_response = validate_user_is_creator(student_data, request.user)
@@ -293,22 +294,30 @@ def get_student_data(request):
         # Retorna la respuesta de error
         return validation_response
     
+    # Obtiene la versión de los datos a partir de su fecha de modificación
+    etag, last_modified = build_etag(student_data.pk, student_data.updated_at), student_data.updated_at
+
+    # Responde sin contenido si el cliente tiene la versión actual
+    not_modified_response = conditional_response(request, etag, last_modified)
+    if not_modified_response:
+        return not_modified_response
+
     # Serializa los datos de respuesta
     student_response_serializer = StudentResponseSerializer(student_data)
 
     # Retorna un mensaje de exito al obtener los datos del estudiante
-    return Response({
+    return set_conditional_headers(Response({
         'status': 'success',
         'message': 'Student data was successfully obtained.',
         'data': {
             'student': student_response_serializer.data
         }
-    }, status=status.HTTP_200_OK)
+    }, status=status.HTTP_200_OK), etag, last_modified)
 
 
 # Endpoint para actualizar los datos del estudiante
 @api_view(['PUT'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def update_student_data(request):
     # Valida que el usuario autenticado sea de tipo estudiante
@@ -319,13 +328,16 @@ def update_student_data(request):
         # Retorna la respuesta de error
         return validation_response
 
-    # Obtener los datos del estudiante
-    student_data = get_model_data(Student, 'user', request.user)
+    # Obtener los datos del estudiante cargados con el usuario autenticado
+    student_data = get_principal_profile(request, 'student')
 
-    # Verificar si se obtuvo una respuesta de error en lugar de los datos
-    if isinstance(student_data, Response):
-        # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
-        return student_data
+    # Verificar si el usuario no tiene los datos creados
+    if student_data is None:
+        # Retorna una respuesta de error si no se encuentran los datos
+        return Response({
+            'status': 'error',
+            'message': 'Data not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
 
     # Valida que el usuario sea el creador
     validation_response = validate_user_is_creator(student_data, request.user)
@@ -376,7 +388,7 @@ def update_student_data(request):
 
 # Endpoint para agregar los datos de la compañia
 @api_view(['POST'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def add_company_data(request):
     # Valida que el usuario autenticado sea de tipo compañia
@@ -418,7 +430,7 @@ def add_company_data(request):
 
 # Endpoint para obtener los datos de la compañia
 @api_view(['GET'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def get_company_data(request):
     # Valida que el usuario autenticado sea de tipo compañia
@@ -429,13 +441,16 @@ def get_company_data(request):
         # Retorna la respuesta de error
         return validation_response
 
-    # Obtener los datos de la compañia
-    company_data = get_model_data(Company, 'user', request.user)
+    # Obtener los datos de la compañia cargados con el usuario autenticado
+    company_data = get_principal_profile(request, 'company')
 
-    # Verificar si se obtuvo una respuesta de error en lugar de los datos
-    if isinstance(company_data, Response):
-        # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
-        return company_data
+    # Verificar si el usuario no tiene los datos creados
+    if company_data is None:
+        # Retorna una respuesta de error si no se encuentran los datos
+        return Response({
+            'status': 'error',
+            'message': 'Data not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
 
     # Valida que el usuario sea el creador
     validation_response = validate_user_is_creator(company_data, request.user)
@@ -445,22 +460,30 @@ def get_company_data(request):
         # Retorna la respuesta de error
         return validation_response
     
+    # Obtiene la versión de los datos a partir de su fecha de modificación
+    etag, last_modified = build_etag(company_data.pk, company_data.updated_at), company_data.updated_at
+
+    # Responde sin contenido si el cliente tiene la versión actual
+    not_modified_response = conditional_response(request, etag, last_modified)
+    if not_modified_response:
+        return not_modified_response
+
     # Serializa los datos de respuesta
     company_response_serializer = CompanyResponseSerializer(company_data)
 
     # Retorna un mensaje de exito al obtener los datos de la compañia
-    return Response({
+    return set_conditional_headers(Response({
         'status': 'success',
         'message': 'Company data was successfully obtained.',
         'data': {
             'company': company_response_serializer.data
         }
-    }, status=status.HTTP_200_OK)
+    }, status=status.HTTP_200_OK), etag, last_modified)
 
 
 # Endpoint para actualizar los datos de la compañia
 @api_view(['PUT'])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([SignedTokenAuthentication, CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def update_company_data(request):
     # Valida que el usuario autenticado sea de tipo compañia
@@ -471,13 +494,16 @@ def update_company_data(request):
         # Retorna la respuesta de error
         return validation_response
 
-    # Obtener los datos de la compañia
-    company_data = get_model_data(Company, 'user', request.user)
+    # Obtener los datos de la compañia cargados con el usuario autenticado
+    company_data = get_principal_profile(request, 'company')
 
-    # Verificar si se obtuvo una respuesta de error en lugar de los datos
-    if isinstance(company_data, Response):
-        # Si se obtuvo una respuesta de error, retornar directamente esa respuesta
-        return company_data
+    # Verificar si el usuario no tiene los datos creados
+    if company_data is None:
+        # Retorna una respuesta de error si no se encuentran los datos
+        return Response({
+            'status': 'error',
+            'message': 'Data not found.'
+        }, status=status.HTTP_404_NOT_FOUND)
 
     # Valida que el usuario sea el creador
     validation_response = validate_user_is_creator(company_data, request.user)
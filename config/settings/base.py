@@ -23,6 +23,7 @@ cloudinary.config(
 # Application definition
 BASE_APPS = [
     'django.contrib.auth',
+    'django.contrib.postgres',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
@@ -83,12 +84,58 @@ TEMPLATES = [
 WSGI_APPLICATION = 'config.wsgi.application'
 
 
+# Configuración de la caché, por defecto en memoria local del proceso
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', ''),
+    }
+}
+
+# Tiempo en segundos que se mantiene en caché el detalle de una oferta de trabajo
+JOB_OFFER_CACHE_TIMEOUT = int(os.environ.get('JOB_OFFER_CACHE_TIMEOUT', 300))
+
+# Tiempo en segundos que se mantienen en caché las páginas del listado de ofertas de trabajo
+JOB_OFFERS_LIST_CACHE_TIMEOUT = int(os.environ.get('JOB_OFFERS_LIST_CACHE_TIMEOUT', 300))
+
+# Tiempo en segundos que se mantiene en caché la relevancia de las postulaciones a una oferta de trabajo
+POSTULATION_RELEVANCE_CACHE_TIMEOUT = int(os.environ.get('POSTULATION_RELEVANCE_CACHE_TIMEOUT', 3600))
+
+# Días que una oferta de trabajo permanece cerrada antes de moverse a las tablas de archivo
+JOB_OFFER_ARCHIVE_AFTER_DAYS = int(os.environ.get('JOB_OFFER_ARCHIVE_AFTER_DAYS', 180))
+
+
+# Intentos fallidos de inicio de sesión tras los que se bloquea la cuenta
+LOGIN_MAX_FAILED_ATTEMPTS = int(os.environ.get('LOGIN_MAX_FAILED_ATTEMPTS', 3))
+
+# Tiempo en segundos que se cuentan los intentos fallidos y que dura el bloqueo de la cuenta (15 minutos por defecto)
+LOGIN_LOCKOUT_TIMEOUT = int(os.environ.get('LOGIN_LOCKOUT_TIMEOUT', 15 * 60))
+
+# Modo de autenticación de los tokens emitidos al iniciar sesión: 'database' o 'signed'
+AUTH_TOKEN_MODE = os.environ.get('AUTH_TOKEN_MODE', 'database')
+
+# Tiempo en segundos tras la creación de un token en que deja de ser válido (3 días por defecto)
+TOKEN_EXPIRATION = int(os.environ.get('TOKEN_EXPIRATION', 3 * 24 * 60 * 60))
+
+# Tiempo en segundos que se mantiene un token en la caché compartida, sin superar su expiración
+TOKEN_CACHE_TIMEOUT = int(os.environ.get('TOKEN_CACHE_TIMEOUT', 300))
+
+# Tiempo en segundos y cantidad máxima de tokens que se mantienen en la caché de cada proceso
+TOKEN_LOCAL_CACHE_TIMEOUT = int(os.environ.get('TOKEN_LOCAL_CACHE_TIMEOUT', 5))
+TOKEN_LOCAL_CACHE_SIZE = int(os.environ.get('TOKEN_LOCAL_CACHE_SIZE', 1024))
+
+
 # Configuración de rest framework para manejar paginacion
 REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'apps.core.utils.custom_pagination.CustomPageNumberPagination',
     'PAGE_SIZE': 10,
 }
 
+# Cantidad máxima de registros que se cuentan con exactitud en la paginación por número de página
+PAGINATION_COUNT_CAP = int(os.environ.get('PAGINATION_COUNT_CAP', 1000))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -111,6 +158,20 @@ AUTH_PASSWORD_VALIDATORS = [
 AUTH_USER_MODEL = 'users.CustomUser'
 
 
+# Configuración de la búsqueda de texto completo de PostgreSQL
+# https://www.postgresql.org/docs/current/textsearch-configuration.html
+
+SEARCH_CONFIG = os.environ.get('SEARCH_CONFIG', 'english')
+
+
+# Manejadores de los eventos de la tabla outbox por tipo de evento, como rutas de importación
+# Los eventos se despachan con el comando process_outbox
+OUTBOX_EVENT_HANDLERS = {}
+
+# Cantidad de intentos fallidos tras los cuales un evento de la tabla outbox deja de despacharse
+OUTBOX_MAX_ATTEMPTS = int(os.environ.get('OUTBOX_MAX_ATTEMPTS', 5))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
 
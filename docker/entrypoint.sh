@@ -5,7 +5,9 @@ python manage.py wait_for_db --settings=config.settings.production
 
 echo 'Applying migrations...'
 python manage.py makemigrations --settings=config.settings.production
+python manage.py deduplicate_postulations --settings=config.settings.production
 python manage.py migrate --settings=config.settings.production
+python manage.py reconcile_postulation_counters --settings=config.settings.production
 
 echo 'Creating staticfiles...'
 python manage.py collectstatic --no-input --settings=config.settings.production